@@ -0,0 +1,29 @@
+"""add task pagination indexes
+
+Revision ID: 3b8e1f0c2a71
+Revises: cf49f79dcf43
+Create Date: 2026-10-18 10:12:41.302118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e1f0c2a71'
+down_revision: Union[str, Sequence[str], None] = 'cf49f79dcf43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_task_title_uuid', 'task', ['title', 'uuid'])
+    op.create_index('ix_task_status_uuid', 'task', ['status', 'uuid'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_status_uuid', table_name='task')
+    op.drop_index('ix_task_title_uuid', table_name='task')
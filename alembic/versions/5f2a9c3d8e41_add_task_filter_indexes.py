@@ -0,0 +1,43 @@
+"""add task filter indexes
+
+Revision ID: 5f2a9c3d8e41
+Revises: 9d4c6a7e5b12
+Create Date: 2026-10-18 11:47:09.226715
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2a9c3d8e41'
+down_revision: Union[str, Sequence[str], None] = '9d4c6a7e5b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_task_active_status_uuid',
+        'task',
+        ['status', 'uuid'],
+        postgresql_where=sa.text("status <> 'COMPLETED'"),
+        sqlite_where=sa.text("status <> 'COMPLETED'"),
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_task_title_pattern',
+            'task',
+            ['title'],
+            postgresql_ops={'title': 'text_pattern_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_task_title_pattern', table_name='task')
+    op.drop_index('ix_task_active_status_uuid', table_name='task')
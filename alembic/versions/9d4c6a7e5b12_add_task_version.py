@@ -0,0 +1,34 @@
+"""add task version
+
+Revision ID: 9d4c6a7e5b12
+Revises: 3b8e1f0c2a71
+Create Date: 2026-10-18 11:04:27.518343
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c6a7e5b12'
+down_revision: Union[str, Sequence[str], None] = '3b8e1f0c2a71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'task',
+        sa.Column(
+            'version', sa.Integer(), server_default='1', nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('task') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,71 @@
+"""add task delta sync
+
+Revision ID: a4d9e2f7c318
+Revises: e1a5b8c0d274
+Create Date: 2026-10-18 15:02:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d9e2f7c318'
+down_revision: Union[str, Sequence[str], None] = 'e1a5b8c0d274'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Plain ALTERs: a batch copy of the table on SQLite would drop
+    # the search and counter triggers.
+    if op.get_bind().dialect.name == 'postgresql':
+        default = sa.func.now()
+    else:
+        default = sa.text("'1970-01-01 00:00:00'")
+    for column in ('created_at', 'updated_at'):
+        op.add_column(
+            'task',
+            sa.Column(
+                column,
+                sa.DateTime(timezone=True),
+                server_default=default,
+                nullable=False,
+            ),
+        )
+    op.execute(
+        'UPDATE task SET created_at = CURRENT_TIMESTAMP, '
+        'updated_at = CURRENT_TIMESTAMP'
+    )
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column('task', 'created_at', server_default=None)
+        op.alter_column('task', 'updated_at', server_default=None)
+    op.create_index(
+        'ix_task_updated_at_uuid', 'task', ['updated_at', 'uuid'], unique=False
+    )
+    op.create_table('task_tombstone',
+    sa.Column('uuid', sa.Uuid(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('uuid')
+    )
+    op.create_index(
+        'ix_task_tombstone_deleted_at_uuid',
+        'task_tombstone',
+        ['deleted_at', 'uuid'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_task_tombstone_deleted_at_uuid', table_name='task_tombstone'
+    )
+    op.drop_table('task_tombstone')
+    op.drop_index('ix_task_updated_at_uuid', table_name='task')
+    with op.batch_alter_table('task') as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('created_at')
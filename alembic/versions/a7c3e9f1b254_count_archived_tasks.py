@@ -0,0 +1,81 @@
+"""count archived tasks
+
+Revision ID: a7c3e9f1b254
+Revises: f4a1c8e6b203
+Create Date: 2026-10-18 21:06:51.284093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f1b254'
+down_revision: Union[str, Sequence[str], None] = 'f4a1c8e6b203'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSTGRESQL_ARCHIVE_COUNTER_DDL = (
+    'CREATE TRIGGER task_archive_status_counter '
+    'AFTER INSERT OR DELETE ON task_archive '
+    'FOR EACH ROW EXECUTE FUNCTION task_status_counter_update()',
+)
+
+SQLITE_ARCHIVE_COUNTER_DDL = (
+    'CREATE TRIGGER task_archive_status_counter_insert '
+    'AFTER INSERT ON task_archive BEGIN '
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (new.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = count + 1; END',
+    'CREATE TRIGGER task_archive_status_counter_delete '
+    'AFTER DELETE ON task_archive BEGIN '
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = old.status; END',
+)
+
+POSTGRESQL_ARCHIVE_COUNTER_DROP_DDL = (
+    'DROP TRIGGER IF EXISTS task_archive_status_counter ON task_archive',
+)
+
+SQLITE_ARCHIVE_COUNTER_DROP_DDL = (
+    'DROP TRIGGER IF EXISTS task_archive_status_counter_insert',
+    'DROP TRIGGER IF EXISTS task_archive_status_counter_delete',
+)
+
+
+def recount(tasks: str) -> None:
+    """Overwrite the task status counters with a count of `tasks`."""
+    op.execute('DELETE FROM task_status_counter')
+    op.execute(
+        'INSERT INTO task_status_counter (status, count) '
+        f'SELECT status, count(*) FROM ({tasks}) AS tasks GROUP BY status'
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('LOCK TABLE task, task_archive IN SHARE MODE')
+        for statement in POSTGRESQL_ARCHIVE_COUNTER_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_ARCHIVE_COUNTER_DDL:
+            op.execute(statement)
+    recount(
+        'SELECT status FROM task UNION ALL SELECT status FROM task_archive'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('LOCK TABLE task, task_archive IN SHARE MODE')
+        for statement in POSTGRESQL_ARCHIVE_COUNTER_DROP_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_ARCHIVE_COUNTER_DROP_DDL:
+            op.execute(statement)
+    recount('SELECT status FROM task')
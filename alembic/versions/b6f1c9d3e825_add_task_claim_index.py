@@ -0,0 +1,34 @@
+"""add task claim index
+
+Revision ID: b6f1c9d3e825
+Revises: a4d9e2f7c318
+Create Date: 2026-10-18 16:21:54.603148
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f1c9d3e825'
+down_revision: Union[str, Sequence[str], None] = 'a4d9e2f7c318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_task_claimable_created_at_uuid',
+        'task',
+        ['created_at', 'uuid'],
+        postgresql_where=sa.text("status = 'CREATED'"),
+        sqlite_where=sa.text("status = 'CREATED'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_claimable_created_at_uuid', table_name='task')
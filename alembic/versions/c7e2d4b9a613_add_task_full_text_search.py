@@ -0,0 +1,72 @@
+"""add task full text search
+
+Revision ID: c7e2d4b9a613
+Revises: 5f2a9c3d8e41
+Create Date: 2026-10-18 12:31:55.840212
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2d4b9a613'
+down_revision: Union[str, Sequence[str], None] = '5f2a9c3d8e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSTGRESQL_SEARCH_DDL = (
+    'ALTER TABLE task ADD COLUMN search_vector tsvector '
+    'GENERATED ALWAYS AS ('
+    "to_tsvector('simple', "
+    "coalesce(title, '') || ' ' || coalesce(description, ''))"
+    ') STORED',
+    'CREATE INDEX ix_task_search_vector ON task USING gin (search_vector)',
+)
+
+SQLITE_SEARCH_DDL = (
+    'CREATE VIRTUAL TABLE task_fts USING fts5('
+    "title, description, content='task', content_rowid='rowid')",
+    'CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN '
+    'INSERT INTO task_fts (rowid, title, description) '
+    'VALUES (new.rowid, new.title, new.description); END',
+    'CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN '
+    'INSERT INTO task_fts (task_fts, rowid, title, description) '
+    "VALUES ('delete', old.rowid, old.title, old.description); END",
+    'CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description '
+    'ON task BEGIN '
+    'INSERT INTO task_fts (task_fts, rowid, title, description) '
+    "VALUES ('delete', old.rowid, old.title, old.description); "
+    'INSERT INTO task_fts (rowid, title, description) '
+    'VALUES (new.rowid, new.title, new.description); END',
+)
+
+SQLITE_SEARCH_DROP_DDL = (
+    'DROP TABLE IF EXISTS task_fts',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for statement in POSTGRESQL_SEARCH_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO task_fts (task_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_task_search_vector', table_name='task')
+        op.drop_column('task', 'search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('insert', 'delete', 'update'):
+            op.execute(f'DROP TRIGGER IF EXISTS task_fts_{trigger}')
+        for statement in SQLITE_SEARCH_DROP_DDL:
+            op.execute(statement)
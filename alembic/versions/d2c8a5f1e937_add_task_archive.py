@@ -0,0 +1,62 @@
+"""add task archive
+
+Revision ID: d2c8a5f1e937
+Revises: b6f1c9d3e825
+Create Date: 2026-10-18 17:08:12.514620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c8a5f1e937'
+down_revision: Union[str, Sequence[str], None] = 'b6f1c9d3e825'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_archive',
+    sa.Column('uuid', sa.Uuid(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column(
+        'status',
+        sa.Enum(
+            'CREATED', 'IN_PROGRESS', 'COMPLETED', name='statusenum'
+        ).with_variant(
+            postgresql.ENUM(name='statusenum', create_type=False),
+            'postgresql',
+        ),
+        nullable=False,
+    ),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('uuid')
+    )
+    op.create_index(
+        'ix_task_archive_title_uuid',
+        'task_archive',
+        ['title', 'uuid'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_task_archive_status_uuid',
+        'task_archive',
+        ['status', 'uuid'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_archive_status_uuid', table_name='task_archive')
+    op.drop_index('ix_task_archive_title_uuid', table_name='task_archive')
+    op.drop_table('task_archive')
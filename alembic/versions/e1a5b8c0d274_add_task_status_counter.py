@@ -0,0 +1,111 @@
+"""add task status counter
+
+Revision ID: e1a5b8c0d274
+Revises: c7e2d4b9a613
+Create Date: 2026-10-18 13:20:13.671094
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a5b8c0d274'
+down_revision: Union[str, Sequence[str], None] = 'c7e2d4b9a613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSTGRESQL_COUNTER_DDL = (
+    'CREATE OR REPLACE FUNCTION task_status_counter_update() '
+    'RETURNS trigger AS $$ '
+    'BEGIN '
+    "IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN "
+    'RETURN NULL; '
+    'END IF; '
+    "IF TG_OP IN ('UPDATE', 'DELETE') THEN "
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = OLD.status; '
+    'END IF; '
+    "IF TG_OP IN ('INSERT', 'UPDATE') THEN "
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (NEW.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = task_status_counter.count + 1; '
+    'END IF; '
+    'RETURN NULL; '
+    'END $$ LANGUAGE plpgsql',
+    'CREATE TRIGGER task_status_counter '
+    'AFTER INSERT OR DELETE OR UPDATE OF status ON task '
+    'FOR EACH ROW EXECUTE FUNCTION task_status_counter_update()',
+)
+
+SQLITE_COUNTER_DDL = (
+    'CREATE TRIGGER task_status_counter_insert AFTER INSERT ON task BEGIN '
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (new.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = count + 1; END',
+    'CREATE TRIGGER task_status_counter_delete AFTER DELETE ON task BEGIN '
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = old.status; END',
+    'CREATE TRIGGER task_status_counter_update AFTER UPDATE OF status '
+    'ON task WHEN old.status <> new.status BEGIN '
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = old.status; '
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (new.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = count + 1; END',
+)
+
+POSTGRESQL_COUNTER_DROP_DDL = (
+    'DROP TRIGGER IF EXISTS task_status_counter ON task',
+    'DROP FUNCTION IF EXISTS task_status_counter_update()',
+)
+
+SQLITE_COUNTER_DROP_DDL = (
+    'DROP TRIGGER IF EXISTS task_status_counter_insert',
+    'DROP TRIGGER IF EXISTS task_status_counter_delete',
+    'DROP TRIGGER IF EXISTS task_status_counter_update',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_status_counter',
+    sa.Column(
+        'status',
+        sa.Enum(
+            'CREATED', 'IN_PROGRESS', 'COMPLETED', name='statusenum'
+        ).with_variant(
+            postgresql.ENUM(name='statusenum', create_type=False),
+            'postgresql',
+        ),
+        nullable=False,
+    ),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('status')
+    )
+    op.execute(
+        'INSERT INTO task_status_counter (status, count) '
+        'SELECT status, count(*) FROM task GROUP BY status'
+    )
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for statement in POSTGRESQL_COUNTER_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_COUNTER_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for statement in POSTGRESQL_COUNTER_DROP_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_COUNTER_DROP_DDL:
+            op.execute(statement)
+    op.drop_table('task_status_counter')
@@ -0,0 +1,91 @@
+"""key task search by uuid
+
+Revision ID: f4a1c8e6b203
+Revises: d2c8a5f1e937
+Create Date: 2026-10-18 19:42:07.318556
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a1c8e6b203'
+down_revision: Union[str, Sequence[str], None] = 'd2c8a5f1e937'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_SEARCH_DDL = (
+    'CREATE TABLE task_fts_key ('
+    'id INTEGER PRIMARY KEY, uuid CHAR(32) NOT NULL UNIQUE)',
+    'CREATE VIRTUAL TABLE task_fts USING fts5(title, description)',
+    'CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN '
+    'INSERT INTO task_fts_key (uuid) VALUES (new.uuid); '
+    'INSERT INTO task_fts (rowid, title, description) VALUES ('
+    '(SELECT id FROM task_fts_key WHERE uuid = new.uuid), '
+    'new.title, new.description); END',
+    'CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN '
+    'DELETE FROM task_fts WHERE rowid = '
+    '(SELECT id FROM task_fts_key WHERE uuid = old.uuid); '
+    'DELETE FROM task_fts_key WHERE uuid = old.uuid; END',
+    'CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description '
+    'ON task BEGIN '
+    'UPDATE task_fts SET title = new.title, description = new.description '
+    'WHERE rowid = (SELECT id FROM task_fts_key WHERE uuid = new.uuid); END',
+)
+
+SQLITE_SEARCH_DROP_DDL = (
+    'DROP TABLE IF EXISTS task_fts',
+    'DROP TABLE IF EXISTS task_fts_key',
+)
+
+ROWID_SEARCH_DDL = (
+    'CREATE VIRTUAL TABLE task_fts USING fts5('
+    "title, description, content='task', content_rowid='rowid')",
+    'CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN '
+    'INSERT INTO task_fts (rowid, title, description) '
+    'VALUES (new.rowid, new.title, new.description); END',
+    'CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN '
+    'INSERT INTO task_fts (task_fts, rowid, title, description) '
+    "VALUES ('delete', old.rowid, old.title, old.description); END",
+    'CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description '
+    'ON task BEGIN '
+    'INSERT INTO task_fts (task_fts, rowid, title, description) '
+    "VALUES ('delete', old.rowid, old.title, old.description); "
+    'INSERT INTO task_fts (rowid, title, description) '
+    'VALUES (new.rowid, new.title, new.description); END',
+)
+
+
+def drop_search() -> None:
+    """Drop the SQLite search triggers and tables."""
+    for trigger in ('insert', 'delete', 'update'):
+        op.execute(f'DROP TRIGGER IF EXISTS task_fts_{trigger}')
+    for statement in SQLITE_SEARCH_DROP_DDL:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    drop_search()
+    for statement in SQLITE_SEARCH_DDL:
+        op.execute(statement)
+    op.execute('INSERT INTO task_fts_key (uuid) SELECT uuid FROM task')
+    op.execute(
+        'INSERT INTO task_fts (rowid, title, description) '
+        'SELECT task_fts_key.id, task.title, task.description '
+        'FROM task JOIN task_fts_key ON task_fts_key.uuid = task.uuid'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    drop_search()
+    for statement in ROWID_SEARCH_DDL:
+        op.execute(statement)
+    op.execute("INSERT INTO task_fts (task_fts) VALUES ('rebuild')")
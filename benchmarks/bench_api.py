@@ -0,0 +1,423 @@
+"""
+Benchmark of the task CRUD API.
+
+Drives the application in-process (httpx `ASGITransport`) or through
+a real uvicorn server and measures create, get by uuid, patch, delete
+and list (page of 1000) on tables of several sizes. Each scenario
+reports throughput, p50/p95/p99 latency and SQL statements per request
+(from the `Server-Timing` header of query accounting).
+
+The `sqlite` database is a fresh temporary file. The `postgres`
+database is configured by the usual `DB_*` variables and must be
+a dedicated database: its tables are dropped and created again.
+
+Usage:
+    python -m benchmarks.bench_api run --db sqlite --output before.json
+    python -m benchmarks.bench_api run --db postgres --transport uvicorn
+    python -m benchmarks.bench_api compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+
+DEFAULT_REQUESTS = 1000
+DEFAULT_LIST_SIZES = (1_000, 100_000)
+LIST_PAGE_LIMIT = 1000
+SEED_CHUNK_SIZE = 10_000
+SERVER_START_TIMEOUT = 30
+STATEMENTS_PATTERN = re.compile(r'desc="(\d+) statements"')
+STATUSES = ('created', 'in_progress', 'completed')
+
+Request = tuple[str, str, Optional[object]]
+
+
+def configure_environment(database: str) -> dict[str, str]:
+    """
+    Build environment variables of the benchmarked application.
+
+    Args:
+        database (str): `sqlite` or `postgres`.
+
+    Returns:
+        dict[str, str]: Environment of the application.
+    """
+    env = dict(
+        os.environ,
+        QUERY_ACCOUNTING='1',
+        STATS_RECONCILE_INTERVAL='0',
+    )
+    if database == 'sqlite':
+        path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+        env.update(DEBUG='1', LOCAL_DB_URL=f'sqlite+aiosqlite:///{path}')
+    else:
+        env['DEBUG'] = ''
+    return env
+
+
+async def reset_schema() -> None:
+    """Drop and create all tables of the configured database."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.core.config import settings
+    from src.models import BaseModel
+
+    engine = create_async_engine(settings.get_db_url)
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.drop_all)
+        await connection.run_sync(BaseModel.metadata.create_all)
+    await engine.dispose()
+
+
+def percentile(quantiles: list[float], value: int) -> float:
+    """Return the `value`-th percentile from 99 cut points."""
+    return quantiles[value - 1] if quantiles else 0.0
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    requests: list[Request],
+    concurrency: int,
+) -> dict:
+    """
+    Send requests with `concurrency` parallel workers.
+
+    Args:
+        client (httpx.AsyncClient): Client of the application.
+        requests (list[Request]): `(method, url, json)` to send.
+        concurrency (int): Number of requests in flight.
+
+    Returns:
+        dict: Throughput, latency percentiles in ms, mean statements
+            per request and the number of failed requests.
+    """
+    latencies, statements, responses = [], [], []
+    pending = iter(requests)
+
+    async def worker() -> None:
+        for method, url, body in pending:
+            started_at = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+            responses.append(response)
+            match = STATEMENTS_PATTERN.search(
+                response.headers.get('server-timing', '')
+            )
+            if match:
+                statements.append(int(match.group(1)))
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+    quantiles = (
+        statistics.quantiles(latencies, n=100, method='inclusive')
+        if len(latencies) > 1 else latencies * 99
+    )
+    return {
+        'requests': len(latencies),
+        'errors': sum(not response.is_success for response in responses),
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(quantiles, 50),
+        'p95_ms': percentile(quantiles, 95),
+        'p99_ms': percentile(quantiles, 99),
+        'db_statements': (
+            statistics.fmean(statements) if statements else None
+        ),
+        '_responses': responses,
+    }
+
+
+async def seed(client: httpx.AsyncClient, count: int, offset: int) -> None:
+    """Create `count` tasks through the bulk endpoint."""
+    for start in range(offset, offset + count, SEED_CHUNK_SIZE):
+        response = await client.post(
+            '/tasks/bulk',
+            json=[
+                {
+                    'title': f'Seed task {number}',
+                    'status': STATUSES[number % len(STATUSES)],
+                }
+                for number in range(
+                    start, min(start + SEED_CHUNK_SIZE, offset + count)
+                )
+            ],
+        )
+        response.raise_for_status()
+
+
+async def run_scenarios(
+    client: httpx.AsyncClient,
+    requests: int,
+    list_sizes: list[int],
+    concurrency: int,
+) -> dict[str, dict]:
+    """
+    Run all scenarios against an empty database.
+
+    Args:
+        client (httpx.AsyncClient): Client of the application.
+        requests (int): Requests per CRUD scenario.
+        list_sizes (list[int]): Table sizes of the list scenarios.
+        concurrency (int): Number of requests in flight.
+
+    Returns:
+        dict[str, dict]: Results by scenario name.
+    """
+    results = {}
+    results['create'] = await measure(
+        client,
+        [
+            (
+                'POST',
+                '/tasks',
+                {'title': f'Task {number}', 'status': 'created'},
+            )
+            for number in range(requests)
+        ],
+        concurrency,
+    )
+    uuids = [
+        response.json()['uuid']
+        for response in results['create']['_responses']
+        if response.is_success
+    ]
+    results['get'] = await measure(
+        client,
+        [('GET', f'/tasks/{uuid}', None) for uuid in uuids],
+        concurrency,
+    )
+    results['patch'] = await measure(
+        client,
+        [
+            ('PATCH', f'/tasks/{uuid}', {'status': 'in_progress'})
+            for uuid in uuids
+        ],
+        concurrency,
+    )
+    results['delete'] = await measure(
+        client,
+        [('DELETE', f'/tasks/{uuid}', None) for uuid in uuids],
+        concurrency,
+    )
+    seeded = 0
+    for size in sorted(list_sizes):
+        await seed(client, size - seeded, seeded)
+        seeded = size
+        results[f'list_{size}'] = await measure(
+            client,
+            [('GET', f'/tasks?limit={LIST_PAGE_LIMIT}', None)] * max(
+                1, requests // 10
+            ),
+            concurrency,
+        )
+    for result in results.values():
+        del result['_responses']
+    return results
+
+
+def free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_server(
+    client: httpx.AsyncClient,
+    server: subprocess.Popen,
+) -> None:
+    """Wait until the server answers requests."""
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while True:
+        try:
+            await client.get('/tasks/stats')
+            return
+        except httpx.TransportError:
+            if server.poll() is not None:
+                raise RuntimeError(
+                    f'uvicorn exited with code {server.returncode}!'
+                )
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def run(arguments: argparse.Namespace) -> dict:
+    """Run the benchmark and return its results."""
+    env = configure_environment(arguments.db)
+    os.environ.update(env)
+    await reset_schema()
+    options = {'timeout': None}
+    if arguments.transport == 'asgi':
+        from src.main import app
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://benchmark',
+            **options,
+        ) as client:
+            scenarios = await run_scenarios(
+                client,
+                arguments.requests,
+                arguments.list_sizes,
+                arguments.concurrency,
+            )
+    else:
+        port = free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable, '-m', 'uvicorn', 'src.main:app',
+                '--port', str(port),
+                '--workers', str(arguments.workers),
+                '--log-level', 'warning',
+            ],
+            env=env,
+        )
+        try:
+            async with httpx.AsyncClient(
+                base_url=f'http://127.0.0.1:{port}',
+                limits=httpx.Limits(
+                    max_connections=arguments.concurrency
+                ),
+                **options,
+            ) as client:
+                await wait_for_server(client, server)
+                scenarios = await run_scenarios(
+                    client,
+                    arguments.requests,
+                    arguments.list_sizes,
+                    arguments.concurrency,
+                )
+        finally:
+            server.terminate()
+            server.wait()
+    return {
+        'meta': {
+            'database': arguments.db,
+            'transport': arguments.transport,
+            'workers': arguments.workers,
+            'requests': arguments.requests,
+            'concurrency': arguments.concurrency,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'started_at': datetime.now(timezone.utc).isoformat(),
+        },
+        'scenarios': scenarios,
+    }
+
+
+def print_results(results: dict) -> None:
+    """Print results of a run as a table."""
+    print(
+        f'{"scenario":>12} {"req/sec":>10} {"p50 ms":>9} '
+        f'{"p95 ms":>9} {"p99 ms":>9} {"stmts":>6} {"errors":>6}'
+    )
+    for name, result in results['scenarios'].items():
+        statements = result['db_statements']
+        print(
+            f'{name:>12} {result["throughput"]:>10,.1f} '
+            f'{result["p50_ms"]:>9.2f} {result["p95_ms"]:>9.2f} '
+            f'{result["p99_ms"]:>9.2f} '
+            f'{"-" if statements is None else f"{statements:.1f}":>6} '
+            f'{result["errors"]:>6}'
+        )
+
+
+def compare(before: dict, after: dict, threshold: float) -> bool:
+    """
+    Print the change of every metric between two runs.
+
+    A scenario regresses if its throughput drops, or its p95 latency
+    or statements per request grow, by more than `threshold`.
+
+    Args:
+        before (dict): Results of the baseline run.
+        after (dict): Results of the new run.
+        threshold (float): Tolerated relative change, e.g. 0.1.
+
+    Returns:
+        bool: True if no scenario regressed.
+    """
+    passed = True
+    for name, new in after['scenarios'].items():
+        old = before['scenarios'].get(name)
+        if old is None:
+            print(f'{name:>12}: new scenario')
+            continue
+        changes = []
+        for metric, higher_is_better in (
+            ('throughput', True),
+            ('p95_ms', False),
+            ('db_statements', False),
+        ):
+            if not old[metric] or new[metric] is None:
+                continue
+            change = new[metric] / old[metric] - 1
+            regressed = (
+                -change if higher_is_better else change
+            ) > threshold
+            passed = passed and not regressed
+            changes.append(
+                f'{metric} {old[metric]:,.2f} -> {new[metric]:,.2f} '
+                f'({change:+.1%}){" REGRESSION" if regressed else ""}'
+            )
+        print(f'{name:>12}: ' + ', '.join(changes))
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='Run the benchmark')
+    run_parser.add_argument(
+        '--db', choices=('sqlite', 'postgres'), default='sqlite'
+    )
+    run_parser.add_argument(
+        '--transport', choices=('asgi', 'uvicorn'), default='asgi'
+    )
+    run_parser.add_argument('--workers', type=int, default=1)
+    run_parser.add_argument(
+        '--requests', type=int, default=DEFAULT_REQUESTS
+    )
+    run_parser.add_argument('--concurrency', type=int, default=1)
+    run_parser.add_argument(
+        '--list-sizes',
+        type=lambda value: [int(size) for size in value.split(',')],
+        default=list(DEFAULT_LIST_SIZES),
+    )
+    run_parser.add_argument('--output', help='Write results to a JSON file')
+    compare_parser = commands.add_parser(
+        'compare', help='Compare two result files'
+    )
+    compare_parser.add_argument('before')
+    compare_parser.add_argument('after')
+    compare_parser.add_argument('--threshold', type=float, default=0.1)
+    arguments = parser.parse_args()
+    if arguments.command == 'compare':
+        with open(arguments.before) as before, open(arguments.after) as after:
+            passed = compare(
+                json.load(before), json.load(after), arguments.threshold
+            )
+        sys.exit(0 if passed else 1)
+    results = asyncio.run(run(arguments))
+    print_results(results)
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
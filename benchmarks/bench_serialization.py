@@ -0,0 +1,91 @@
+"""
+Benchmark of task list serialization.
+
+Compares rows/sec of the `list[TaskRead]` response model path
+(ORM instances, Pydantic validation, default JSON encoder) with the
+fast path (Core rows encoded straight to JSON bytes).
+
+Usage:
+    python -m benchmarks.bench_serialization --rows 100000
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from src.api.serializers import TASK_READ_FIELDS, dump_rows
+from src.crud.task import TaskCRUD
+from src.database.enums import StatusEnum
+from src.models import BaseModel, Task
+from src.schemas.task import TaskCreate, TaskRead
+
+TASK_LIST_ADAPTER = TypeAdapter(list[TaskRead])
+
+
+async def response_model_path(session: AsyncSession, crud: TaskCRUD) -> int:
+    """Load ORM instances and serialize them like FastAPI does."""
+    tasks = await crud.get_all(session)
+    body = JSONResponse(
+        TASK_LIST_ADAPTER.dump_python(
+            TASK_LIST_ADAPTER.validate_python(tasks),
+            mode='json',
+            exclude_none=True,
+        )
+    ).body
+    session.expunge_all()
+    return len(body)
+
+
+async def fast_path(session: AsyncSession, crud: TaskCRUD) -> int:
+    """Load Core rows and encode them straight to JSON bytes."""
+    rows = await crud.get_all(session, columns=TASK_READ_FIELDS)
+    return len(dump_rows(rows))
+
+
+async def main(rows: int, repeats: int) -> None:
+    engine = create_async_engine(
+        'sqlite+aiosqlite://', poolclass=StaticPool
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.create_all)
+    crud = TaskCRUD(Task)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await crud.bulk_create(
+            [
+                TaskCreate(
+                    title=f'Task {number}',
+                    description=None if number % 3 else 'Description',
+                    status=list(StatusEnum)[number % len(StatusEnum)],
+                )
+                for number in range(rows)
+            ],
+            session,
+        )
+        session.expunge_all()
+        for name, path in (
+            ('response_model', response_model_path),
+            ('fast_path', fast_path),
+        ):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                size = await path(session, crud)
+                best = min(best, time.perf_counter() - start)
+            print(
+                f'{name:>15}: {rows / best:>12,.0f} rows/sec '
+                f'({best * 1000:.1f} ms, {size:,} bytes)'
+            )
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.repeats))
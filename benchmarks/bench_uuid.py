@@ -0,0 +1,192 @@
+"""
+Benchmark of task inserts with random (v4) and time-ordered (v7) UUIDs.
+
+Inserts the same number of tasks keyed by each UUID version into an
+empty task table and reports insert throughput over the whole run and
+over its last tenth (where a random key hits a large, cold index),
+and the size of the primary key index at the end.
+
+The `sqlite` database is a fresh temporary file per version. The
+`postgres` database is configured by the usual `DB_*` variables and
+must be a dedicated database: its tables are dropped and created again.
+
+Usage:
+    python -m benchmarks.bench_uuid --db sqlite --rows 1000000
+    python -m benchmarks.bench_uuid --db postgres --output uuid.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+DEFAULT_ROWS = 10_000_000
+DEFAULT_CHUNK_SIZE = 10_000
+TAIL_FRACTION = 0.1
+SQLITE_PRIMARY_KEY_INDEX = 'sqlite_autoindex_task_1'
+POSTGRESQL_PRIMARY_KEY_INDEX = 'task_pkey'
+
+
+def database_url(database: str) -> str:
+    """
+    Build the URL of an empty benchmark database.
+
+    Args:
+        database (str): `sqlite` or `postgres`.
+
+    Returns:
+        str: SQLAlchemy URL of the database.
+    """
+    if database == 'sqlite':
+        path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+        return f'sqlite+aiosqlite:///{path}'
+    os.environ['DEBUG'] = ''
+    from src.core.config import settings
+
+    return settings.get_db_url
+
+
+async def index_size(connection: AsyncConnection) -> int:
+    """Return the size of the task primary key index in bytes."""
+    if connection.dialect.name == 'postgresql':
+        statement = text(
+            f"SELECT pg_relation_size('{POSTGRESQL_PRIMARY_KEY_INDEX}')"
+        )
+    else:
+        statement = text(
+            'SELECT SUM(pgsize) FROM dbstat '
+            f"WHERE name = '{SQLITE_PRIMARY_KEY_INDEX}'"
+        )
+    return int((await connection.execute(statement)).scalar() or 0)
+
+
+async def measure(
+    database: str,
+    version: int,
+    rows: int,
+    chunk_size: int,
+) -> dict:
+    """
+    Insert `rows` tasks with UUIDs of one version.
+
+    Args:
+        database (str): `sqlite` or `postgres`.
+        version (int): UUID version, 4 or 7.
+        rows (int): Number of tasks to insert.
+        chunk_size (int): Tasks inserted per transaction.
+
+    Returns:
+        dict: Throughput in rows per second overall and over the last
+            tenth of the run, and the primary key index size in bytes.
+    """
+    from src.database.enums import StatusEnum
+    from src.models import BaseModel
+    from src.models.base import utc_now, uuid_factory
+    from src.models.task import Task
+
+    generate = uuid_factory(version)
+    engine = create_async_engine(database_url(database))
+    async with engine.begin() as connection:
+        await connection.run_sync(BaseModel.metadata.drop_all)
+        await connection.run_sync(BaseModel.metadata.create_all)
+    tail_start = rows - int(rows * TAIL_FRACTION)
+    elapsed = tail_elapsed = 0.0
+    tail_rows = 0
+    for start in range(0, rows, chunk_size):
+        now = utc_now()
+        chunk = [
+            {
+                'uuid': generate(),
+                'title': f'Task {number}',
+                'status': StatusEnum.CREATED,
+                'version': 1,
+                'created_at': now,
+                'updated_at': now,
+            }
+            for number in range(start, min(start + chunk_size, rows))
+        ]
+        started_at = time.perf_counter()
+        async with engine.begin() as connection:
+            await connection.execute(insert(Task.__table__), chunk)
+        duration = time.perf_counter() - started_at
+        elapsed += duration
+        # A chunk overlapping the tail counts with its rows in the tail
+        # and the same share of its duration.
+        chunk_tail_rows = start + len(chunk) - max(start, tail_start)
+        if chunk_tail_rows > 0:
+            tail_elapsed += duration * chunk_tail_rows / len(chunk)
+            tail_rows += chunk_tail_rows
+    async with engine.connect() as connection:
+        size = await index_size(connection)
+    await engine.dispose()
+    return {
+        'rows': rows,
+        'throughput': rows / elapsed if elapsed else 0.0,
+        'tail_throughput': (
+            tail_rows / tail_elapsed if tail_elapsed else 0.0
+        ),
+        'index_bytes': size,
+    }
+
+
+async def run(arguments: argparse.Namespace) -> dict:
+    """Run the benchmark for both UUID versions."""
+    return {
+        'meta': {
+            'database': arguments.db,
+            'rows': arguments.rows,
+            'chunk_size': arguments.chunk_size,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'started_at': datetime.now(timezone.utc).isoformat(),
+        },
+        'versions': {
+            f'uuid{version}': await measure(
+                arguments.db, version, arguments.rows, arguments.chunk_size
+            )
+            for version in (4, 7)
+        },
+    }
+
+
+def print_results(results: dict) -> None:
+    """Print results of a run as a table."""
+    print(
+        f'{"version":>8} {"rows/sec":>10} {"tail rows/sec":>14} '
+        f'{"pk index MB":>12}'
+    )
+    for name, result in results['versions'].items():
+        print(
+            f'{name:>8} {result["throughput"]:>10,.0f} '
+            f'{result["tail_throughput"]:>14,.0f} '
+            f'{result["index_bytes"] / 2 ** 20:>12,.1f}'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--db', choices=('sqlite', 'postgres'), default='sqlite'
+    )
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument(
+        '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE
+    )
+    parser.add_argument('--output', help='Write results to a JSON file')
+    arguments = parser.parse_args()
+    results = asyncio.run(run(arguments))
+    print_results(results)
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
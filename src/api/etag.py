@@ -0,0 +1,103 @@
+import hashlib
+from typing import Iterable, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+
+def task_etag(uuid: UUID, version: int) -> str:
+    """
+    Build a strong ETag of a single task.
+
+    Args:
+        uuid (UUID): Unique identifier of the task.
+        version (int): Row version of the task.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    return f'"{uuid.hex}.{version}"'
+
+
+def list_etag(tasks: Iterable, *extra: Optional[str]) -> str:
+    """
+    Build a strong ETag of a list of tasks.
+
+    The tag changes whenever a task of the list is created, updated
+    or deleted, because it is derived from `(uuid, version)` pairs.
+
+    Args:
+        tasks (Iterable): Tasks (instances or rows) of the list.
+        *extra (str | None): Other values the response depends on.
+
+    Returns:
+        str: Quoted ETag value.
+    """
+    digest = hashlib.sha1()
+    for task in tasks:
+        digest.update(f'{task.uuid.hex}.{task.version};'.encode())
+    for value in extra:
+        digest.update(f'{value};'.encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _split_etags(header: str) -> list[str]:
+    """Split an `If-Match`/`If-None-Match` header into tags."""
+    return [tag.strip() for tag in header.split(',') if tag.strip()]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an `If-None-Match` header against the current ETag.
+
+    Uses the weak comparison required for `If-None-Match`.
+
+    Args:
+        if_none_match (str | None): Value of the `If-None-Match` header.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        bool: True if the client copy is up to date.
+    """
+    if not if_none_match:
+        return False
+    tags = _split_etags(if_none_match)
+    return '*' in tags or etag in (tag.removeprefix('W/') for tag in tags)
+
+
+def versions_from_if_match(
+    if_match: Optional[str],
+    uuid: UUID,
+) -> Optional[list[int]]:
+    """
+    Extract task versions the client expects from an `If-Match` header.
+
+    Args:
+        if_match (str | None): Value of the `If-Match` header.
+        uuid (UUID): Unique identifier of the updated task.
+
+    Raises:
+        HTTPException: If the header has no strong ETag of the task
+            (status 412).
+
+    Returns:
+        list[int] | None: Expected versions, or None if any version
+            is acceptable (no header or `*`).
+    """
+    if not if_match:
+        return None
+    tags = _split_etags(if_match)
+    if '*' in tags:
+        return None
+    prefix = f'"{uuid.hex}.'
+    versions = [
+        int(tag[len(prefix):-1])
+        for tag in tags
+        if tag.startswith(prefix) and tag[len(prefix):-1].isdigit()
+    ]
+    if not versions:
+        raise HTTPException(
+            detail=f'Task with uuid = {uuid} does not match If-Match!',
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+        )
+    return versions
@@ -0,0 +1,166 @@
+import base64
+import binascii
+import json
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from src.database.enums import TaskOrderingEnum
+from src.models.task import Task
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def _encode_token(payload: list) -> str:
+    """Encode a JSON payload as an URL-safe token."""
+    return base64.urlsafe_b64encode(
+        json.dumps(payload, separators=(',', ':')).encode()
+    ).decode().rstrip('=')
+
+
+def _decode_token(token: str) -> Any:
+    """Decode an URL-safe token into its JSON payload."""
+    return json.loads(
+        base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+    )
+
+
+def encode_cursor(
+    ordering: TaskOrderingEnum,
+    instance: Any,
+) -> str:
+    """
+    Build an opaque cursor pointing right after the given instance.
+
+    Args:
+        ordering (TaskOrderingEnum): Ordering the page was built with.
+        instance: Last instance (or row) of the current page.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    payload = [
+        ordering.value,
+        str(getattr(instance, ordering.field)),
+        str(instance.uuid),
+    ]
+    return _encode_token(payload)
+
+
+def _parse_sort_key(ordering: TaskOrderingEnum, sort_key: Any) -> Any:
+    """
+    Convert the sort key of a cursor into a value of the sort column.
+
+    Args:
+        ordering (TaskOrderingEnum): Ordering of the requested page.
+        sort_key: Sort key as stored in the cursor.
+
+    Raises:
+        ValueError: If the key is not a string of a value of the column.
+
+    Returns:
+        Any: Sort key of the Python type of the sort column.
+    """
+    if not isinstance(sort_key, str):
+        raise ValueError(f'Sort key must be a string, not {sort_key!r}')
+    python_type = Task.__table__.c[ordering.field].type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(sort_key)
+    return python_type(sort_key)
+
+
+def decode_cursor(
+    cursor: str,
+    ordering: TaskOrderingEnum,
+) -> tuple[Any, UUID]:
+    """
+    Decode a cursor token into a `(sort_key, uuid)` seek position.
+
+    Args:
+        cursor (str): Cursor token from a previous page.
+        ordering (TaskOrderingEnum): Ordering of the requested page.
+
+    Raises:
+        HTTPException: If the cursor is malformed, its sort key does
+            not match the sort column or it was issued for another
+            ordering (status 400).
+
+    Returns:
+        tuple[Any, UUID]: Sort key value and uuid of the last seen row.
+    """
+    try:
+        cursor_ordering, sort_key, uuid = _decode_token(cursor)
+        uuid = UUID(uuid)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            detail='Invalid pagination cursor!',
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if cursor_ordering != ordering.value:
+        raise HTTPException(
+            detail=(
+                f'Cursor was issued for ordering `{cursor_ordering}`, '
+                f'not `{ordering.value}`!'
+            ),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if ordering.field == 'uuid':
+        return uuid, uuid
+    try:
+        sort_key = _parse_sort_key(ordering, sort_key)
+    except ValueError:
+        raise HTTPException(
+            detail='Invalid pagination cursor!',
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    return sort_key, uuid
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Treat naive datetimes (as returned by SQLite) as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def encode_sync_token(position: tuple[datetime, UUID]) -> str:
+    """
+    Build an opaque delta sync token pointing right after a change.
+
+    Args:
+        position (tuple[datetime, UUID]): `(timestamp, uuid)` of the last
+            change the client receives.
+
+    Returns:
+        str: URL-safe sync token.
+    """
+    timestamp, uuid = position
+    return _encode_token([_as_utc(timestamp).isoformat(), str(uuid)])
+
+
+def decode_sync_token(token: str) -> tuple[datetime, UUID]:
+    """
+    Decode a sync token into a `(timestamp, uuid)` position.
+
+    Args:
+        token (str): Sync token from a previous response.
+
+    Raises:
+        HTTPException: If the token is malformed (status 400).
+
+    Returns:
+        tuple[datetime, UUID]: UTC timestamp and uuid of the last change
+            the client has seen.
+    """
+    try:
+        timestamp, uuid = _decode_token(token)
+        return _as_utc(datetime.fromisoformat(timestamp)), UUID(uuid)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            detail='Invalid sync token!',
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
@@ -1,6 +1,16 @@
 from fastapi import APIRouter
 
-from src.api.v1.endpoints import task_router
+from src.api.v1.endpoints import (
+    metrics_router,
+    monitoring_router,
+    task_router,
+)
 
 main_router = APIRouter()
 main_router.include_router(task_router, prefix='/tasks', tags=['tasks'])
+main_router.include_router(
+    monitoring_router, prefix='/monitoring', tags=['monitoring']
+)
+main_router.include_router(
+    metrics_router, prefix='/metrics', tags=['monitoring']
+)
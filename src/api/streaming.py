@@ -0,0 +1,101 @@
+import asyncio
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.api.serializers import TASK_READ_FIELDS, dump_rows_ndjson
+from src.core.changes import ChangeFeed, format_event
+from src.crud.base import BaseCRUD
+from src.database.enums import TaskOrderingEnum
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+EVENT_STREAM_MEDIA_TYPE = 'text/event-stream'
+STREAM_CHUNK_SIZE = 1000
+OVERFLOW_EVENT = 'overflow'
+
+
+def accepts_ndjson(accept: Optional[str]) -> bool:
+    """
+    Check if the client asked for a newline-delimited JSON stream.
+
+    Args:
+        accept (str | None): Value of the `Accept` request header.
+
+    Returns:
+        bool: True if `application/x-ndjson` is acceptable.
+    """
+    return bool(accept) and NDJSON_MEDIA_TYPE in accept
+
+
+async def stream_ndjson(
+    bind: AsyncEngine,
+    crud: BaseCRUD,
+    ordering: TaskOrderingEnum,
+    where: Sequence = (),
+    fields: Sequence[str] = TASK_READ_FIELDS,
+    include_archived: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Serialize all records of the CRUD model as NDJSON chunks.
+
+    The stream opens its own session: dependencies with `yield` are
+    closed before a streaming response body is sent. Rows are read
+    as plain tuples of `fields` columns.
+
+    Args:
+        bind (AsyncEngine): Engine of the database to read from.
+        crud (BaseCRUD): CRUD object of the streamed model.
+        ordering (TaskOrderingEnum): Order of the streamed records.
+        where (Sequence): Filter criteria of the streamed records.
+        fields (Sequence[str]): Names of streamed columns.
+        include_archived (bool): Stream archived records too.
+
+    Yields:
+        bytes: One JSON document per line, one chunk per DB round trip.
+    """
+    async with AsyncSession(bind, expire_on_commit=False) as session:
+        async for chunk in crud.stream_all(
+            session,
+            order_by=ordering.field,
+            descending=ordering.descending,
+            chunk_size=STREAM_CHUNK_SIZE,
+            where=where,
+            columns=fields,
+            include_archived=include_archived,
+        ):
+            yield dump_rows_ndjson(chunk, fields)
+
+
+async def stream_events(
+    feed: ChangeFeed,
+    heartbeat: float,
+) -> AsyncIterator[bytes]:
+    """
+    Relay change feed events as a Server-Sent Events stream.
+
+    A comment line is sent every `heartbeat` seconds without events
+    to keep proxies from closing the connection. A client that falls
+    behind gets an `overflow` event and the stream ends; it should
+    reload the data and reconnect.
+
+    Args:
+        feed (ChangeFeed): Feed of the streamed model.
+        heartbeat (float): Seconds of silence before a keep-alive.
+
+    Yields:
+        bytes: Event frames.
+    """
+    async with feed.broadcaster.subscribe() as subscription:
+        yield b': connected\n\n'
+        while True:
+            try:
+                frame = await asyncio.wait_for(
+                    subscription.queue.get(), heartbeat
+                )
+            except asyncio.TimeoutError:
+                yield b': keep-alive\n\n'
+                continue
+            if frame is None:
+                yield format_event(OVERFLOW_EVENT, '{}')
+                return
+            yield frame
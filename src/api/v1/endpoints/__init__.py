@@ -1 +1,3 @@
+from src.api.v1.endpoints.metrics import router as metrics_router  # noqa
+from src.api.v1.endpoints.monitoring import router as monitoring_router  # noqa
 from src.api.v1.endpoints.task import router as task_router  # noqa
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Response, status
+
+from src.core.config import settings
+from src.core.metrics import PROMETHEUS_MEDIA_TYPE, metrics, render
+
+router = APIRouter()
+
+
+@router.get(
+    '',
+    status_code=status.HTTP_200_OK,
+    summary='Service metrics in Prometheus format',
+    response_class=Response,
+    responses={200: {'content': {PROMETHEUS_MEDIA_TYPE: {}}}},
+)
+async def get_metrics() -> Response:
+    """
+    Retrieve metrics of all worker processes for Prometheus.
+
+    - **http_requests_total**: requests by route template and status
+    - **http_requests_in_flight**: requests being served
+    - **http_request_duration_seconds**: latency histogram
+    - **http_request_db_statements**, **http_request_db_duration_seconds**:
+      SQL statements and DB time per request
+    """
+    return Response(
+        render(metrics.collect(settings.metrics_multiproc_dir)),
+        media_type=PROMETHEUS_MEDIA_TYPE,
+    )
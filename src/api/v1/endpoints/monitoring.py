@@ -0,0 +1,43 @@
+from typing import Any
+
+from fastapi import APIRouter, status
+
+from src.crud.task import task_crud
+from src.database.db import engine
+
+router = APIRouter()
+
+
+@router.get(
+    '/cache',
+    status_code=status.HTTP_200_OK,
+    summary='Task cache statistics',
+)
+async def get_cache_stats() -> dict[str, Any]:
+    """
+    Retrieve counters of the task read cache.
+
+    - **backend**: cache backend in use
+    - **hits**, **misses**: lookups served from cache and from DB
+    - **evictions**, **expirations**, **invalidations**: dropped entries
+    Returns `{"backend": null}` if caching is disabled.
+    """
+    if task_crud.cache is None:
+        return {'backend': None}
+    return task_crud.cache.info()
+
+
+@router.get(
+    '/pool',
+    status_code=status.HTTP_200_OK,
+    summary='Database connection pool statistics',
+)
+async def get_pool_stats() -> dict[str, Any]:
+    """
+    Retrieve state and checkout statistics of the connection pool.
+
+    - **size**, **checked_out**, **checked_in**, **overflow**: pool gauges
+    - **checkouts**, **timeouts**: checkout counters
+    - **wait_time_histogram**: cumulative checkouts by wait time bound
+    """
+    return engine.pool.snapshot()
@@ -1,25 +1,106 @@
+from datetime import timedelta
+from typing import Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, status, Path
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.etag import (
+    etag_matches,
+    list_etag,
+    task_etag,
+    versions_from_if_match,
+)
+from src.api.pagination import (
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    decode_sync_token,
+    encode_cursor,
+    encode_sync_token,
+)
+from src.api.serializers import JSON_MEDIA_TYPE, dump_rows, parse_fields
+from src.api.streaming import (
+    EVENT_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    accepts_ndjson,
+    stream_events,
+    stream_ndjson,
+)
 from src.api.validators import (
+    TASK_DOES_NOT_EXIST,
     check_task_exists_by_uuid,
+    check_task_version_matches,
     completed_task_can_not_be_update,
 )
-from src.crud.task import task_crud
-from src.database.db import get_async_session
+from src.core.config import settings
+from src.crud.loader import Loader
+from src.crud.task import sync_position, task_crud
+from src.crud.task_status_counter import task_status_counter_crud
+from src.database.db import (
+    get_async_session,
+    get_primary_session,
+    get_read_session,
+)
+from src.database.enums import StatusEnum, TaskOrderingEnum
+from src.models.base import utc_now
+from src.models.task_tombstone import TaskTombstone
 from src.schemas.task import (
+    TaskBatchGetResult,
+    TaskBulkCreateError,
+    TaskBulkCreateResult,
+    TaskBulkDeleteResult,
+    TaskChanges,
     TaskCreate,
     TaskRead,
+    TaskStats,
     TaskUpdate,
     TASK_CREATE_JSON_EXAMPLES,
+    TITLE_MAX_LENGTH,
 )
 
 
 router = APIRouter()
 
 UUID_PATH_DESCRIPTION = 'Unique identifier of task instance'
+BULK_CREATE_MAX_SIZE = 10_000
+BULK_DELETE_MAX_SIZE = 10_000
+BATCH_GET_MAX_SIZE = 1000
+CLAIM_MAX_SIZE = 100
+SEARCH_QUERY_MAX_LENGTH = 256
+SEARCH_MAX_OFFSET = 10_000
+LAST_UUID = UUID(int=2 ** 128 - 1)
+FIELDS_QUERY_DESCRIPTION = (
+    'Comma separated fields to return, e.g. `uuid,title,status`'
+)
+
+
+async def get_task_loader(
+    session: AsyncSession = Depends(get_read_session),
+) -> Loader:
+    """
+    Provide a task loader scoped to the request.
+
+    Args:
+        session (AsyncSession): Read session of the request.
+
+    Returns:
+        Loader: Batching reader of tasks by UUID.
+    """
+    return Loader(task_crud, session)
 
 
 @router.get(
@@ -30,17 +111,281 @@ UUID_PATH_DESCRIPTION = 'Unique identifier of task instance'
     summary='Get all tasks'
 )
 async def get_all_tasks(
-    session: AsyncSession = Depends(get_async_session)
+    limit: int = Query(
+        DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Maximum number of tasks on the page',
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description=f'Opaque cursor from the `{NEXT_CURSOR_HEADER}` header',
+    ),
+    order_by: TaskOrderingEnum = Query(
+        TaskOrderingEnum.UUID,
+        description='Sort key, prefix with `-` for descending order',
+    ),
+    statuses: Optional[list[StatusEnum]] = Query(
+        None,
+        alias='status',
+        description='Status of tasks, repeat for many',
+    ),
+    title_prefix: Optional[str] = Query(
+        None,
+        max_length=TITLE_MAX_LENGTH,
+        description='Prefix the title of tasks starts with',
+    ),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
+    include_archived: bool = Query(
+        False,
+        description='Include archived completed tasks',
+    ),
+    accept: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session)
 ):
     """
-    Retrieve all tasks from the database.
+    Retrieve a page of tasks from the database.
+
+    - **limit**: maximum number of tasks on the page
+    - **cursor**: cursor of the next page from the previous response
+    - **order_by**: sort key (`uuid`, `title`, `status`, `-` for desc)
+    - **status**: filter by status, may be repeated
+    - **title_prefix**: filter by the beginning of the title
+    - **fields**: return only these fields of tasks
+    - **include_archived**: list archived completed tasks too
+
+    Each task has:
 
     - **uuid**: unique identifier of the task
     - **title**: short title of the task
     - **description**: optional description
     - **status**: current status (`created`, `in_progress`, `done`)
+
+    If there are more tasks, the cursor of the next page is returned
+    in the `X-Next-Cursor` header.
+
+    With `Accept: application/x-ndjson` all tasks are streamed instead,
+    one JSON object per line; `limit` and `cursor` are ignored.
+
+    The page has an `ETag`; if it matches `If-None-Match`,
+    `304 Not Modified` is returned without a body after reading only
+    the versions of the tasks.
+    """
+    fields = parse_fields(fields)
+    where = task_crud.filters(statuses, title_prefix, include_archived)
+    if accepts_ndjson(accept):
+        return StreamingResponse(
+            stream_ndjson(
+                session.bind,
+                task_crud,
+                order_by,
+                where,
+                fields,
+                include_archived,
+            ),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+    after = decode_cursor(cursor, order_by) if cursor else None
+    key_columns = (order_by.field, 'uuid', 'version')
+    column_sets = [tuple(dict.fromkeys((*fields, *key_columns)))]
+    if if_none_match:
+        # The ETag needs only versions, full rows only if it differs.
+        column_sets.insert(0, tuple(dict.fromkeys(key_columns)))
+    for columns in column_sets:
+        tasks = await task_crud.get_all(
+            session,
+            limit=limit + 1,
+            order_by=order_by.field,
+            descending=order_by.descending,
+            after=after,
+            where=where,
+            columns=columns,
+            include_archived=include_archived,
+        )
+        headers = {}
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(order_by, tasks[-1])
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        headers['ETag'] = list_etag(tasks, next_cursor)
+        if etag_matches(if_none_match, headers['ETag']):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers=headers,
+            )
+    return Response(
+        content=dump_rows(tasks, fields),
+        media_type=JSON_MEDIA_TYPE,
+        headers=headers,
+    )
+
+
+@router.get(
+    '/search',
+    status_code=status.HTTP_200_OK,
+    response_model=list[TaskRead],
+    response_model_exclude_none=True,
+    summary='Full-text search of tasks',
+)
+async def search_tasks(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=SEARCH_QUERY_MAX_LENGTH,
+        description='Words to search for in title and description',
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Maximum number of tasks on the page',
+    ),
+    offset: int = Query(
+        0,
+        ge=0,
+        le=SEARCH_MAX_OFFSET,
+        description='Number of best ranked tasks to skip',
+    ),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Search tasks by words in their title and description.
+
+    - **q**: words to search for, all of them must match
+    - **limit**: maximum number of tasks on the page
+    - **offset**: number of best ranked tasks to skip
+    Tasks are ordered by relevance.
+    """
+    return await task_crud.search(q, session, limit, offset)
+
+
+@router.get(
+    '/stats',
+    status_code=status.HTTP_200_OK,
+    response_model=TaskStats,
+    summary='Number of tasks by status',
+)
+async def get_task_stats(
+    approximate: bool = Query(
+        False,
+        description='Estimate the total from planner statistics',
+    ),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Retrieve the number of tasks with each status.
+
+    - **approximate**: take `total` from PostgreSQL statistics instead
+      of summing the counters
+    Counters are read from a table kept in sync by the writes,
+    not counted over the tasks. Archived tasks are counted too.
+    """
+    by_status = await task_status_counter_crud.get_counts(session)
+    total = None
+    if approximate:
+        total = await task_status_counter_crud.get_approximate_total(
+            session
+        )
+    return TaskStats(
+        total=sum(by_status.values()) if total is None else total,
+        by_status=by_status,
+        approximate=total is not None,
+    )
+
+
+@router.get(
+    '/changes',
+    status_code=status.HTTP_200_OK,
+    response_model=TaskChanges,
+    response_model_exclude_none=True,
+    summary='Tasks changed since a sync token',
+)
+async def get_task_changes(
+    since: Optional[str] = Query(
+        None,
+        description='`next_token` of the previous response',
+    ),
+    limit: int = Query(
+        DEFAULT_PAGE_LIMIT,
+        ge=1,
+        le=MAX_PAGE_LIMIT,
+        description='Maximum number of changes',
+    ),
+    session: AsyncSession = Depends(get_primary_session),
+):
+    """
+    Retrieve tasks changed and deleted after a sync token.
+
+    - **since**: token of the previous sync, omit for the first sync
+    - **limit**: maximum number of changed and deleted tasks
+    Repeat with `since=next_token` while `has_more` is true.
+    Returns `410 Gone` if the token is older than the tombstone
+    retention period; then reload all tasks and sync without `since`.
+    Returns `400 Bad Request` for a token from the future.
+    Reads go to the primary: a lagging replica could skip changes.
+    """
+    now = utc_now()
+    after = decode_sync_token(since) if since else None
+    if after is not None and after[0] > now:
+        raise HTTPException(
+            detail='Sync token is from the future!',
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    if after is not None and after[0] < now - timedelta(
+        seconds=settings.sync_tombstone_retention
+    ):
+        raise HTTPException(
+            detail='Sync token has expired, reload all tasks!',
+            status_code=status.HTTP_410_GONE,
+        )
+    until = now - timedelta(seconds=settings.sync_settle_window)
+    changes = await task_crud.get_changes(
+        session, until, after=after, limit=limit + 1
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if has_more:
+        position = sync_position(changes[-1])
+    else:
+        position = (until, LAST_UUID)
+    return TaskChanges(
+        changed=[
+            change for change in changes
+            if not isinstance(change, TaskTombstone)
+        ],
+        deleted=[
+            change.uuid for change in changes
+            if isinstance(change, TaskTombstone)
+        ],
+        next_token=encode_sync_token(position),
+        has_more=has_more,
+    )
+
+
+@router.get(
+    '/events',
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={200: {'content': {EVENT_STREAM_MEDIA_TYPE: {}}}},
+    summary='Live feed of task changes',
+)
+async def stream_task_events() -> StreamingResponse:
     """
-    return await task_crud.get_all(session)
+    Subscribe to created, updated and deleted tasks (Server-Sent Events).
+
+    Every event carries `{"type": ..., "items": [{"uuid", "version"}]}`,
+    deleted items have no version.
+    - **created**, **updated**, **deleted**: committed changes
+    - **resync**, **overflow**: events may have been missed, reload
+      the tasks (after `overflow` the stream is closed)
+    """
+    return StreamingResponse(
+        stream_events(task_crud.feed, settings.change_feed_heartbeat),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
 
 
 @router.get(
@@ -51,17 +396,43 @@ async def get_all_tasks(
     summary='Get tasks by unique uuid',
 )
 async def get_task_by_id(
+    response: Response,
     task_uuid: UUID = Path(..., description=UUID_PATH_DESCRIPTION),
-    session: AsyncSession = Depends(get_async_session),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """
     Retrieve a single task by its unique UUID.
 
     - **task_uuid**: unique identifier of the task
-    Returns task details if it exists, otherwise raises a 404 error.
+    - **fields**: return only these fields of the task
+    Returns task details if it exists, otherwise raises a 400 error.
+    Archived tasks are found too. Reads are served through the task cache.
+
+    The task has an `ETag`; if it matches `If-None-Match`,
+    `304 Not Modified` is returned after reading only the task version.
     """
-    await check_task_exists_by_uuid(task_uuid, session)
-    return await task_crud.get(task_uuid, session)
+    if if_none_match:
+        version = await task_crud.get_version(task_uuid, session)
+        if version is not None:
+            etag = task_etag(task_uuid, version)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={'ETag': etag},
+                )
+    columns = None
+    if fields:
+        columns = (*parse_fields(fields), 'version')
+    task = await task_crud.get_cached(task_uuid, session, columns)
+    if task is None:
+        raise HTTPException(
+            detail=TASK_DOES_NOT_EXIST.format(uuid=task_uuid),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    response.headers['ETag'] = task_etag(task_uuid, task['version'])
+    return task
 
 
 @router.post(
@@ -88,6 +459,107 @@ async def create_task(
     return await task_crud.create(create_schema, session)
 
 
+@router.post(
+    '/bulk',
+    status_code=status.HTTP_201_CREATED,
+    response_model=TaskBulkCreateResult,
+    response_model_exclude_none=True,
+    summary='Create many tasks',
+)
+async def bulk_create_tasks(
+    create_data: list[dict[str, Any]] = Body(
+        ...,
+        min_length=1,
+        max_length=BULK_CREATE_MAX_SIZE,
+    ),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Create many tasks in one transaction.
+
+    - **body**: array of task create objects (see `POST /tasks`)
+
+    Every item is validated on its own: invalid items are reported
+    in `errors` by their index, valid ones are created and returned
+    in `created` in request order.
+    """
+    create_schemas = []
+    errors = []
+    for index, item in enumerate(create_data):
+        try:
+            create_schemas.append(TaskCreate.model_validate(item))
+        except ValidationError as error:
+            errors.append(
+                TaskBulkCreateError(
+                    index=index,
+                    detail=error.errors(
+                        include_url=False, include_context=False
+                    ),
+                )
+            )
+    created = (
+        await task_crud.bulk_create(create_schemas, session)
+        if create_schemas else []
+    )
+    return TaskBulkCreateResult(created=created, errors=errors)
+
+
+@router.post(
+    '/batch-get',
+    status_code=status.HTTP_200_OK,
+    response_model=TaskBatchGetResult,
+    response_model_exclude_none=True,
+    summary='Get many tasks by UUIDs',
+)
+async def batch_get_tasks(
+    uuids: list[UUID] = Body(
+        ...,
+        min_length=1,
+        max_length=BATCH_GET_MAX_SIZE,
+    ),
+    loader: Loader = Depends(get_task_loader),
+):
+    """
+    Retrieve many tasks by their UUIDs in one query.
+
+    - **body**: array of task UUIDs
+    Returns found tasks in request order and UUIDs of tasks that do
+    not exist. Archived tasks are found too.
+    """
+    uuids = list(dict.fromkeys(uuids))
+    tasks = await loader.load_many(uuids)
+    return TaskBatchGetResult(
+        found=[task for task in tasks if task is not None],
+        missing=[uuid for uuid, task in zip(uuids, tasks) if task is None],
+    )
+
+
+@router.post(
+    '/claim',
+    status_code=status.HTTP_200_OK,
+    response_model=list[TaskRead],
+    response_model_exclude_none=True,
+    summary='Claim created tasks for processing',
+)
+async def claim_tasks(
+    n: int = Query(
+        1,
+        ge=1,
+        le=CLAIM_MAX_SIZE,
+        description='Maximum number of tasks to claim',
+    ),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Atomically move up to `n` of the oldest created tasks to in progress.
+
+    - **n**: maximum number of tasks to claim
+    Concurrent workers never get the same task. Returns the claimed
+    tasks, oldest first; an empty list if there is nothing to do.
+    """
+    return await task_crud.claim(n, session)
+
+
 @router.patch(
     '/{task_uuid}',
     status_code=status.HTTP_200_OK,
@@ -97,7 +569,9 @@ async def create_task(
 )
 async def update_task(
     update_schema: TaskUpdate,
+    response: Response,
     task_uuid: UUID = Path(..., description=UUID_PATH_DESCRIPTION),
+    if_match: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_async_session)
 ):
     """
@@ -106,14 +580,23 @@ async def update_task(
     - **task_uuid**: unique identifier of the task
     - **update_schema**: fields to update
     Completed tasks cannot be updated.
+
+    With `If-Match` the task is updated only if its `ETag` still
+    matches, otherwise `412 Precondition Failed` is returned.
     """
-    task = await check_task_exists_by_uuid(task_uuid, session)
-    await completed_task_can_not_be_update(task, session)
-    return await task_crud.update(
-        task,
+    versions = versions_from_if_match(if_match, task_uuid)
+    task = await task_crud.update_not_completed(
+        task_uuid,
         update_schema,
         session,
+        versions=versions,
     )
+    if task is None:
+        task = await check_task_exists_by_uuid(task_uuid, session)
+        await completed_task_can_not_be_update(task, session)
+        await check_task_version_matches(task, versions)
+    response.headers['ETag'] = task_etag(task.uuid, task.version)
+    return task
 
 
 @router.delete(
@@ -131,8 +614,38 @@ async def delete_task(
     - **task_uuid**: unique identifier of the task
     Removes the task from the database if it exists.
     """
-    await check_task_exists_by_uuid(task_uuid, session)
-    return await task_crud.delete(
-        await task_crud.get(task_uuid, session),
-        session,
+    if await task_crud.delete_by_uuid(task_uuid, session) is None:
+        raise HTTPException(
+            detail=TASK_DOES_NOT_EXIST.format(uuid=task_uuid),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+@router.delete(
+    '',
+    status_code=status.HTTP_200_OK,
+    response_model=TaskBulkDeleteResult,
+    summary='Delete many tasks',
+)
+async def bulk_delete_tasks(
+    uuids: list[UUID] = Query(
+        ...,
+        alias='uuid',
+        min_length=1,
+        max_length=BULK_DELETE_MAX_SIZE,
+        description='Unique identifiers of tasks, repeat for many',
+    ),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Delete many tasks by their UUIDs in one statement.
+
+    - **uuid**: unique identifier of a task, may be repeated
+    Returns deleted UUIDs and UUIDs of tasks that did not exist.
+    """
+    uuids = list(dict.fromkeys(uuids))
+    deleted = set(await task_crud.delete_many(uuids, session))
+    return TaskBulkDeleteResult(
+        deleted=[uuid for uuid in uuids if uuid in deleted],
+        missing=[uuid for uuid in uuids if uuid not in deleted],
     )
@@ -1,3 +1,4 @@
+from typing import Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -7,6 +8,8 @@ from src.crud.task import task_crud
 from src.database.enums import StatusEnum
 from src.models.task import Task
 
+TASK_DOES_NOT_EXIST = 'Task instance with uuid = {uuid} does not exist!'
+
 
 async def check_task_exists_by_uuid(
     task_uuid: UUID,
@@ -15,6 +18,8 @@ async def check_task_exists_by_uuid(
     """
     Check if a task exists by its UUID.
 
+    Archived tasks are found too.
+
     Args:
         task_uuid (UUID): Unique identifier of the task.
         session (AsyncSession): SQLAlchemy asynchronous session.
@@ -23,12 +28,12 @@ async def check_task_exists_by_uuid(
         HTTPException: If the task with given UUID does not exist (status 400).
 
     Returns:
-        Task: The task instance from the database.
+        Task | TaskArchive: The task instance from the database.
     """
-    task = await task_crud.get(task_uuid, session)
+    task = await task_crud.get(task_uuid, session, include_archived=True)
     if not task:
         raise HTTPException(
-            detail=f'Task instance with uuid = {task_uuid} does not exist!',
+            detail=TASK_DOES_NOT_EXIST.format(uuid=task_uuid),
             status_code=status.HTTP_400_BAD_REQUEST
         )
     return task
@@ -53,3 +58,25 @@ async def completed_task_can_not_be_update(
             detail=f'Task `{task.title}` has been already completed!',
             status_code=status.HTTP_400_BAD_REQUEST
         )
+
+
+async def check_task_version_matches(
+    task: Task,
+    versions: Optional[Sequence[int]],
+) -> None:
+    """
+    Raise an exception if a task has not one of the expected versions.
+
+    Args:
+        task (Task): Task instance to check.
+        versions (Sequence[int] | None): Versions from `If-Match` header,
+            any version is accepted if None.
+
+    Raises:
+        HTTPException: If the task has been modified (status 412).
+    """
+    if versions is not None and task.version not in versions:
+        raise HTTPException(
+            detail=f'Task `{task.title}` has been modified!',
+            status_code=status.HTTP_412_PRECONDITION_FAILED
+        )
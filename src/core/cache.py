@@ -0,0 +1,269 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.util import await_only
+
+from src.core.config import Settings
+
+PENDING_INVALIDATIONS_KEY = 'pending_invalidations'
+
+
+class CacheStats:
+    """
+    Counters of a cache instance.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups not found in the cache or expired.
+        evictions (int): Entries dropped to keep the cache bounded.
+        expirations (int): Entries dropped because their TTL passed.
+        invalidations (int): Entries dropped explicitly after writes.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """
+        Return counters as a dictionary.
+
+        Returns:
+            dict[str, int]: Counter values by name.
+        """
+        return dict(vars(self))
+
+
+class BaseCache(ABC):
+    """
+    Interface of a key-value cache for model records.
+
+    Values are plain dictionaries of column values.
+
+    Attributes:
+        ttl (float): Lifetime of an entry in seconds.
+        stats (CacheStats): Cache counters.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return a cached value or None."""
+
+    @abstractmethod
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store a value for `ttl` seconds."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Drop values by keys."""
+
+    async def delete_on_commit(
+        self,
+        session: AsyncSession,
+        *keys: str,
+    ) -> None:
+        """
+        Drop values by keys once the transaction of `session` commits.
+
+        Dropping them earlier would let a concurrent read put the old
+        values back until `ttl` passes. Without a transaction the
+        values are dropped at once.
+
+        Args:
+            session (AsyncSession): Session of the write transaction.
+            *keys (str): Keys of changed values.
+        """
+        sync_session = session.sync_session
+        transaction = (
+            sync_session.get_nested_transaction()
+            or sync_session.get_transaction()
+        )
+        if transaction is None:
+            await self.delete(*keys)
+            return
+        sync_session.info.setdefault(
+            PENDING_INVALIDATIONS_KEY, {}
+        ).setdefault(transaction, []).append((self, keys))
+
+    def info(self) -> dict[str, Any]:
+        """
+        Describe the cache for telemetry.
+
+        Returns:
+            dict[str, Any]: Backend name, settings and counters.
+        """
+        return {
+            'backend': type(self).__name__,
+            'ttl': self.ttl,
+            **self.stats.as_dict(),
+        }
+
+
+class MemoryCache(BaseCache):
+    """
+    Bounded in-process LRU cache with TTL.
+
+    Each worker process has its own copy, so entries written by other
+    workers are only refreshed after `ttl` seconds.
+
+    Attributes:
+        max_size (int): Maximum number of entries.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        super().__init__(ttl)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def info(self) -> dict[str, Any]:
+        return {
+            **super().info(),
+            'size': len(self._entries),
+            'max_size': self.max_size,
+        }
+
+
+class RedisCache(BaseCache):
+    """
+    Cache shared by all workers in a Redis-protocol server.
+
+    Eviction is done by the server, so `evictions` is not counted here.
+
+    Attributes:
+        client: Async client with `get`, `set` and `delete` methods
+            (e.g. `redis.asyncio.Redis`).
+        prefix (str): Prefix of all keys written by the cache.
+    """
+
+    def __init__(self, client, ttl: float, prefix: str = 'issue_manager:'):
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(raw)
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        await self.client.set(
+            self.prefix + key,
+            json.dumps(value, default=str),
+            px=int(self.ttl * 1000),
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            self.stats.invalidations += await self.client.delete(
+                *(self.prefix + key for key in keys)
+            )
+
+
+@event.listens_for(Session, 'after_commit')
+def _delete_pending_keys(session: Session) -> None:
+    """
+    Drop cached values changed by the outermost transaction on commit.
+
+    Keys of a released SAVEPOINT move to the enclosing transaction,
+    so they are dropped with it or kept if it rolls back. Runs inside
+    the commit of an AsyncSession, which awaits the deletes.
+    """
+    pending = session.info.get(PENDING_INVALIDATIONS_KEY)
+    if not pending:
+        return
+    transaction = (
+        session.get_nested_transaction() or session.get_transaction()
+    )
+    invalidations = pending.pop(transaction, ())
+    if transaction is not None and transaction.nested:
+        pending.setdefault(transaction.parent, []).extend(invalidations)
+        return
+    for cache, keys in invalidations:
+        await_only(cache.delete(*keys))
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard_pending_keys(
+    session: Session,
+    transaction: SessionTransaction,
+) -> None:
+    """Forget cache invalidations of a transaction that did not commit."""
+    pending = session.info.get(PENDING_INVALIDATIONS_KEY)
+    if pending:
+        pending.pop(transaction, None)
+
+
+def build_cache(settings: Settings) -> Optional[BaseCache]:
+    """
+    Create the cache selected by application settings.
+
+    Args:
+        settings (Settings): Application settings.
+
+    Raises:
+        RuntimeError: If the `redis` backend is selected but the `redis`
+            package is not installed.
+        ValueError: If the backend name is unknown.
+
+    Returns:
+        BaseCache | None: Cache instance, or None if caching is disabled.
+    """
+    if settings.cache_backend == 'none':
+        return None
+    if settings.cache_backend == 'memory':
+        return MemoryCache(settings.cache_max_size, settings.cache_ttl)
+    if settings.cache_backend == 'redis':
+        try:
+            from redis import asyncio as aioredis
+        except ImportError:
+            raise RuntimeError(
+                'Install `redis` package to use the redis cache backend!'
+            )
+        return RedisCache(
+            aioredis.from_url(settings.cache_redis_url),
+            settings.cache_ttl,
+        )
+    raise ValueError(f'Unknown cache backend `{settings.cache_backend}`!')
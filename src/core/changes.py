@@ -0,0 +1,283 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_BATCH_SIZE = 100
+LISTENER_RECONNECT_DELAY = 1.0
+PENDING_CHANGES_KEY = 'pending_changes'
+RESYNC_EVENT = 'resync'
+
+
+def format_event(event_type: str, data: str) -> bytes:
+    """
+    Format a Server-Sent Events frame.
+
+    Args:
+        event_type (str): Name of the event.
+        data (str): Single line JSON payload.
+
+    Returns:
+        bytes: UTF-8 encoded frame.
+    """
+    return f'event: {event_type}\ndata: {data}\n\n'.encode()
+
+
+class Subscription:
+    """
+    Bounded queue of event frames of a single client.
+
+    Attributes:
+        queue (asyncio.Queue): Frames waiting to be sent, None marks
+            the end of a subscription that fell too far behind.
+        max_size (int): Maximum number of waiting frames.
+    """
+
+    def __init__(self, max_size: int):
+        self.queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(
+            max_size + 1
+        )
+        self.max_size = max_size
+
+    def put(self, frame: Optional[bytes]) -> bool:
+        """
+        Queue a frame without waiting.
+
+        Args:
+            frame (bytes | None): Event frame.
+
+        Returns:
+            bool: False if the queue is full and the subscription has
+                been closed instead.
+        """
+        if frame is not None and self.queue.qsize() >= self.max_size:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return False
+        self.queue.put_nowait(frame)
+        return True
+
+
+class Broadcaster:
+    """
+    In-process fan-out of event frames to subscribed clients.
+
+    A client that does not read fast enough is disconnected once
+    `queue_size` frames are waiting for it, so one slow consumer can
+    neither block publishers nor grow memory without bound.
+
+    Attributes:
+        queue_size (int): Maximum frames waiting for a client.
+        subscriptions (set[Subscription]): Active subscriptions.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.subscriptions: set[Subscription] = set()
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[Subscription]:
+        """
+        Receive published frames until the context exits.
+
+        Yields:
+            Subscription: Queue of the client.
+        """
+        subscription = Subscription(self.queue_size)
+        self.subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self.subscriptions.discard(subscription)
+
+    def publish(self, frame: bytes) -> None:
+        """
+        Send a frame to all subscriptions.
+
+        Args:
+            frame (bytes): Formatted event frame.
+        """
+        for subscription in list(self.subscriptions):
+            if not subscription.put(frame):
+                self.subscriptions.discard(subscription)
+                logger.warning(
+                    'Dropped a change feed subscriber lagging behind '
+                    'by %d events',
+                    self.queue_size,
+                )
+
+
+class ChangeFeed:
+    """
+    Feed of committed changes of a model.
+
+    CRUD write paths call `publish` inside their transaction. On
+    PostgreSQL events are sent with `pg_notify`, delivered on commit,
+    and every worker process keeps a single `LISTEN` connection that
+    feeds its broadcaster. Other databases publish straight to the
+    broadcaster of the current process after the outermost commit;
+    events of rolled back SAVEPOINTs are dropped.
+
+    Attributes:
+        channel (str): Name of the notification channel.
+        broadcaster (Broadcaster): Fan-out to clients of this worker.
+    """
+
+    def __init__(self, channel: str, queue_size: int):
+        self.channel = channel
+        self.broadcaster = Broadcaster(queue_size)
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(
+        self,
+        session: AsyncSession,
+        event_type: str,
+        items: Sequence[dict[str, Any]],
+    ) -> None:
+        """
+        Publish changed records when the transaction commits.
+
+        Args:
+            session (AsyncSession): Session of the write transaction.
+            event_type (str): `created`, `updated` or `deleted`.
+            items (Sequence[dict]): JSON-ready identities of the records.
+        """
+        payloads = [
+            json.dumps(
+                {
+                    'type': event_type,
+                    'items': list(items[start:start + NOTIFY_BATCH_SIZE]),
+                },
+                default=str,
+            )
+            for start in range(0, len(items), NOTIFY_BATCH_SIZE)
+        ]
+        if session.bind.dialect.name == 'postgresql':
+            for payload in payloads:
+                await session.execute(
+                    select(func.pg_notify(self.channel, payload))
+                )
+            return
+        sync_session = session.sync_session
+        transaction = (
+            sync_session.get_nested_transaction()
+            or sync_session.get_transaction()
+        )
+        if transaction is None:
+            for payload in payloads:
+                self.dispatch(payload)
+            return
+        sync_session.info.setdefault(PENDING_CHANGES_KEY, {}).setdefault(
+            transaction, []
+        ).extend((self, payload) for payload in payloads)
+
+    def dispatch(self, payload: str) -> None:
+        """
+        Broadcast a committed change to clients of this worker.
+
+        Args:
+            payload (str): JSON payload of the change.
+        """
+        try:
+            event_type = json.loads(payload)['type']
+        except (ValueError, KeyError, TypeError):
+            logger.warning('Ignored malformed change payload %r', payload)
+            return
+        self.broadcaster.publish(format_event(event_type, payload))
+
+    async def start(self, engine: AsyncEngine) -> None:
+        """
+        Start listening for changes of all workers on PostgreSQL.
+
+        Args:
+            engine (AsyncEngine): Engine of the primary database.
+        """
+        if engine.dialect.name == 'postgresql' and self._listener is None:
+            self._listener = asyncio.create_task(self._listen(engine))
+
+    async def stop(self) -> None:
+        """Stop the `LISTEN` connection of this worker."""
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    async def _listen(self, engine: AsyncEngine) -> None:
+        """
+        Keep a dedicated `LISTEN` connection, reconnecting on failure.
+
+        Clients get a `resync` event after a reconnect, because changes
+        committed while the connection was down are lost.
+        """
+        import asyncpg
+
+        dsn = engine.url.set(drivername='postgresql').render_as_string(
+            hide_password=False
+        )
+        reconnected = False
+        while True:
+            try:
+                connection = await asyncpg.connect(dsn)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception('Change feed listener failed to connect')
+                await asyncio.sleep(LISTENER_RECONNECT_DELAY)
+                continue
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            try:
+                await connection.add_listener(
+                    self.channel,
+                    lambda _, __, ___, payload: self.dispatch(payload),
+                )
+                if reconnected:
+                    self.broadcaster.publish(
+                        format_event(RESYNC_EVENT, '{}')
+                    )
+                reconnected = True
+                await closed.wait()
+                logger.warning('Change feed listener connection lost')
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(LISTENER_RECONNECT_DELAY)
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_pending_changes(session: Session) -> None:
+    """
+    Broadcast in-process changes once the outermost transaction commits.
+
+    Changes of a released SAVEPOINT move to the enclosing transaction,
+    so they are broadcast with it or dropped if it rolls back.
+    """
+    pending = session.info.get(PENDING_CHANGES_KEY)
+    if not pending:
+        return
+    transaction = (
+        session.get_nested_transaction() or session.get_transaction()
+    )
+    changes = pending.pop(transaction, ())
+    if transaction is not None and transaction.nested:
+        pending.setdefault(transaction.parent, []).extend(changes)
+        return
+    for feed, payload in changes:
+        feed.dispatch(payload)
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _discard_pending_changes(
+    session: Session,
+    transaction: SessionTransaction,
+) -> None:
+    """Forget in-process changes of a transaction that did not commit."""
+    pending = session.info.get(PENDING_CHANGES_KEY)
+    if pending:
+        pending.pop(transaction, None)
@@ -25,6 +25,76 @@ class Settings(BaseSettings):
             - (used in debug mode).
         debug (bool): Debug mode flag.
             - If True, use SQLite; otherwise, use production DB.
+        db_pool_size (int): Number of connections kept in the pool.
+        db_max_overflow (int): Connections allowed above `db_pool_size`.
+        db_pool_timeout (float): Seconds to wait for a free connection.
+        db_pool_recycle (int): Seconds after which a connection is
+            replaced, -1 disables recycling.
+        db_pool_pre_ping (bool): Test connections on checkout.
+        db_statement_cache_size (int): Size of asyncpg prepared
+            statement cache, 0 for PgBouncer in transaction mode.
+        db_replica_urls (str): Comma separated URLs of read replicas.
+        db_replica_max_lag (float): Maximum tolerated replication lag
+            of a replica in seconds, 0 disables the check.
+        db_replica_health_check_interval (float): Seconds between
+            health checks of a replica.
+        db_replica_health_check_timeout (float): Seconds a health check
+            may take before the replica counts as unhealthy.
+        db_read_your_writes_window (float): Seconds after a write of
+            a client during which its reads stay on the primary, tracked
+            by the `last_write_at` cookie; 0 disables it.
+        cache_backend (str): Backend of the task read cache.
+            - `memory`, `redis` or `none`.
+        cache_max_size (int): Maximum number of entries in memory cache.
+        cache_ttl (float): Lifetime of a cache entry in seconds.
+        cache_redis_url (str): Redis URL for the `redis` cache backend.
+        stats_reconcile_interval (float): Seconds between recounts of
+            task status counters, 0 (default) disables the job. The
+            triggers keep the counters exact, the job only repairs
+            drift after manual edits of the tables.
+        metrics_multiproc_dir (str): Directory where worker processes
+            share metrics, empty for a single worker.
+        metrics_flush_interval (float): Seconds between writes of
+            worker metrics into `metrics_multiproc_dir`.
+        query_accounting (bool): Add `Server-Timing` headers and warn
+            about repeated statements (for development).
+        query_repeat_threshold (int): Executions of one statement per
+            request above which a warning is logged.
+        change_feed_queue_size (int): Events waiting for a change feed
+            client before it is disconnected.
+        change_feed_heartbeat (float): Seconds without events before
+            a keep-alive is sent to change feed clients.
+        sync_tombstone_retention (float): Seconds tombstones of deleted
+            tasks are kept, older sync tokens require a full reload.
+        sync_tombstone_purge_interval (float): Seconds between purges
+            of expired tombstones, 0 disables the job.
+        sync_settle_window (float): Seconds changes must be old before
+            they are returned by delta sync, so that transactions that
+            commit late are not skipped.
+        write_coalescing (bool): Commit concurrent task writes together.
+        write_coalescing_window (float): Seconds a write waits for others
+            to share its commit.
+        write_coalescing_max_batch (int): Writes committed together at
+            most.
+        task_uuid_version (int): Version of new task UUIDs.
+            - `4` for random, `7` for time-ordered ones that keep
+              inserts at the end of the primary key index.
+        archive_after (float): Seconds after their last change completed
+            tasks are moved to the archive table.
+        archive_interval (float): Seconds between runs of the archival
+            job, 0 disables it.
+        archive_batch_size (int): Tasks archived per transaction.
+        sqlite_tuning (bool): Apply the SQLite pragmas below to every
+            connection and queue write sessions of the process.
+        sqlite_journal_mode (str): `journal_mode`, WAL lets readers
+            run alongside the writer.
+        sqlite_synchronous (str): `synchronous`, NORMAL syncs the WAL
+            on checkpoints only.
+        sqlite_mmap_size (int): `mmap_size` in bytes.
+        sqlite_cache_size (int): `cache_size`, negative in KiB.
+        sqlite_busy_timeout (int): `busy_timeout` in milliseconds.
+        sqlite_single_writer (bool): Queue write transactions of the
+            process so that only one at a time holds the write lock.
     """
 
     fastapi_title: str = os.getenv('FASTAPI_TITLE', 'Issue_manager')
@@ -36,8 +106,93 @@ class Settings(BaseSettings):
     db_host: str = os.getenv('DB_HOST', 'db')
     db_port: str = os.getenv('DB_PORT', '5432')
     db_name: str = os.getenv('DB_NAME', 'db')
-    local_db_url: str = 'sqlite+aiosqlite:///issue_megener.db'
+    local_db_url: str = os.getenv(
+        'LOCAL_DB_URL', 'sqlite+aiosqlite:///issue_megener.db'
+    )
     debug: bool = bool(os.getenv('DEBUG', 'True'))
+    db_pool_size: int = int(os.getenv('DB_POOL_SIZE', '5'))
+    db_max_overflow: int = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+    db_pool_timeout: float = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+    db_pool_recycle: int = int(os.getenv('DB_POOL_RECYCLE', '-1'))
+    db_pool_pre_ping: bool = (
+        os.getenv('DB_POOL_PRE_PING', 'False').lower() in ('1', 'true')
+    )
+    db_statement_cache_size: int = int(
+        os.getenv('DB_STATEMENT_CACHE_SIZE', '100')
+    )
+    db_replica_urls: str = os.getenv('DB_REPLICA_URLS', '')
+    db_replica_max_lag: float = float(os.getenv('DB_REPLICA_MAX_LAG', '5'))
+    db_replica_health_check_interval: float = float(
+        os.getenv('DB_REPLICA_HEALTH_CHECK_INTERVAL', '5')
+    )
+    db_replica_health_check_timeout: float = float(
+        os.getenv('DB_REPLICA_HEALTH_CHECK_TIMEOUT', '0.5')
+    )
+    db_read_your_writes_window: float = float(
+        os.getenv('DB_READ_YOUR_WRITES_WINDOW', '1')
+    )
+    cache_backend: str = os.getenv('CACHE_BACKEND', 'memory')
+    cache_max_size: int = int(os.getenv('CACHE_MAX_SIZE', '10000'))
+    cache_ttl: float = float(os.getenv('CACHE_TTL', '60'))
+    cache_redis_url: str = os.getenv(
+        'CACHE_REDIS_URL', 'redis://localhost:6379/0'
+    )
+    stats_reconcile_interval: float = float(
+        os.getenv('STATS_RECONCILE_INTERVAL', '0')
+    )
+    metrics_multiproc_dir: str = os.getenv('METRICS_MULTIPROC_DIR', '')
+    metrics_flush_interval: float = float(
+        os.getenv('METRICS_FLUSH_INTERVAL', '5')
+    )
+    query_accounting: bool = (
+        os.getenv('QUERY_ACCOUNTING', 'False').lower() in ('1', 'true')
+    )
+    query_repeat_threshold: int = int(
+        os.getenv('QUERY_REPEAT_THRESHOLD', '10')
+    )
+    change_feed_queue_size: int = int(
+        os.getenv('CHANGE_FEED_QUEUE_SIZE', '1000')
+    )
+    change_feed_heartbeat: float = float(
+        os.getenv('CHANGE_FEED_HEARTBEAT', '15')
+    )
+    sync_tombstone_retention: float = float(
+        os.getenv('SYNC_TOMBSTONE_RETENTION', str(30 * 24 * 3600))
+    )
+    sync_tombstone_purge_interval: float = float(
+        os.getenv('SYNC_TOMBSTONE_PURGE_INTERVAL', '3600')
+    )
+    sync_settle_window: float = float(
+        os.getenv('SYNC_SETTLE_WINDOW', '2')
+    )
+    write_coalescing: bool = (
+        os.getenv('WRITE_COALESCING', 'False').lower() in ('1', 'true')
+    )
+    write_coalescing_window: float = float(
+        os.getenv('WRITE_COALESCING_WINDOW', '0.002')
+    )
+    write_coalescing_max_batch: int = int(
+        os.getenv('WRITE_COALESCING_MAX_BATCH', '64')
+    )
+    task_uuid_version: int = int(os.getenv('TASK_UUID_VERSION', '4'))
+    archive_after: float = float(
+        os.getenv('ARCHIVE_AFTER', str(30 * 24 * 3600))
+    )
+    archive_interval: float = float(os.getenv('ARCHIVE_INTERVAL', '3600'))
+    archive_batch_size: int = int(os.getenv('ARCHIVE_BATCH_SIZE', '1000'))
+    sqlite_tuning: bool = (
+        os.getenv('SQLITE_TUNING', 'True').lower() in ('1', 'true')
+    )
+    sqlite_journal_mode: str = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    sqlite_synchronous: str = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    sqlite_mmap_size: int = int(
+        os.getenv('SQLITE_MMAP_SIZE', str(256 * 2 ** 20))
+    )
+    sqlite_cache_size: int = int(os.getenv('SQLITE_CACHE_SIZE', '-65536'))
+    sqlite_busy_timeout: int = int(os.getenv('SQLITE_BUSY_TIMEOUT', '5000'))
+    sqlite_single_writer: bool = (
+        os.getenv('SQLITE_SINGLE_WRITER', 'True').lower() in ('1', 'true')
+    )
 
     @property
     def get_db_url(self):
@@ -68,5 +223,61 @@ class Settings(BaseSettings):
                 f'{self.db_name}'
             )
 
+    @property
+    def get_db_replica_urls(self) -> list[str]:
+        """
+        URLs of read replicas.
+
+        Replicas are used only with the production database.
+
+        Returns:
+            list[str]: Replica URLs, empty if there are no replicas.
+        """
+        if self.debug:
+            return []
+        return [
+            url.strip() for url in self.db_replica_urls.split(',')
+            if url.strip()
+        ]
+
+    @property
+    def get_engine_options(self) -> dict:
+        """
+        Keyword arguments of `create_async_engine` for the database.
+
+        Returns:
+            dict: Pool settings and driver connect arguments.
+        """
+        options = {
+            'pool_size': self.db_pool_size,
+            'max_overflow': self.db_max_overflow,
+            'pool_timeout': self.db_pool_timeout,
+            'pool_recycle': self.db_pool_recycle,
+            'pool_pre_ping': self.db_pool_pre_ping,
+        }
+        if not self.debug and self.db_driver == 'asyncpg':
+            options['connect_args'] = {
+                'statement_cache_size': self.db_statement_cache_size,
+            }
+        return options
+
+    @property
+    def get_sqlite_pragmas(self) -> dict:
+        """
+        PRAGMA values applied to new SQLite connections.
+
+        Returns:
+            dict: Values by pragma name, empty if tuning is disabled.
+        """
+        if not self.sqlite_tuning:
+            return {}
+        return {
+            'journal_mode': self.sqlite_journal_mode,
+            'synchronous': self.sqlite_synchronous,
+            'mmap_size': self.sqlite_mmap_size,
+            'cache_size': self.sqlite_cache_size,
+            'busy_timeout': self.sqlite_busy_timeout,
+        }
+
 
 settings = Settings()
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.crud.task import task_crud
+from src.crud.task_status_counter import task_status_counter_crud
+from src.database.db import write_session
+from src.models.base import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(
+    job: Callable[[], Awaitable[None]],
+    interval: float,
+) -> None:
+    """
+    Run a background job every `interval` seconds until cancelled.
+
+    Errors of a single run are logged and do not stop the loop.
+
+    Args:
+        job (Callable): Coroutine function without arguments.
+        interval (float): Pause between runs in seconds.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await job()
+        except Exception:
+            logger.exception('Background job %s failed', job.__name__)
+
+
+async def reconcile_task_status_counters() -> None:
+    """Recount tasks by status and fix drifted counters."""
+    async with write_session() as session:
+        await task_status_counter_crud.reconcile(session)
+
+
+async def purge_task_tombstones() -> None:
+    """Delete tombstones of tasks older than the sync retention period."""
+    async with write_session() as session:
+        await task_crud.purge_tombstones(
+            session,
+            utc_now() - timedelta(seconds=settings.sync_tombstone_retention),
+        )
+
+
+async def flush_metrics() -> None:
+    """Share metrics of this worker with other worker processes."""
+    metrics.flush(settings.metrics_multiproc_dir)
+
+
+async def archive_completed_tasks() -> None:
+    """
+    Move old completed tasks to the archive in bounded batches.
+
+    Every batch is a transaction of its own, so writers of requests
+    get their turn between batches.
+    """
+    before = utc_now() - timedelta(seconds=settings.archive_after)
+    archived = settings.archive_batch_size
+    while archived == settings.archive_batch_size:
+        async with write_session() as session:
+            archived = await task_crud.archive_completed(
+                before, settings.archive_batch_size, session
+            )
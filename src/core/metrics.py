@@ -0,0 +1,468 @@
+import json
+import logging
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PROMETHEUS_MEDIA_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = '<unmatched>'
+SNAPSHOT_FILE_PREFIX = 'metrics_'
+
+METRIC_FAMILIES = {
+    'http_requests_total': (
+        'counter', 'HTTP requests by route and status code.'
+    ),
+    'http_requests_in_flight': (
+        'gauge', 'HTTP requests being served.'
+    ),
+    'http_request_duration_seconds': (
+        'histogram', 'HTTP request latency in seconds.'
+    ),
+    'http_request_db_statements': (
+        'histogram', 'SQL statements executed per HTTP request.'
+    ),
+    'http_request_db_duration_seconds': (
+        'histogram', 'Time spent in SQL statements per HTTP request.'
+    ),
+    'db_write_batch_size': (
+        'histogram', 'Writes committed together by group commit.'
+    ),
+}
+HISTOGRAM_SUFFIXES = ('_bucket', '_sum', '_count')
+
+Labels = tuple[tuple[str, str], ...]
+SampleKey = tuple[str, Labels]
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """
+    Database work done while serving a single HTTP request.
+
+    Attributes:
+        db_statements (int): Number of executed SQL statements.
+        db_time (float): Seconds spent executing SQL statements.
+        serialize_time (float): Seconds spent serializing responses.
+        statements (Counter[str] | None): Executions by statement text,
+            None if statements are not tracked.
+        started_at (float): Performance counter at request start.
+    """
+
+    def __init__(self, track_statements: bool = False):
+        self.db_statements = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.statements: Optional[Counter[str]] = (
+            Counter() if track_statements else None
+        )
+        self.started_at = time.perf_counter()
+
+    def server_timing(self) -> str:
+        """
+        Build a `Server-Timing` header value of the work done so far.
+
+        Returns:
+            str: Header value with `db`, `serialize` and `total` metrics
+                in milliseconds.
+        """
+        total = time.perf_counter() - self.started_at
+        return (
+            f'db;dur={self.db_time * 1000:.3f};'
+            f'desc="{self.db_statements} statements", '
+            f'serialize;dur={self.serialize_time * 1000:.3f}, '
+            f'total;dur={total * 1000:.3f}'
+        )
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Find statements executed more than `threshold` times.
+
+        Args:
+            threshold (int): Maximum expected executions of a statement.
+
+        Returns:
+            list[tuple[str, int]]: Statement texts with execution counts,
+                most frequent first.
+        """
+        if self.statements is None:
+            return []
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    'current_request_stats', default=None
+)
+
+
+@contextmanager
+def measure_serialization() -> Iterator[None]:
+    """Count the time of the block as serialization of the request."""
+    stats = current_request_stats.get()
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            stats.serialize_time += time.perf_counter() - started_at
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value or bucket bound for the text format."""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return (
+        value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+    )
+
+
+def _family(name: str) -> str:
+    """Return the metric family of a sample name."""
+    for suffix in HISTOGRAM_SUFFIXES:
+        base = name.removesuffix(suffix)
+        if base != name and base in METRIC_FAMILIES:
+            return base
+    return name
+
+
+def _is_gauge(name: str) -> bool:
+    """Check whether a sample belongs to a gauge."""
+    return METRIC_FAMILIES.get(_family(name), ('',))[0] == 'gauge'
+
+
+def _pid_is_alive(pid: int) -> bool:
+    """Check whether a process with the given pid exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """
+    Samples of the metrics collected by this worker process.
+
+    With several worker processes every worker periodically writes its
+    samples into a shared directory, and a scrape served by any worker
+    merges the snapshots of all workers: counters and histograms are
+    summed over all snapshots, gauges only over live workers.
+
+    Attributes:
+        samples (dict): Sample values by `(name, labels)`.
+    """
+
+    def __init__(self):
+        self.samples: dict[SampleKey, float] = {}
+
+    def inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        """
+        Add a value to a counter or gauge sample.
+
+        Args:
+            name (str): Sample name.
+            labels (Labels): Label pairs of the sample.
+            value (float): Increment, negative to decrease a gauge.
+        """
+        key = (name, labels)
+        self.samples[key] = self.samples.get(key, 0) + value
+
+    def observe(
+        self,
+        name: str,
+        labels: Labels,
+        value: float,
+        buckets: Iterable[float],
+    ) -> None:
+        """
+        Record a value in a histogram.
+
+        Args:
+            name (str): Histogram family name.
+            labels (Labels): Label pairs of the histogram.
+            value (float): Observed value.
+            buckets (Iterable[float]): Upper bounds of the buckets.
+        """
+        for bound in (*buckets, float('inf')):
+            self.inc(
+                f'{name}_bucket',
+                (*labels, ('le', _format_value(bound))),
+                value <= bound,
+            )
+        self.inc(f'{name}_sum', labels, value)
+        self.inc(f'{name}_count', labels)
+
+    def snapshot_path(self, directory: str, pid: int) -> str:
+        """Return the snapshot file of a worker process."""
+        return os.path.join(directory, f'{SNAPSHOT_FILE_PREFIX}{pid}.json')
+
+    def flush(self, directory: str, final: bool = False) -> None:
+        """
+        Write samples of this worker into a snapshot file.
+
+        Args:
+            directory (str): Directory shared by all workers.
+            final (bool): Drop gauges because the worker is stopping.
+        """
+        path = self.snapshot_path(directory, os.getpid())
+        samples = [
+            [name, labels, value]
+            for (name, labels), value in self.samples.items()
+            if not (final and _is_gauge(name))
+        ]
+        with open(f'{path}.tmp', 'w') as file:
+            json.dump(samples, file)
+        os.replace(f'{path}.tmp', path)
+
+    def collect(self, directory: Optional[str] = None) -> dict:
+        """
+        Gather samples of all workers.
+
+        Args:
+            directory (str | None): Directory with snapshots of other
+                workers, None for a single worker.
+
+        Returns:
+            dict: Sample values by `(name, labels)`.
+        """
+        merged = dict(self.samples)
+        if not directory:
+            return merged
+        for file_name in sorted(os.listdir(directory)):
+            pid = file_name.removeprefix(SNAPSHOT_FILE_PREFIX)
+            pid = pid.removesuffix('.json')
+            if not (
+                file_name.startswith(SNAPSHOT_FILE_PREFIX)
+                and file_name.endswith('.json')
+                and pid.isdigit()
+                and int(pid) != os.getpid()
+            ):
+                continue
+            try:
+                with open(os.path.join(directory, file_name)) as file:
+                    samples = json.load(file)
+            except (OSError, ValueError):
+                continue
+            alive = _pid_is_alive(int(pid))
+            for name, labels, value in samples:
+                if _is_gauge(name) and not alive:
+                    continue
+                key = (name, tuple(tuple(pair) for pair in labels))
+                merged[key] = merged.get(key, 0) + value
+        return merged
+
+
+def render(samples: dict) -> str:
+    """
+    Render samples in the Prometheus text exposition format.
+
+    Args:
+        samples (dict): Sample values by `(name, labels)`.
+
+    Returns:
+        str: Exposition text.
+    """
+    families: dict[str, list[str]] = {}
+    for (name, labels), value in samples.items():
+        label_text = ','.join(
+            f'{key}="{_escape(label)}"' for key, label in labels
+        )
+        families.setdefault(_family(name), []).append(
+            f'{name}{{{label_text}}} {_format_value(value)}'
+            if label_text else f'{name} {_format_value(value)}'
+        )
+    lines = []
+    for family, family_samples in families.items():
+        kind, description = METRIC_FAMILIES.get(family, ('untyped', ''))
+        lines.append(f'# HELP {family} {description}')
+        lines.append(f'# TYPE {family} {kind}')
+        lines.extend(family_samples)
+    return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
+
+
+def _before_cursor_execute(
+    connection, cursor, statement, parameters, context, executemany
+) -> None:
+    if current_request_stats.get() is not None:
+        connection.info.setdefault('statement_started_at', []).append(
+            time.perf_counter()
+        )
+
+
+def _after_cursor_execute(
+    connection, cursor, statement, parameters, context, executemany
+) -> None:
+    stats = current_request_stats.get()
+    started = connection.info.get('statement_started_at')
+    if stats is None or not started:
+        return
+    stats.db_statements += 1
+    stats.db_time += time.perf_counter() - started.pop()
+    if stats.statements is not None:
+        stats.statements[statement] += 1
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get('statement_started_at'):
+        connection.info['statement_started_at'].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attribute SQL statements of an engine to the current HTTP request.
+
+    Args:
+        engine (Engine): Sync engine (`AsyncEngine.sync_engine`).
+    """
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(engine, 'handle_error', _handle_error)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording metrics of HTTP requests by route template.
+
+    Requests are labelled with the path template of the matched route
+    (e.g. `/tasks/{task_uuid}`) to keep the number of series bounded.
+
+    With query accounting enabled, responses get a `Server-Timing`
+    header, and requests running the same statement more than
+    `repeat_threshold` times are logged as likely N+1 queries.
+
+    Attributes:
+        app (ASGIApp): Wrapped application.
+        routes (list[BaseRoute]): Routes of the application.
+        registry (MetricsRegistry): Registry to record samples in.
+        query_accounting (bool): Enable per-request query accounting.
+        repeat_threshold (int): Maximum executions of one statement
+            per request before a warning.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: list[BaseRoute],
+        registry: MetricsRegistry = metrics,
+        query_accounting: bool = False,
+        repeat_threshold: int = 10,
+    ):
+        self.app = app
+        self.routes = routes
+        self.registry = registry
+        self.query_accounting = query_accounting
+        self.repeat_threshold = repeat_threshold
+
+    def route_template(self, scope: Scope) -> str:
+        """
+        Find the path template of the route handling a request.
+
+        Args:
+            scope (Scope): ASGI scope of the request.
+
+        Returns:
+            str: Path template, or `<unmatched>` if no route matches.
+        """
+        partial = None
+        for route in self.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+            if match == Match.PARTIAL and partial is None:
+                partial = route.path
+        return partial or UNMATCHED_ROUTE
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        labels = (
+            ('method', scope['method']),
+            ('route', self.route_template(scope)),
+        )
+        status_code = 500
+        stats = RequestStats(track_statements=self.query_accounting)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                if self.query_accounting:
+                    message['headers'] = [
+                        *message.get('headers', []),
+                        (b'server-timing', stats.server_timing().encode()),
+                    ]
+            await send(message)
+
+        token = current_request_stats.set(stats)
+        self.registry.inc('http_requests_in_flight', labels)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - stats.started_at
+            current_request_stats.reset(token)
+            for statement, count in stats.repeated_statements(
+                self.repeat_threshold
+            ):
+                logger.warning(
+                    '%s %s ran the same statement %d times '
+                    '(possible N+1 queries): %s',
+                    scope['method'],
+                    labels[1][1],
+                    count,
+                    statement,
+                )
+            self.registry.inc('http_requests_in_flight', labels, -1)
+            self.registry.inc(
+                'http_requests_total',
+                (*labels, ('status', str(status_code))),
+            )
+            self.registry.observe(
+                'http_request_duration_seconds',
+                labels,
+                duration,
+                LATENCY_BUCKETS,
+            )
+            self.registry.observe(
+                'http_request_db_statements',
+                labels,
+                stats.db_statements,
+                STATEMENT_COUNT_BUCKETS,
+            )
+            self.registry.observe(
+                'http_request_db_duration_seconds',
+                labels,
+                stats.db_time,
+                LATENCY_BUCKETS,
+            )
@@ -1,9 +1,37 @@
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Optional,
+    Sequence,
+)
 from uuid import UUID
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import (
+    ARRAY,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    insert,
+    inspect,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from src.core.cache import BaseCache
+from src.core.changes import ChangeFeed
+from src.database.coalescer import WriteCoalescer
+from src.database.routing import FRESH_READ, REPLICA_SESSION
+from src.models.base import utc_now
 
 
 class BaseCRUD:
@@ -12,31 +40,241 @@ class BaseCRUD:
 
     Attributes:
         model: SQLAlchemy model class.
+        cache (BaseCache | None): Read-through cache used by `get_cached`.
+            Write methods invalidate the entries of changed records
+            when their transaction commits.
+        feed (ChangeFeed | None): Feed that write methods publish
+            created, updated and deleted records to.
+        tombstone_model: Model with `uuid` and `deleted_at` columns that
+            delete methods record deleted UUIDs in, None to keep none.
+        coalescer (WriteCoalescer | None): Group commit of `create`,
+            `update_by_uuid` and `delete_many` calls with `commit_on`.
+            These then run in a shared batch session, not the given one.
+        archive_model: Model with the columns of `model` that old records
+            are moved to, None if records are never archived. Reads by
+            UUID fall back to it, lists read it on request.
+
+    With `commit_on=False` the caller owns the transaction: methods
+    neither commit nor roll back.
     """
 
-    def __init__(self, model):
+    def __init__(
+        self,
+        model,
+        cache: Optional[BaseCache] = None,
+        feed: Optional[ChangeFeed] = None,
+        tombstone_model=None,
+        coalescer: Optional[WriteCoalescer] = None,
+        archive_model=None,
+    ):
         self.model = model
+        self.cache = cache
+        self.feed = feed
+        self.tombstone_model = tombstone_model
+        self.coalescer = coalescer
+        self.archive_model = archive_model
+        self._with_archive = None
+        if archive_model is not None:
+            archive_columns = archive_model.__table__.c
+            self._with_archive = aliased(
+                model,
+                union_all(
+                    select(model.__table__),
+                    select(
+                        *(
+                            archive_columns[column.name]
+                            for column in model.__table__.columns
+                        )
+                    ),
+                ).subquery(f'{model.__tablename__}_with_archive'),
+            )
+
+    def entity(self, include_archived: bool = False):
+        """
+        Entity that list queries and their criteria are built on.
+
+        Args:
+            include_archived (bool): Read archived records too.
+
+        Returns:
+            The model, or its alias over live and archived records.
+        """
+        if include_archived and self._with_archive is not None:
+            return self._with_archive
+        return self.model
 
-    async def get_all(self, session: AsyncSession):
+    def _sources(self) -> tuple:
+        """Models a record is looked up in by UUID, live records first."""
+        if self.archive_model is None:
+            return (self.model,)
+        return (self.model, self.archive_model)
+
+    async def get_all(
+        self,
+        session: AsyncSession,
+        limit: Optional[int] = None,
+        order_by: str = 'uuid',
+        descending: bool = False,
+        after: Optional[tuple[Any, UUID]] = None,
+        where: Sequence = (),
+        columns: Optional[Sequence[str]] = None,
+        include_archived: bool = False,
+    ):
         """
-        Retrieve all records of the model from the database.
+        Retrieve records of the model from the database.
+
+        Records are ordered by `(order_by, uuid)`, so the order is stable
+        even for non-unique sort keys. Pages are fetched with a seek
+        predicate on that pair instead of OFFSET, so every page costs
+        the same index range scan.
 
         Args:
             session (AsyncSession): Async SQLAlchemy session.
+            limit (int | None): Maximum number of records to return.
+            order_by (str): Name of the model attribute to sort by.
+            descending (bool): Sort in descending order if True.
+            after (tuple | None): `(sort_key, uuid)` of the last record
+                of the previous page.
+            where (Sequence): Filter criteria pushed down to SQL, built
+                on `entity(include_archived)`.
+            columns (Sequence[str] | None): Names of table columns to
+                select as plain rows, skipping the ORM identity map.
+            include_archived (bool): Merge archived records in.
 
         Returns:
-            List[model]: List of model instances.
+            List[model] | List[Row]: List of model instances, or rows
+                of selected columns if `columns` is given.
         """
-        return (
-            await session.execute(
-                select(self.model)
+        entity = self.entity(include_archived)
+        result = await session.execute(
+            self._paginate(
+                self._select(columns, entity).where(*where),
+                limit,
+                order_by,
+                descending,
+                after,
+                entity,
             )
-        ).scalars().all()
+        )
+        return result.all() if columns else result.scalars().all()
+
+    async def stream_all(
+        self,
+        session: AsyncSession,
+        order_by: str = 'uuid',
+        descending: bool = False,
+        chunk_size: int = 1000,
+        where: Sequence = (),
+        columns: Optional[Sequence[str]] = None,
+        include_archived: bool = False,
+    ) -> AsyncIterator[Sequence]:
+        """
+        Stream all records of the model in chunks.
+
+        Uses a server-side cursor, so only one chunk of records is held
+        in memory at a time regardless of the table size.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+            order_by (str): Name of the model attribute to sort by.
+            descending (bool): Sort in descending order if True.
+            chunk_size (int): Number of records fetched per round trip.
+            where (Sequence): Filter criteria pushed down to SQL, built
+                on `entity(include_archived)`.
+            columns (Sequence[str] | None): Names of table columns to
+                select as plain rows, skipping the ORM identity map.
+            include_archived (bool): Merge archived records in.
+
+        Yields:
+            Sequence[model] | Sequence[Row]: Chunk of model instances,
+                or rows of selected columns if `columns` is given.
+        """
+        entity = self.entity(include_archived)
+        result = await session.stream(
+            self._paginate(
+                self._select(columns, entity).where(*where),
+                None,
+                order_by,
+                descending,
+                None,
+                entity,
+            ).execution_options(yield_per=chunk_size)
+        )
+        if not columns:
+            result = result.scalars()
+        async for chunk in result.partitions():
+            yield chunk
+
+    def _select(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        entity=None,
+    ) -> Select:
+        """
+        Build a SELECT of model instances or of plain table columns.
+
+        Args:
+            columns (Sequence[str] | None): Names of table columns.
+            entity: Model or alias to select from, the model if None.
+
+        Returns:
+            Select: Statement selecting from the entity.
+        """
+        entity = self.model if entity is None else entity
+        if not columns:
+            return select(entity)
+        table_columns = inspect(entity).selectable.c
+        return select(*(table_columns[column] for column in columns))
+
+    def _paginate(
+        self,
+        statement: Select,
+        limit: Optional[int],
+        order_by: str,
+        descending: bool,
+        after: Optional[tuple[Any, UUID]],
+        entity=None,
+    ) -> Select:
+        """
+        Apply keyset ordering, seek predicate and limit to a statement.
+
+        Args:
+            statement (Select): Statement selecting from the entity.
+            limit (int | None): Maximum number of rows.
+            order_by (str): Name of the model attribute to sort by.
+            descending (bool): Sort in descending order if True.
+            after (tuple | None): `(sort_key, uuid)` to seek past.
+            entity: Model or alias selected from, the model if None.
+
+        Returns:
+            Select: Statement with ORDER BY, WHERE and LIMIT applied.
+        """
+        entity = self.model if entity is None else entity
+        sort_column = getattr(entity, order_by)
+        if order_by == 'uuid':
+            key = sort_column
+            order = [sort_column.desc() if descending else sort_column]
+        else:
+            key = tuple_(sort_column, entity.uuid)
+            order = (
+                [sort_column.desc(), entity.uuid.desc()]
+                if descending else [sort_column, entity.uuid]
+            )
+        if after is not None:
+            position = after[1] if order_by == 'uuid' else tuple(after)
+            statement = statement.where(
+                key < position if descending else key > position
+            )
+        statement = statement.order_by(*order)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
 
     async def get(
         self,
         uuid: UUID,
         session: AsyncSession,
+        include_archived: bool = False,
     ):
         """
         Retrieve a single record by UUID.
@@ -44,15 +282,278 @@ class BaseCRUD:
         Args:
             uuid (UUID): Unique identifier of the record.
             session (AsyncSession): Async SQLAlchemy session.
+            include_archived (bool): Look up archived records if there
+                is no live one.
+
+        Returns:
+            model | None: Model instance, or archive model instance
+                of an archived record, if found, else None.
+        """
+        sources = self._sources() if include_archived else (self.model,)
+        for model in sources:
+            instance = (
+                await session.execute(select(model).where(model.uuid == uuid))
+            ).scalar()
+            if instance is not None:
+                return instance
+        return None
+
+    async def get_many(
+        self,
+        uuids: Sequence[UUID],
+        session: AsyncSession,
+    ) -> dict[UUID, Any]:
+        """
+        Retrieve records by a list of UUIDs in one statement.
+
+        PostgreSQL gets the UUIDs as one array parameter of
+        `uuid = ANY(:uuids)`, so every batch size shares one prepared
+        statement; other databases get `uuid IN (...)`. UUIDs without
+        a live record are then looked up among archived records.
+
+        Args:
+            uuids (Sequence[UUID]): Unique identifiers of the records.
+            session (AsyncSession): Async SQLAlchemy session.
+
+        Returns:
+            dict[UUID, model]: Found records by UUID, missing UUIDs
+                are left out.
+        """
+        found = {}
+        missing = list(dict.fromkeys(uuids))
+        for model in self._sources():
+            if not missing:
+                break
+            if session.get_bind().dialect.name == 'postgresql':
+                criterion = model.uuid == any_(
+                    bindparam('uuids', missing, type_=ARRAY(model.uuid.type))
+                )
+            else:
+                criterion = model.uuid.in_(missing)
+            for instance in (
+                await session.execute(select(model).where(criterion))
+            ).scalars():
+                found[instance.uuid] = instance
+            missing = [uuid for uuid in missing if uuid not in found]
+        return found
+
+    async def get_version(
+        self,
+        uuid: UUID,
+        session: AsyncSession,
+    ) -> Optional[int]:
+        """
+        Retrieve only the row version of a record by UUID.
+
+        The model must have a `version_id_col` mapper argument.
+        Archived records are looked up if there is no live one.
+
+        Args:
+            uuid (UUID): Unique identifier of the record.
+            session (AsyncSession): Async SQLAlchemy session.
+
+        Returns:
+            int | None: Version of the record if it exists, else None.
+        """
+        name = inspect(self.model).version_id_col.name
+        for model in self._sources():
+            version = (
+                await session.execute(
+                    select(model.__table__.c[name]).where(model.uuid == uuid)
+                )
+            ).scalar()
+            if version is not None:
+                return version
+        return None
+
+    async def get_cached(
+        self,
+        uuid: UUID,
+        session: AsyncSession,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Retrieve column values of a record by UUID through the cache.
+
+        Only misses reach the database. The result is a plain dictionary,
+        not a model instance, so it is safe to share between sessions.
+        If `columns` are given, a miss selects only these columns and
+        is not stored in the cache. Archived records are looked up
+        if there is no live one. Sessions marked as fresh reads skip
+        the lookup, records read from a replica are not stored.
+
+        Args:
+            uuid (UUID): Unique identifier of the record.
+            session (AsyncSession): Async SQLAlchemy session.
+            columns (Sequence[str] | None): Names of table columns to
+                return, all columns if None.
+
+        Returns:
+            dict | None: Column values if the record exists, else None.
+        """
+        key = self._cache_key(uuid)
+        if self.cache is not None and not session.info.get(FRESH_READ):
+            cached = await self.cache.get(key)
+            if cached is not None:
+                if columns:
+                    return {column: cached[column] for column in columns}
+                return cached
+        for model in self._sources():
+            result = await session.execute(
+                self._select(columns, model).where(model.uuid == uuid)
+            )
+            if columns:
+                row = result.first()
+                if row is not None:
+                    return dict(row._mapping)
+                continue
+            instance = result.scalar()
+            if instance is None:
+                continue
+            values = {
+                attribute.key: getattr(instance, attribute.key)
+                for attribute in inspect(self.model).column_attrs
+            }
+            if self.cache is not None and not session.info.get(
+                REPLICA_SESSION
+            ):
+                await self.cache.set(key, values)
+            return values
+        return None
+
+    def _cache_key(self, uuid: UUID) -> str:
+        """Build the cache key of a record."""
+        return f'{self.model.__tablename__}:{uuid}'
+
+    async def _invalidate(self, session: AsyncSession, *uuids: UUID) -> None:
+        """
+        Drop cached values of changed records once the write commits.
+
+        Args:
+            session (AsyncSession): Session of the write transaction.
+            *uuids (UUID): Unique identifiers of changed records.
+        """
+        if self.cache is not None and uuids:
+            await self.cache.delete_on_commit(
+                session, *map(self._cache_key, uuids)
+            )
+
+    async def _publish(
+        self,
+        session: AsyncSession,
+        event_type: str,
+        instances: Sequence = (),
+        uuids: Sequence[UUID] = (),
+    ) -> None:
+        """
+        Publish changed records to the change feed.
+
+        Must be called before the transaction commits.
+
+        Args:
+            session (AsyncSession): Session of the write transaction.
+            event_type (str): `created`, `updated` or `deleted`.
+            instances (Sequence): Changed model instances.
+            uuids (Sequence[UUID]): Unique identifiers of deleted records.
+        """
+        if self.feed is None or not (instances or uuids):
+            return
+        version_column = inspect(self.model).version_id_col
+        items = [
+            {'uuid': str(uuid)} for uuid in uuids
+        ] + [
+            {
+                'uuid': str(instance.uuid),
+                'version': (
+                    None if version_column is None
+                    else getattr(instance, version_column.key)
+                ),
+            }
+            for instance in instances
+        ]
+        await self.feed.publish(session, event_type, items)
+
+    async def _bury(
+        self,
+        session: AsyncSession,
+        uuids: Sequence[UUID],
+    ) -> None:
+        """
+        Record tombstones of deleted records in the current transaction.
+
+        Args:
+            session (AsyncSession): Session of the delete transaction.
+            uuids (Sequence[UUID]): Unique identifiers of deleted records.
+        """
+        if self.tombstone_model is None or not uuids:
+            return
+        deleted_at = utc_now()
+        await session.execute(
+            insert(self.tombstone_model),
+            [{'uuid': uuid, 'deleted_at': deleted_at} for uuid in uuids],
+        )
+
+    async def purge_tombstones(
+        self,
+        session: AsyncSession,
+        before: datetime,
+    ) -> int:
+        """
+        Delete tombstones older than the sync retention period.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+            before (datetime): Tombstones deleted earlier are purged.
+
+        Returns:
+            int: Number of purged tombstones.
+        """
+        if self.tombstone_model is None:
+            return 0
+        result = await session.execute(
+            delete(self.tombstone_model).where(
+                self.tombstone_model.deleted_at < before
+            )
+        )
+        await session.commit()
+        return result.rowcount
+
+    async def _coalesce(
+        self,
+        operation: Callable[[AsyncSession], Awaitable[Any]],
+        data_error: Optional[str] = None,
+        server_error_status: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+    ):
+        """
+        Run a write in the next batch of the coalescer.
+
+        A failed batch commit is raised like an error of the write
+        committed on its own.
+
+        Args:
+            operation (Callable): Write of the batch session.
+            data_error (str | None): Detail prefix of IntegrityError,
+                None to treat it as a server error.
+            server_error_status (int): Status of other SQLAlchemyError.
+
+        Raises:
+            HTTPException: If the write or the batch commit fails.
 
         Returns:
-            model | None: Model instance if found, else None.
+            Result of the write once the batch is committed.
         """
-        return (
-            await session.execute(
-                select(self.model).where(self.model.uuid == uuid)
+        try:
+            return await self.coalescer.submit(operation)
+        except SQLAlchemyError as error:
+            if data_error is not None and isinstance(error, IntegrityError):
+                raise HTTPException(
+                    detail=f'{data_error}: {str(error)}',
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            raise HTTPException(
+                status_code=server_error_status,
+                detail=f'Server error: {str(error)}',
             )
-        ).scalar()
 
     async def create(
         self,
@@ -74,21 +575,100 @@ class BaseCRUD:
         Returns:
             model: Created model instance.
         """
+        if commit_on and self.coalescer is not None:
+            return await self._coalesce(
+                lambda batch_session: self.create(
+                    create_schema, batch_session, commit_on=False
+                ),
+                'Create data error',
+                status.HTTP_400_BAD_REQUEST,
+            )
         new_task = self.model(**create_schema.model_dump())
         try:
             session.add(new_task)
+            if self.feed is not None:
+                await session.flush()
+                await self._publish(session, 'created', [new_task])
             if commit_on:
                 await session.commit()
                 await session.refresh(new_task)
+                await self._invalidate(session, new_task.uuid)
             return new_task
         except IntegrityError as error:
-            await session.rollback()
+            if commit_on:
+                await session.rollback()
             raise HTTPException(
                 detail=f'Create data error: {str(error)}',
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         except SQLAlchemyError as error:
-            await session.rollback()
+            if commit_on:
+                await session.rollback()
+            raise HTTPException(
+                detail=f'Server error: {str(error)}',
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+    async def bulk_create(
+        self,
+        create_schemas: Sequence,
+        session: AsyncSession,
+        chunk_size: int = 500,
+        commit_on: bool = True,
+    ):
+        """
+        Create many records in a single transaction.
+
+        Records are written with one multi-row `INSERT ... RETURNING`
+        per chunk instead of an INSERT, COMMIT and SELECT per record.
+
+        Args:
+            create_schemas (Sequence): Pydantic schemas of new records.
+            session (AsyncSession): Async SQLAlchemy session.
+            chunk_size (int): Maximum number of rows per INSERT statement.
+            commit_on (bool): Commit after creation if True.
+
+        Raises:
+            HTTPException: If IntegrityError or SQLAlchemyError occurs.
+
+        Returns:
+            List[model]: Created model instances in input order.
+        """
+        created = []
+        try:
+            for start in range(0, len(create_schemas), chunk_size):
+                created.extend(
+                    (
+                        await session.scalars(
+                            insert(self.model).returning(
+                                self.model, sort_by_parameter_order=True
+                            ),
+                            [
+                                create_schema.model_dump()
+                                for create_schema in create_schemas[
+                                    start:start + chunk_size
+                                ]
+                            ],
+                        )
+                    ).all()
+                )
+            await self._publish(session, 'created', created)
+            await self._invalidate(
+                session, *(instance.uuid for instance in created)
+            )
+            if commit_on:
+                await session.commit()
+            return created
+        except IntegrityError as error:
+            if commit_on:
+                await session.rollback()
+            raise HTTPException(
+                detail=f'Create data error: {str(error)}',
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        except SQLAlchemyError as error:
+            if commit_on:
+                await session.rollback()
             raise HTTPException(
                 detail=f'Server error: {str(error)}',
                 status_code=status.HTTP_400_BAD_REQUEST
@@ -121,18 +701,97 @@ class BaseCRUD:
             setattr(task, field, value)
         try:
             session.add(task)
+            if self.feed is not None:
+                await session.flush()
+                await self._publish(session, 'updated', [task])
+            await self._invalidate(session, task.uuid)
             if commit_on:
                 await session.commit()
                 await session.refresh(task)
             return task
         except IntegrityError as error:
-            await session.rollback()
+            if commit_on:
+                await session.rollback()
+            raise HTTPException(
+                detail=f'Update data error: {str(error)}',
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        except SQLAlchemyError as error:
+            if commit_on:
+                await session.rollback()
+            raise HTTPException(
+                detail=f'Server error: {str(error)}',
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def update_by_uuid(
+        self,
+        uuid: UUID,
+        update_schema,
+        session: AsyncSession,
+        where: Sequence = (),
+        commit_on: bool = True,
+    ):
+        """
+        Update a record by UUID with a single `UPDATE ... RETURNING`.
+
+        The record is changed only if it also matches all `where`
+        criteria, so preconditions are checked atomically with the write.
+        The version column of the model, if any, is incremented.
+
+        Args:
+            uuid (UUID): Unique identifier of the record.
+            update_schema: Pydantic schema with updated fields.
+            session (AsyncSession): Async SQLAlchemy session.
+            where (Sequence): Extra criteria the record must match.
+            commit_on (bool): Commit after update if True.
+
+        Raises:
+            HTTPException: If IntegrityError or SQLAlchemyError occurs.
+
+        Returns:
+            model | None: Updated model instance, or None if no record
+                matches the UUID and criteria.
+        """
+        if commit_on and self.coalescer is not None:
+            return await self._coalesce(
+                lambda batch_session: self.update_by_uuid(
+                    uuid, update_schema, batch_session, where, commit_on=False
+                ),
+                'Update data error',
+            )
+        update_data = update_schema.model_dump(exclude_unset=True)
+        if update_data:
+            statement = update(self.model).values(
+                **update_data
+            ).returning(self.model)
+            version_column = inspect(self.model).version_id_col
+            if version_column is not None:
+                statement = statement.values(
+                    {version_column: version_column + 1}
+                )
+        else:
+            statement = select(self.model)
+        statement = statement.where(self.model.uuid == uuid, *where)
+        try:
+            instance = (await session.scalars(statement)).first()
+            if instance is not None and update_data:
+                await self._publish(session, 'updated', [instance])
+            if instance is not None:
+                await self._invalidate(session, instance.uuid)
+            if commit_on:
+                await session.commit()
+            return instance
+        except IntegrityError as error:
+            if commit_on:
+                await session.rollback()
             raise HTTPException(
                 detail=f'Update data error: {str(error)}',
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
         except SQLAlchemyError as error:
-            await session.rollback()
+            if commit_on:
+                await session.rollback()
             raise HTTPException(
                 detail=f'Server error: {str(error)}',
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -157,10 +816,98 @@ class BaseCRUD:
         """
         try:
             await session.delete(task)
+            await self._bury(session, [task.uuid])
+            await self._publish(session, 'deleted', uuids=[task.uuid])
+            await self._invalidate(session, task.uuid)
             if commit_on:
                 await session.commit()
         except SQLAlchemyError as error:
-            await session.rollback()
+            if commit_on:
+                await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f'Server error: {str(error)}'
+            )
+
+    async def delete_by_uuid(
+        self,
+        uuid: UUID,
+        session: AsyncSession,
+        commit_on: bool = True
+    ) -> Optional[UUID]:
+        """
+        Delete a record by UUID with a single `DELETE ... RETURNING`.
+
+        Args:
+            uuid (UUID): Unique identifier of the record.
+            session (AsyncSession): Async SQLAlchemy session.
+            commit_on (bool): Commit after deletion if True.
+
+        Raises:
+            HTTPException: If SQLAlchemyError occurs.
+
+        Returns:
+            UUID | None: UUID of the deleted record, or None if there was
+                no record with given UUID.
+        """
+        deleted = await self.delete_many([uuid], session, commit_on)
+        return deleted[0] if deleted else None
+
+    async def delete_many(
+        self,
+        uuids: Sequence[UUID],
+        session: AsyncSession,
+        commit_on: bool = True
+    ) -> list[UUID]:
+        """
+        Delete records by a list of UUIDs in one statement.
+
+        UUIDs without a live record are then deleted among archived
+        records, with tombstones like live ones.
+
+        Args:
+            uuids (Sequence[UUID]): Unique identifiers of the records.
+            session (AsyncSession): Async SQLAlchemy session.
+            commit_on (bool): Commit after deletion if True.
+
+        Raises:
+            HTTPException: If SQLAlchemyError occurs.
+
+        Returns:
+            list[UUID]: UUIDs of the records that have been deleted.
+        """
+        if commit_on and self.coalescer is not None:
+            return await self._coalesce(
+                lambda batch_session: self.delete_many(
+                    uuids, batch_session, commit_on=False
+                )
+            )
+        try:
+            deleted = []
+            missing = list(uuids)
+            for model in self._sources():
+                if not missing:
+                    break
+                deleted.extend(
+                    (
+                        await session.scalars(
+                            delete(model).where(
+                                model.uuid.in_(missing)
+                            ).returning(model.uuid)
+                        )
+                    ).all()
+                )
+                found = set(deleted)
+                missing = [uuid for uuid in missing if uuid not in found]
+            await self._bury(session, deleted)
+            await self._publish(session, 'deleted', uuids=deleted)
+            await self._invalidate(session, *deleted)
+            if commit_on:
+                await session.commit()
+            return deleted
+        except SQLAlchemyError as error:
+            if commit_on:
+                await session.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f'Server error: {str(error)}'
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud.base import BaseCRUD
+
+
+class Loader:
+    """
+    Request-scoped batching of record reads by UUID.
+
+    `load` calls issued in the same event loop tick are collected and
+    resolved by one `get_many` call of the CRUD object. Every UUID is
+    read at most once per loader, repeated loads share the result.
+    Batches run one at a time, as the session is not concurrency-safe.
+
+    Attributes:
+        crud (BaseCRUD): CRUD object of the loaded model.
+        session (AsyncSession): Session of the request.
+    """
+
+    def __init__(self, crud: BaseCRUD, session: AsyncSession):
+        self.crud = crud
+        self.session = session
+        self._futures: dict[UUID, asyncio.Future] = {}
+        self._queue: list[UUID] = []
+        self._lock = asyncio.Lock()
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def load(self, uuid: UUID) -> Optional[Any]:
+        """
+        Read a record by UUID in the batch of the current tick.
+
+        Args:
+            uuid (UUID): Unique identifier of the record.
+
+        Raises:
+            HTTPException | SQLAlchemyError: Error of the batch read.
+
+        Returns:
+            model | None: Model instance, or None if it does not exist.
+        """
+        future = self._futures.get(uuid)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[uuid] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch_queue)
+            self._queue.append(uuid)
+        return await asyncio.shield(future)
+
+    async def load_many(self, uuids: Sequence[UUID]) -> list[Optional[Any]]:
+        """
+        Read records by a list of UUIDs in one batch.
+
+        Args:
+            uuids (Sequence[UUID]): Unique identifiers of the records.
+
+        Returns:
+            list[model | None]: Records in the order of `uuids`, None
+                for missing ones.
+        """
+        return list(await asyncio.gather(*map(self.load, uuids)))
+
+    def _dispatch_queue(self) -> None:
+        """Start reading the UUIDs queued during the last tick."""
+        batch, self._queue = self._queue, []
+        dispatch = asyncio.create_task(self._dispatch(batch))
+        self._dispatches.add(dispatch)
+        dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[UUID]) -> None:
+        """Read a batch of UUIDs and resolve their loads."""
+        try:
+            async with self._lock:
+                found = await self.crud.get_many(batch, self.session)
+        except Exception as error:
+            for uuid in batch:
+                future = self._futures.pop(uuid)
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for uuid in batch:
+            future = self._futures[uuid]
+            if not future.done():
+                future.set_result(found.get(uuid))
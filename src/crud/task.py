@@ -1,5 +1,35 @@
+from datetime import datetime
+from typing import Optional, Sequence, Union
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import (
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import build_cache
+from src.core.changes import ChangeFeed
+from src.core.config import settings
 from src.crud.base import BaseCRUD
-from src.models.task import Task
+from src.database.coalescer import WriteCoalescer
+from src.database.db import write_session
+from src.database.enums import StatusEnum
+from src.database.search import SEARCH_CONFIG
+from src.models.base import utc_now
+from src.models.task import CLAIMABLE_TASKS, Task
+from src.models.task_archive import TaskArchive
+from src.models.task_tombstone import TaskTombstone
 
 
 class TaskCRUD(BaseCRUD):
@@ -7,13 +37,313 @@ class TaskCRUD(BaseCRUD):
     CRUD operations for Task model.
 
     Inherits all methods from BaseCRUD:
+        - entity
         - get_all
+        - stream_all
         - get
+        - get_version
+        - get_cached
         - create
+        - bulk_create
         - update
+        - update_by_uuid
         - delete
+        - delete_by_uuid
+        - delete_many
+        - purge_tombstones
     """
-    pass
 
+    def filters(
+        self,
+        statuses: Optional[Sequence[StatusEnum]] = None,
+        title_prefix: Optional[str] = None,
+        include_archived: bool = False,
+    ) -> list:
+        """
+        Build SQL criteria for filtering the task list.
+
+        Args:
+            statuses (Sequence[StatusEnum] | None): Allowed task statuses.
+            title_prefix (str | None): Prefix the task title starts with.
+            include_archived (bool): Criteria of a list that includes
+                archived tasks.
+
+        Returns:
+            list: Criteria for `get_all`/`stream_all`.
+        """
+        entity = self.entity(include_archived)
+        criteria = []
+        if statuses:
+            criteria.append(entity.status.in_(statuses))
+        if title_prefix:
+            criteria.append(
+                entity.title.startswith(title_prefix, autoescape=True)
+            )
+        return criteria
+
+    async def search(
+        self,
+        query: str,
+        session: AsyncSession,
+        limit: int,
+        offset: int = 0,
+    ):
+        """
+        Full-text search of tasks by title and description.
+
+        Uses the `search_vector` GIN index on PostgreSQL and the
+        `task_fts` FTS5 table on SQLite. All words of the query must
+        match; the best ranked tasks go first.
+
+        Args:
+            query (str): Words to search for.
+            session (AsyncSession): Async SQLAlchemy session.
+            limit (int): Maximum number of tasks to return.
+            offset (int): Number of best ranked tasks to skip.
+
+        Returns:
+            List[Task]: Matching tasks ordered by rank.
+        """
+        if not query.split():
+            return []
+        if session.get_bind().dialect.name == 'postgresql':
+            vector = literal_column('task.search_vector')
+            tsquery = func.plainto_tsquery(SEARCH_CONFIG, query)
+            statement = select(Task).where(
+                vector.op('@@')(tsquery)
+            ).order_by(func.ts_rank(vector, tsquery).desc(), Task.uuid)
+        else:
+            fts = table('task_fts', column('rowid'))
+            key = table('task_fts_key', column('id'), column('uuid'))
+            match = ' '.join(
+                '"{}"'.format(word.replace('"', '""'))
+                for word in query.split()
+            )
+            statement = select(Task).join(
+                key, key.c.uuid == Task.uuid
+            ).join(
+                fts, fts.c.rowid == key.c.id
+            ).where(
+                literal_column('task_fts').op('MATCH')(match)
+            ).order_by(func.bm25(literal_column('task_fts')), Task.uuid)
+        return (
+            await session.execute(statement.limit(limit).offset(offset))
+        ).scalars().all()
+
+    async def get_changes(
+        self,
+        session: AsyncSession,
+        until: datetime,
+        after: Optional[tuple[datetime, UUID]] = None,
+        limit: int = 100,
+    ) -> list[Union[Task, TaskTombstone]]:
+        """
+        Retrieve tasks changed and deleted after a sync position.
+
+        Changes are ordered by `(timestamp, uuid)`, where the timestamp
+        is `updated_at` of a task or `deleted_at` of a tombstone. Both
+        sides are read with a seek predicate on their `(timestamp, uuid)`
+        index, so the cost depends on the number of changes only.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+            until (datetime): Latest timestamp of returned changes.
+            after (tuple | None): `(timestamp, uuid)` of the last change
+                the client has seen, None to start from the beginning.
+            limit (int): Maximum number of changes.
+
+        Returns:
+            list[Task | TaskTombstone]: Changed tasks and tombstones of
+                deleted ones in sync order.
+        """
+        changes = []
+        for model, timestamp in (
+            (Task, Task.updated_at),
+            (self.tombstone_model, TaskTombstone.deleted_at),
+        ):
+            key = tuple_(timestamp, model.uuid)
+            statement = select(model).where(timestamp <= until)
+            if after is not None:
+                statement = statement.where(key > tuple(after))
+            changes.extend(
+                (
+                    await session.execute(
+                        statement.order_by(timestamp, model.uuid).limit(limit)
+                    )
+                ).scalars().all()
+            )
+        changes.sort(key=sync_position)
+        return changes[:limit]
+
+    async def update_not_completed(
+        self,
+        uuid: UUID,
+        update_schema,
+        session: AsyncSession,
+        versions: Optional[Sequence[int]] = None,
+        commit_on: bool = True,
+    ):
+        """
+        Update a task by UUID unless it has been already completed.
+
+        The completed and version checks are a part of the UPDATE
+        statement, so a task changed by a concurrent request is never
+        overwritten.
+
+        Args:
+            uuid (UUID): Unique identifier of the task.
+            update_schema: Pydantic schema with updated fields.
+            session (AsyncSession): Async SQLAlchemy session.
+            versions (Sequence[int] | None): Versions the task is expected
+                to have, any version if None.
+            commit_on (bool): Commit after update if True.
+
+        Returns:
+            Task | None: Updated task, or None if the task does not exist,
+                has been already completed or has another version.
+        """
+        where = [Task.status != StatusEnum.COMPLETED]
+        if versions is not None:
+            where.append(Task.version.in_(versions))
+        return await self.update_by_uuid(
+            uuid,
+            update_schema,
+            session,
+            where=where,
+            commit_on=commit_on,
+        )
+
+    async def claim(
+        self,
+        limit: int,
+        session: AsyncSession,
+        commit_on: bool = True,
+    ) -> list[Task]:
+        """
+        Atomically move the oldest created tasks to in progress.
+
+        A single `UPDATE ... RETURNING` takes the tasks from a CTE that
+        scans the partial index of created tasks. On PostgreSQL the CTE
+        locks them with `FOR UPDATE SKIP LOCKED`, so concurrent claims
+        skip each other's tasks instead of waiting or claiming them
+        twice. SQLite has a single writer, so the statement is atomic
+        there without row locks.
+
+        Args:
+            limit (int): Maximum number of tasks to claim.
+            session (AsyncSession): Async SQLAlchemy session.
+            commit_on (bool): Commit after the claim if True.
+
+        Raises:
+            HTTPException: If SQLAlchemyError occurs.
+
+        Returns:
+            list[Task]: Claimed tasks, oldest first.
+        """
+        claimable = select(Task.uuid).where(
+            text(CLAIMABLE_TASKS)
+        ).order_by(Task.created_at, Task.uuid).limit(limit).with_for_update(
+            skip_locked=True
+        ).cte('claimable')
+        statement = update(Task).where(
+            Task.uuid.in_(select(claimable.c.uuid)),
+            text(CLAIMABLE_TASKS),
+        ).values(
+            status=StatusEnum.IN_PROGRESS,
+            version=Task.version + 1,
+        ).returning(Task)
+        try:
+            tasks = sorted(
+                (await session.scalars(statement)).all(),
+                key=lambda task: (task.created_at, task.uuid),
+            )
+            await self._publish(session, 'updated', tasks)
+            await self._invalidate(session, *(task.uuid for task in tasks))
+            if commit_on:
+                await session.commit()
+            return tasks
+        except SQLAlchemyError as error:
+            if commit_on:
+                await session.rollback()
+            raise HTTPException(
+                detail=f'Server error: {str(error)}',
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def archive_completed(
+        self,
+        before: datetime,
+        limit: int,
+        session: AsyncSession,
+    ) -> int:
+        """
+        Move a batch of old completed tasks to the archive table.
+
+        Completed tasks can no longer change, so they are moved as they
+        are: deleted from `task` with `DELETE ... RETURNING` and inserted
+        into the archive in the same transaction. Reads by UUID still
+        find them. On PostgreSQL the batch is locked with
+        `FOR UPDATE SKIP LOCKED`, so concurrent archivers never block.
+
+        Args:
+            before (datetime): Tasks last changed earlier are archived.
+            limit (int): Maximum number of tasks in the batch.
+            session (AsyncSession): Async SQLAlchemy session.
+
+        Returns:
+            int: Number of archived tasks, less than `limit` once there
+                is nothing left to archive.
+        """
+        archivable = select(Task.uuid).where(
+            Task.status == StatusEnum.COMPLETED,
+            Task.updated_at < before,
+        ).limit(limit).with_for_update(skip_locked=True).cte('archivable')
+        rows = (
+            await session.execute(
+                delete(Task.__table__).where(
+                    Task.uuid.in_(select(archivable.c.uuid))
+                ).returning(*Task.__table__.c)
+            )
+        ).all()
+        if rows:
+            archived_at = utc_now()
+            await session.execute(
+                insert(self.archive_model.__table__),
+                [dict(row._mapping, archived_at=archived_at) for row in rows],
+            )
+        await session.commit()
+        return len(rows)
+
+
+def sync_position(change: Union[Task, TaskTombstone]) -> tuple[datetime, UUID]:
+    """
+    Return the `(timestamp, uuid)` sync position of a change.
+
+    Args:
+        change (Task | TaskTombstone): Changed task or tombstone.
+
+    Returns:
+        tuple[datetime, UUID]: Position of the change in sync order.
+    """
+    if isinstance(change, TaskTombstone):
+        return change.deleted_at, change.uuid
+    return change.updated_at, change.uuid
+
+
+TASK_CHANGES_CHANNEL = 'task_changes'
 
-task_crud = TaskCRUD(Task)
+task_crud = TaskCRUD(
+    Task,
+    cache=build_cache(settings),
+    feed=ChangeFeed(TASK_CHANGES_CHANNEL, settings.change_feed_queue_size),
+    tombstone_model=TaskTombstone,
+    archive_model=TaskArchive,
+    coalescer=(
+        WriteCoalescer(
+            write_session,
+            settings.write_coalescing_window,
+            settings.write_coalescing_max_batch,
+        )
+        if settings.write_coalescing else None
+    ),
+)
@@ -0,0 +1,134 @@
+from typing import Optional
+
+from sqlalchemy import bindparam, func, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.crud.base import BaseCRUD
+from src.database.enums import StatusEnum
+from src.models.task import Task
+from src.models.task_archive import TaskArchive
+from src.models.task_status_counter import TaskStatusCounter
+
+# PostgreSQL advisory lock held by the worker reconciling the counters.
+RECONCILE_LOCK_KEY = 7_402_114_635
+
+
+class TaskStatusCounterCRUD(BaseCRUD):
+    """
+    Operations on per-status task counters.
+
+    Counters are written by database triggers, this class only reads
+    and reconciles them.
+    """
+
+    async def get_counts(
+        self,
+        session: AsyncSession,
+    ) -> dict[StatusEnum, int]:
+        """
+        Retrieve the number of tasks with each status.
+
+        Archived tasks are counted too.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+
+        Returns:
+            dict[StatusEnum, int]: Task count by status, zero for
+                statuses without tasks.
+        """
+        counts = dict.fromkeys(StatusEnum, 0)
+        counts.update(
+            (await session.execute(
+                select(self.model.status, self.model.count)
+            )).tuples().all()
+        )
+        return counts
+
+    async def get_approximate_total(
+        self,
+        session: AsyncSession,
+    ) -> Optional[int]:
+        """
+        Estimate the number of tasks from planner statistics.
+
+        Only PostgreSQL keeps such statistics (`pg_class.reltuples`).
+        Archived tasks are counted too, an archive table without
+        statistics yet counts as empty.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+
+        Returns:
+            int | None: Estimated number of tasks, or None if there
+                is no estimate yet or the database does not support it.
+        """
+        if session.get_bind().dialect.name != 'postgresql':
+            return None
+        estimate = (
+            await session.execute(
+                text(
+                    'SELECT (live.reltuples + greatest(archive.reltuples, 0))'
+                    '::bigint FROM pg_class live, pg_class archive '
+                    "WHERE live.oid = 'task'::regclass "
+                    "AND archive.oid = 'task_archive'::regclass"
+                )
+            )
+        ).scalar()
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    async def reconcile(self, session: AsyncSession) -> None:
+        """
+        Recount live and archived tasks by status and correct drifted
+        counters.
+
+        The drift of every counter is taken from a single statement,
+        so the counts and the counters come from one snapshot. It is
+        then added to the counters, which keeps the trigger updates of
+        concurrent writers and does not lock the counters table. On
+        PostgreSQL an advisory lock lets only one worker reconcile at
+        a time, the others skip the run.
+
+        Args:
+            session (AsyncSession): Async SQLAlchemy session.
+        """
+        if session.get_bind().dialect.name == 'postgresql' and not (
+            await session.execute(
+                text('SELECT pg_try_advisory_xact_lock(:key)'),
+                {'key': RECONCILE_LOCK_KEY},
+            )
+        ).scalar():
+            await session.rollback()
+            return
+        rows = union_all(
+            select(Task.status, func.count().label('drift')).group_by(
+                Task.status
+            ),
+            select(TaskArchive.status, func.count()).group_by(
+                TaskArchive.status
+            ),
+            select(self.model.status, -self.model.count),
+        ).subquery('rows')
+        drift = func.sum(rows.c.drift)
+        for status, count in (
+            await session.execute(
+                select(rows.c.status, drift)
+                .group_by(rows.c.status)
+                .having(drift != 0)
+            )
+        ).tuples():
+            await session.execute(
+                text(
+                    'INSERT INTO task_status_counter (status, count) '
+                    'VALUES (:status, :count) ON CONFLICT (status) '
+                    'DO UPDATE SET count = task_status_counter.count '
+                    '+ excluded.count'
+                ).bindparams(
+                    bindparam('status', type_=self.model.status.type)
+                ),
+                {'status': status, 'count': count},
+            )
+        await session.commit()
+
+
+task_status_counter_crud = TaskStatusCounterCRUD(TaskStatusCounter)
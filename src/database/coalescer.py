@@ -0,0 +1,128 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    Optional,
+    TypeVar,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.metrics import MetricsRegistry, metrics
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+T = TypeVar('T')
+Operation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteCoalescer:
+    """
+    Group commit of concurrent writes.
+
+    Writes submitted within `window` seconds, up to `max_batch_size`
+    of them, run in one session and are committed together, so the
+    database syncs its log once per batch instead of once per write.
+    Batches are committed one at a time.
+    Every write runs in its own SAVEPOINT: a failed write is rolled
+    back alone and its caller gets its error, the others are kept.
+
+    Attributes:
+        session_factory (Callable): Factory of batch sessions, e.g.
+            `write_session` or a `sessionmaker`.
+        window (float): Seconds to wait for more writes.
+        max_batch_size (int): Writes that flush a batch immediately.
+        registry (MetricsRegistry): Registry of batch size metrics.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        window: float,
+        max_batch_size: int,
+        registry: MetricsRegistry = metrics,
+    ):
+        self.session_factory = session_factory
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.registry = registry
+        self._pending: list[tuple[Operation, asyncio.Future]] = []
+        self._full: Optional[asyncio.Event] = None
+        self._collectors: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        operation: Callable[[AsyncSession], Awaitable[T]],
+    ) -> T:
+        """
+        Run a write in the next batch and wait for its commit.
+
+        Args:
+            operation (Callable): Coroutine function of the batch session
+                that writes without committing.
+
+        Raises:
+            Exception: Error of the write or of the batch commit.
+
+        Returns:
+            T: Result of the operation once the batch is committed.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((operation, future))
+        if self._full is None:
+            self._full = asyncio.Event()
+            collector = asyncio.create_task(self._collect(self._full))
+            self._collectors.add(collector)
+            collector.add_done_callback(self._collectors.discard)
+        if len(self._pending) >= self.max_batch_size:
+            self._full.set()
+        return await future
+
+    async def _collect(self, full: asyncio.Event) -> None:
+        """
+        Flush batches one at a time until no writes are pending.
+
+        Writes submitted while a batch is being committed go into
+        the next batch without waiting for another window.
+        """
+        try:
+            await asyncio.wait_for(full.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size:]
+            try:
+                await self._flush(batch)
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+        self._full = None
+
+    async def _flush(
+        self,
+        batch: list[tuple[Operation, asyncio.Future]],
+    ) -> None:
+        """Run a batch of writes in one transaction and resolve them."""
+        self.registry.observe(
+            'db_write_batch_size', (), len(batch), BATCH_SIZE_BUCKETS
+        )
+        results, errors = {}, {}
+        async with self.session_factory() as session:
+            for operation, future in batch:
+                try:
+                    async with session.begin_nested():
+                        results[future] = await operation(session)
+                except Exception as error:
+                    errors[future] = error
+            await session.commit()
+        for _, future in batch:
+            if future.done():
+                continue
+            if future in errors:
+                future.set_exception(errors[future])
+            else:
+                future.set_result(results[future])
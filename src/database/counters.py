@@ -0,0 +1,103 @@
+from sqlalchemy import DDL, Table, event
+
+POSTGRESQL_COUNTER_DDL = (
+    'CREATE OR REPLACE FUNCTION task_status_counter_update() '
+    'RETURNS trigger AS $$ '
+    'BEGIN '
+    "IF TG_OP = 'UPDATE' AND OLD.status = NEW.status THEN "
+    'RETURN NULL; '
+    'END IF; '
+    "IF TG_OP IN ('UPDATE', 'DELETE') THEN "
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = OLD.status; '
+    'END IF; '
+    "IF TG_OP IN ('INSERT', 'UPDATE') THEN "
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (NEW.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = task_status_counter.count + 1; '
+    'END IF; '
+    'RETURN NULL; '
+    'END $$ LANGUAGE plpgsql',
+    'CREATE TRIGGER task_status_counter '
+    'AFTER INSERT OR DELETE OR UPDATE OF status ON task '
+    'FOR EACH ROW EXECUTE FUNCTION task_status_counter_update()',
+)
+
+SQLITE_COUNTER_DDL = (
+    'CREATE TRIGGER task_status_counter_insert AFTER INSERT ON task BEGIN '
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (new.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = count + 1; END',
+    'CREATE TRIGGER task_status_counter_delete AFTER DELETE ON task BEGIN '
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = old.status; END',
+    'CREATE TRIGGER task_status_counter_update AFTER UPDATE OF status '
+    'ON task WHEN old.status <> new.status BEGIN '
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = old.status; '
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (new.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = count + 1; END',
+)
+
+POSTGRESQL_ARCHIVE_COUNTER_DDL = (
+    POSTGRESQL_COUNTER_DDL[0],
+    'CREATE TRIGGER task_archive_status_counter '
+    'AFTER INSERT OR DELETE ON task_archive '
+    'FOR EACH ROW EXECUTE FUNCTION task_status_counter_update()',
+)
+
+SQLITE_ARCHIVE_COUNTER_DDL = (
+    'CREATE TRIGGER task_archive_status_counter_insert '
+    'AFTER INSERT ON task_archive BEGIN '
+    'INSERT INTO task_status_counter (status, count) '
+    'VALUES (new.status, 1) ON CONFLICT (status) '
+    'DO UPDATE SET count = count + 1; END',
+    'CREATE TRIGGER task_archive_status_counter_delete '
+    'AFTER DELETE ON task_archive BEGIN '
+    'UPDATE task_status_counter SET count = count - 1 '
+    'WHERE status = old.status; END',
+)
+
+POSTGRESQL_COUNTER_DROP_DDL = (
+    'DROP TRIGGER IF EXISTS task_status_counter ON task',
+    'DROP FUNCTION IF EXISTS task_status_counter_update()',
+)
+
+SQLITE_COUNTER_DROP_DDL = tuple(
+    f'DROP TRIGGER IF EXISTS task_status_counter_{operation}'
+    for operation in ('insert', 'delete', 'update')
+)
+
+
+def register_counter_ddl(table: Table, archive: bool = False) -> None:
+    """
+    Attach status counter triggers to creation of a task table.
+
+    Triggers keep `task_status_counter` in sync with every INSERT,
+    DELETE and status UPDATE of tasks inside the writing transaction.
+    Archived tasks are counted too, so moving a task to the archive
+    leaves the counters as they are. Migrations keep frozen copies
+    of these statements, change them with a new migration.
+
+    Args:
+        table (Table): Task table or task archive table.
+        archive (bool): The table is the task archive table.
+    """
+    for dialect, statements in (
+        (
+            'postgresql',
+            POSTGRESQL_ARCHIVE_COUNTER_DDL if archive
+            else POSTGRESQL_COUNTER_DDL,
+        ),
+        (
+            'sqlite',
+            SQLITE_ARCHIVE_COUNTER_DDL if archive else SQLITE_COUNTER_DDL,
+        ),
+    ):
+        for statement in statements:
+            event.listen(
+                table,
+                'after_create',
+                DDL(statement).execute_if(dialect=dialect),
+            )
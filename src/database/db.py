@@ -1,25 +1,166 @@
-from typing import Any, AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
+
+from fastapi import Cookie, Header, Request
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
+from src.core.metrics import instrument_engine
+from src.database.pool import InstrumentedAsyncQueuePool
+from src.database.routing import (
+    FRESH_READ,
+    LAST_WRITE_COOKIE,
+    WRITE_REQUEST_STATE,
+    ReplicaRouter,
+)
+from src.database.sqlite import (
+    WRITE_SESSION,
+    SingleWriter,
+    register_sqlite_pragmas,
+    register_sqlite_transactions,
+)
+
+PRIMARY_READ_CONSISTENCY = 'primary'
+
 
-engine = create_async_engine(settings.get_db_url)
+class PrimarySession(Session):
+    """Session bound to the primary database."""
+
+
+engine = create_async_engine(
+    settings.get_db_url,
+    poolclass=InstrumentedAsyncQueuePool,
+    **settings.get_engine_options,
+)
+instrument_engine(engine.sync_engine)
+single_writer = None
+if engine.dialect.name == 'sqlite':
+    register_sqlite_transactions(engine.sync_engine)
+if engine.dialect.name == 'sqlite' and settings.sqlite_tuning:
+    register_sqlite_pragmas(engine.sync_engine, settings.get_sqlite_pragmas)
+    if settings.sqlite_single_writer:
+        single_writer = SingleWriter()
 AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine,
+    class_=AsyncSession,
+    sync_session_class=PrimarySession,
+    expire_on_commit=False,
 )
+if single_writer is not None:
+    single_writer.register(PrimarySession)
+replica_router = ReplicaRouter(
+    settings.get_db_replica_urls,
+    settings.get_engine_options,
+    max_lag=settings.db_replica_max_lag,
+    health_check_interval=settings.db_replica_health_check_interval,
+    health_check_timeout=settings.db_replica_health_check_timeout,
+    read_your_writes_window=settings.db_read_your_writes_window,
+)
+
+
+@asynccontextmanager
+async def write_session() -> AsyncIterator[AsyncSession]:
+    """
+    Session of the primary for writes.
+
+    With the SQLite single writer every transaction of the session
+    waits for its turn, so write transactions of the process run one
+    at a time.
+
+    Yields:
+        AsyncSession: Asynchronous SQLAlchemy session.
+    """
+    async with AsyncSessionLocal(
+        info={WRITE_SESSION: True}
+    ) as async_session:
+        yield async_session
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, Any]:
+async def get_async_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, Any]:
     """
     Async generator to provide SQLAlchemy AsyncSession.
 
+    The request is marked as a write, so that its response sets the
+    `last_write_at` cookie of read-your-writes.
+
     Usage:
         async with get_async_session() as session:
             ...
 
+    Args:
+        request (Request): Request of the session.
+
+    Yields:
+        AsyncSession: Asynchronous SQLAlchemy session.
+    """
+    setattr(request.state, WRITE_REQUEST_STATE, True)
+    async with write_session() as async_session:
+        yield async_session
+
+
+async def get_primary_session() -> AsyncGenerator[AsyncSession, Any]:
+    """
+    Async generator to provide a read-only SQLAlchemy AsyncSession
+    of the primary.
+
+    For reads that must not lag behind writes. The session never
+    waits for the turn of the SQLite single writer.
+
     Yields:
         AsyncSession: Asynchronous SQLAlchemy session.
     """
     async with AsyncSessionLocal() as async_session:
         yield async_session
+
+
+async def get_read_session(
+    x_read_consistency: Optional[str] = Header(
+        None,
+        description='`primary` to read own writes from the primary',
+    ),
+    last_write_at: Optional[str] = Cookie(
+        None,
+        alias=LAST_WRITE_COOKIE,
+        description='Time of the last write of the client',
+    ),
+) -> AsyncGenerator[AsyncSession, Any]:
+    """
+    Async generator to provide a read-only SQLAlchemy AsyncSession.
+
+    The session is bound to a healthy read replica if there is one,
+    otherwise to the primary. Reads of a client right after its own
+    write, and reads forced to the primary, stay on the primary and
+    are marked as fresh reads that skip caches.
+
+    Args:
+        x_read_consistency (str | None): `X-Read-Consistency` header,
+            `primary` forces the read to the primary.
+        last_write_at (str | None): `last_write_at` cookie, Unix time
+            of the last write of the client.
+
+    Yields:
+        AsyncSession: Asynchronous SQLAlchemy session.
+    """
+    try:
+        written_at = float(last_write_at) if last_write_at else None
+    except ValueError:
+        written_at = None
+    fresh = (
+        x_read_consistency == PRIMARY_READ_CONSISTENCY
+        or replica_router.wrote_recently(written_at)
+    )
+    if fresh:
+        async with AsyncSessionLocal(
+            info={FRESH_READ: True}
+        ) as async_session:
+            yield async_session
+        return
+    replica = await replica_router.choose()
+    session_factory = (
+        AsyncSessionLocal if replica is None else replica.session_factory
+    )
+    async with session_factory() as async_session:
+        yield async_session
@@ -13,3 +13,36 @@ class StatusEnum(StrEnum):
     CREATED = 'created'
     IN_PROGRESS = 'in_progress'
     COMPLETED = 'completed'
+
+
+class TaskOrderingEnum(StrEnum):
+    """
+    Enum for supported orderings of the task list.
+
+    A leading `-` means descending order. Every ordering is made stable
+    by using `uuid` as a tie-breaker.
+
+    Attributes:
+        UUID (str): Ascending by uuid.
+        UUID_DESC (str): Descending by uuid.
+        TITLE (str): Ascending by title.
+        TITLE_DESC (str): Descending by title.
+        STATUS (str): Ascending by status.
+        STATUS_DESC (str): Descending by status.
+    """
+    UUID = 'uuid'
+    UUID_DESC = '-uuid'
+    TITLE = 'title'
+    TITLE_DESC = '-title'
+    STATUS = 'status'
+    STATUS_DESC = '-status'
+
+    @property
+    def field(self) -> str:
+        """Name of the model attribute used as sort key."""
+        return self.value.lstrip('-')
+
+    @property
+    def descending(self) -> bool:
+        """True if the ordering is descending."""
+        return self.value.startswith('-')
@@ -0,0 +1,107 @@
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+class PoolTelemetry:
+    """
+    Checkout statistics of a connection pool.
+
+    Attributes:
+        checkouts (int): Successful connection checkouts.
+        timeouts (int): Checkouts failed with pool timeout.
+        wait_time_sum (float): Total time spent in checkouts in seconds.
+        wait_time_buckets (list[int]): Non-cumulative number of checkouts
+            per `WAIT_TIME_BUCKETS` upper bound, the last one is `+Inf`.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_sum = 0.0
+        self.wait_time_buckets = [0] * (len(WAIT_TIME_BUCKETS) + 1)
+
+    def observe(self, wait_time: float, timed_out: bool = False) -> None:
+        """
+        Record a single checkout.
+
+        Args:
+            wait_time (float): Time the checkout took in seconds.
+            timed_out (bool): True if the checkout hit the pool timeout.
+        """
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_time_sum += wait_time
+        self.wait_time_buckets[bisect_left(WAIT_TIME_BUCKETS, wait_time)] += 1
+
+    def wait_time_histogram(self) -> dict[str, int]:
+        """
+        Return the wait time histogram with cumulative bucket counts.
+
+        Returns:
+            dict[str, int]: Number of checkouts not longer than each bound.
+        """
+        histogram = {}
+        total = 0
+        for bound, count in zip(
+            (*map(str, WAIT_TIME_BUCKETS), '+Inf'), self.wait_time_buckets
+        ):
+            total += count
+            histogram[bound] = total
+        return histogram
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records checkout wait times and timeouts.
+
+    Attributes:
+        telemetry (PoolTelemetry): Checkout statistics, kept when the pool
+            is recreated by `engine.dispose()`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.telemetry.observe(time.perf_counter() - start, True)
+            raise
+        self.telemetry.observe(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.telemetry = self.telemetry
+        return pool
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Describe the current pool state and checkout statistics.
+
+        Returns:
+            dict[str, Any]: Pool gauges and counters.
+        """
+        return {
+            'size': self.size(),
+            'checked_out': self.checkedout(),
+            'checked_in': self.checkedin(),
+            'overflow': self.overflow(),
+            'max_overflow': self._max_overflow,
+            'timeout': self.timeout(),
+            'checkouts': self.telemetry.checkouts,
+            'timeouts': self.telemetry.timeouts,
+            'wait_time_sum': self.telemetry.wait_time_sum,
+            'wait_time_histogram': self.telemetry.wait_time_histogram(),
+        }
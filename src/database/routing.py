@@ -0,0 +1,233 @@
+import asyncio
+import itertools
+import math
+import time
+from typing import Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import sessionmaker
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import instrument_engine
+from src.database.pool import InstrumentedAsyncQueuePool
+
+POSTGRESQL_REPLICATION_LAG_QUERY = (
+    'SELECT CASE '
+    'WHEN NOT pg_is_in_recovery() '
+    'OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE('
+    'EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) '
+    'END'
+)
+LAST_WRITE_COOKIE = 'last_write_at'
+WRITE_REQUEST_STATE = 'wrote_primary'
+REPLICA_SESSION = 'replica'
+FRESH_READ = 'fresh_read'
+
+
+class Replica:
+    """
+    Read replica of the database.
+
+    Attributes:
+        engine (AsyncEngine): Engine connected to the replica.
+        session_factory (sessionmaker): Factory of replica sessions,
+            marked with `REPLICA_SESSION` in their info.
+        healthy (bool): Result of the last health check.
+        lag (float | None): Replication lag in seconds from the last check.
+        checked_at (float): Monotonic time of the last health check.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        instrument_engine(engine.sync_engine)
+        self.session_factory = sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            info={REPLICA_SESSION: True},
+        )
+        self.healthy = True
+        self.lag: Optional[float] = None
+        self.checked_at = float('-inf')
+
+
+class ReplicaRouter:
+    """
+    Round-robin router of read-only sessions over read replicas.
+
+    Reads fall back to the primary if there are no replicas, no replica
+    passes the health check, or the reading client has committed a write
+    less than `read_your_writes_window` seconds ago.
+
+    Attributes:
+        replicas (list[Replica]): Configured replicas.
+        max_lag (float): Maximum tolerated replication lag in seconds,
+            0 or less disables the lag check.
+        health_check_interval (float): Seconds between health checks
+            of a replica.
+        health_check_timeout (float): Seconds a health check may take,
+            a slower replica counts as unhealthy.
+        read_your_writes_window (float): Seconds after a write during
+            which reads of the writing client stay on the primary.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        engine_options: Optional[dict] = None,
+        max_lag: float = 0,
+        health_check_interval: float = 5,
+        health_check_timeout: float = 0.5,
+        read_your_writes_window: float = 0,
+    ):
+        self.replicas = [
+            Replica(
+                create_async_engine(
+                    url,
+                    poolclass=InstrumentedAsyncQueuePool,
+                    **(engine_options or {}),
+                )
+            )
+            for url in urls
+        ]
+        self.max_lag = max_lag
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.read_your_writes_window = read_your_writes_window
+        self._counter = itertools.count()
+
+    async def choose(
+        self,
+        last_write_at: Optional[float] = None,
+    ) -> Optional[Replica]:
+        """
+        Pick the next usable replica for a read.
+
+        Args:
+            last_write_at (float | None): Unix time of the last write
+                of the reading client, if known.
+
+        Returns:
+            Replica | None: Replica to read from, or None if the read
+                must go to the primary.
+        """
+        if not self.replicas or self.wrote_recently(last_write_at):
+            return None
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._counter) % len(self.replicas)]
+            if time.monotonic() - replica.checked_at >= (
+                self.health_check_interval
+            ):
+                await self.check(replica)
+            if replica.healthy:
+                return replica
+        return None
+
+    def wrote_recently(self, last_write_at: Optional[float]) -> bool:
+        """
+        Tell whether a client wrote within the read-your-writes window.
+
+        Args:
+            last_write_at (float | None): Unix time of the last write
+                of the client, if known.
+
+        Returns:
+            bool: True if reads of the client must see its write.
+        """
+        return (
+            last_write_at is not None
+            and time.time() - last_write_at < self.read_your_writes_window
+        )
+
+    async def check(self, replica: Replica) -> None:
+        """
+        Check that a replica is reachable and not lagging too much.
+
+        The check runs inline in a read, so it gives up after
+        `health_check_timeout` seconds.
+
+        Args:
+            replica (Replica): Replica to check.
+        """
+        replica.checked_at = time.monotonic()
+        try:
+            replica.lag = await asyncio.wait_for(
+                self._measure_lag(replica), self.health_check_timeout
+            )
+        except (SQLAlchemyError, OSError, asyncio.TimeoutError):
+            replica.healthy = False
+            replica.lag = None
+            return
+        replica.healthy = self.max_lag <= 0 or replica.lag <= self.max_lag
+
+    async def _measure_lag(self, replica: Replica) -> float:
+        """Query the replication lag of a replica in seconds."""
+        async with replica.engine.connect() as connection:
+            if connection.dialect.name == 'postgresql':
+                return float(
+                    (
+                        await connection.execute(
+                            text(POSTGRESQL_REPLICATION_LAG_QUERY)
+                        )
+                    ).scalar()
+                )
+            await connection.execute(text('SELECT 1'))
+            return 0.0
+
+    async def dispose(self) -> None:
+        """Close connections of all replicas."""
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware remembering the last write of a client in a cookie.
+
+    Successful responses of requests that opened a write session set
+    the `last_write_at` cookie to the time of the response, that is
+    after the write has been committed. Reads sending the cookie back
+    stay on the primary for `window` seconds.
+
+    Attributes:
+        app (ASGIApp): Wrapped application.
+        window (float): Read-your-writes window in seconds, 0 or less
+            disables the cookie.
+    """
+
+    def __init__(self, app: ASGIApp, window: float):
+        self.app = app
+        self.window = window
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http' or self.window <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                message['type'] == 'http.response.start'
+                and message['status'] < 400
+                and scope.get('state', {}).get(WRITE_REQUEST_STATE)
+            ):
+                cookie = (
+                    f'{LAST_WRITE_COOKIE}={time.time():.3f}; '
+                    f'Max-Age={math.ceil(self.window)}; Path=/; '
+                    'HttpOnly; SameSite=lax'
+                )
+                message['headers'] = [
+                    *message.get('headers', []),
+                    (b'set-cookie', cookie.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,73 @@
+from sqlalchemy import DDL, Table, event
+
+SEARCH_CONFIG = 'simple'
+
+POSTGRESQL_SEARCH_DDL = (
+    'ALTER TABLE task ADD COLUMN search_vector tsvector '
+    'GENERATED ALWAYS AS ('
+    f"to_tsvector('{SEARCH_CONFIG}', "
+    "coalesce(title, '') || ' ' || coalesce(description, ''))"
+    ') STORED',
+    'CREATE INDEX ix_task_search_vector ON task USING gin (search_vector)',
+)
+
+SQLITE_SEARCH_KEY = (
+    '(SELECT id FROM task_fts_key WHERE uuid = {row}.uuid)'
+)
+
+SQLITE_SEARCH_DDL = (
+    'CREATE TABLE task_fts_key ('
+    'id INTEGER PRIMARY KEY, uuid CHAR(32) NOT NULL UNIQUE)',
+    'CREATE VIRTUAL TABLE task_fts USING fts5(title, description)',
+    'CREATE TRIGGER task_fts_insert AFTER INSERT ON task BEGIN '
+    'INSERT INTO task_fts_key (uuid) VALUES (new.uuid); '
+    'INSERT INTO task_fts (rowid, title, description) VALUES ('
+    f"{SQLITE_SEARCH_KEY.format(row='new')}, "
+    'new.title, new.description); END',
+    'CREATE TRIGGER task_fts_delete AFTER DELETE ON task BEGIN '
+    'DELETE FROM task_fts WHERE rowid = '
+    f"{SQLITE_SEARCH_KEY.format(row='old')}; "
+    'DELETE FROM task_fts_key WHERE uuid = old.uuid; END',
+    'CREATE TRIGGER task_fts_update AFTER UPDATE OF title, description '
+    'ON task BEGIN '
+    'UPDATE task_fts SET title = new.title, description = new.description '
+    f"WHERE rowid = {SQLITE_SEARCH_KEY.format(row='new')}; END",
+)
+
+SQLITE_SEARCH_DROP_DDL = (
+    'DROP TABLE IF EXISTS task_fts',
+    'DROP TABLE IF EXISTS task_fts_key',
+)
+
+
+def register_search_ddl(table: Table) -> None:
+    """
+    Attach full-text search DDL to creation of the task table.
+
+    PostgreSQL gets a generated `tsvector` column with a GIN index,
+    SQLite gets an FTS5 table kept in sync by triggers. FTS rows are
+    keyed by `task_fts_key`, an integer key per task UUID: the implicit
+    rowid of `task` may change on VACUUM. Migrations keep frozen
+    copies of these statements, change them with a new migration.
+
+    Args:
+        table (Table): Task table.
+    """
+    for statement in POSTGRESQL_SEARCH_DDL:
+        event.listen(
+            table,
+            'after_create',
+            DDL(statement).execute_if(dialect='postgresql'),
+        )
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(
+            table,
+            'after_create',
+            DDL(statement).execute_if(dialect='sqlite'),
+        )
+    for statement in SQLITE_SEARCH_DROP_DDL:
+        event.listen(
+            table,
+            'before_drop',
+            DDL(statement).execute_if(dialect='sqlite'),
+        )
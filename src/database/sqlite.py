@@ -0,0 +1,121 @@
+import asyncio
+import weakref
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+WRITE_SESSION = 'write_session'
+WRITER_TURN = 'single_writer_turn'
+
+
+def register_sqlite_pragmas(engine: Engine, pragmas: dict[str, Any]) -> None:
+    """
+    Run PRAGMA statements on every new connection of a SQLite engine.
+
+    Args:
+        engine (Engine): Synchronous engine of the database.
+        pragmas (dict[str, Any]): PRAGMA values by name, applied in order.
+    """
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name} = {value}')
+        finally:
+            cursor.close()
+
+
+def register_sqlite_transactions(engine: Engine) -> None:
+    """
+    Let SQLAlchemy, not the driver, begin SQLite transactions.
+
+    The `sqlite3` module begins a transaction only before DML and treats
+    a SAVEPOINT outside of one as the transaction itself, so releasing
+    it commits. With the driver in autocommit mode and an explicit
+    `BEGIN` per transaction, SAVEPOINTs nest inside the session
+    transaction and nothing is durable before its COMMIT. Connections
+    with the AUTOCOMMIT isolation level, e.g. for VACUUM, get no BEGIN.
+
+    Args:
+        engine (Engine): Synchronous engine of the database.
+    """
+    @event.listens_for(engine, 'connect')
+    def _disable_driver_transactions(
+        dbapi_connection, connection_record
+    ) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _begin(connection) -> None:
+        isolation_level = connection.get_execution_options().get(
+            'isolation_level'
+        )
+        if isolation_level == 'AUTOCOMMIT':
+            return
+        # Straight to the driver: like BEGIN of other drivers, it is
+        # not a statement of the request for query accounting.
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute('BEGIN')
+        finally:
+            cursor.close()
+
+
+class SingleWriter:
+    """
+    FIFO queue of write transactions of one process.
+
+    SQLite has a single writer. Concurrent writers of a process queue
+    here instead of polling the database lock in the busy handler and
+    failing with `database is locked` when a read transaction cannot
+    be upgraded. Writers of other processes still rely on
+    `busy_timeout`.
+    """
+
+    def __init__(self):
+        self._locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+
+    def _lock(self) -> asyncio.Lock:
+        """Return the queue of the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    def register(self, session_class: type[Session]) -> None:
+        """
+        Queue the transactions of write sessions of a session class.
+
+        A session with `info[WRITE_SESSION]` set waits for its turn when
+        it begins a transaction and gives the turn back when the
+        transaction ends, so a session committing several times lets
+        other writers in between. Other sessions never wait.
+
+        Args:
+            session_class (type[Session]): Synchronous session class of
+                the asynchronous sessions.
+        """
+        @event.listens_for(session_class, 'after_begin')
+        def _wait_for_turn(session, transaction, connection) -> None:
+            if not session.info.get(WRITE_SESSION):
+                return
+            if WRITER_TURN in session.info:
+                return
+            lock = self._lock()
+            connection.connection.dbapi_connection.run_async(
+                lambda driver_connection: lock.acquire()
+            )
+            session.info[WRITER_TURN] = lock
+
+        @event.listens_for(session_class, 'after_transaction_end')
+        def _give_turn_back(session, transaction) -> None:
+            if transaction.parent is not None:
+                return
+            lock = session.info.pop(WRITER_TURN, None)
+            if lock is not None:
+                lock.release()
@@ -1,7 +1,22 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.api.routers import main_router
+from src.api.serializers import TimedJSONResponse
 from src.core.config import settings
+from src.core.jobs import (
+    archive_completed_tasks,
+    flush_metrics,
+    purge_task_tombstones,
+    reconcile_task_status_counters,
+    run_periodically,
+)
+from src.core.metrics import MetricsMiddleware, metrics
+from src.crud.task import task_crud
+from src.database.db import engine, replica_router
+from src.database.routing import ReadYourWritesMiddleware
 
 
 APP_DESCRIPTION = """
@@ -24,6 +39,57 @@ This API allows you to manage tasks:
 """
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start background jobs of the application and stop them on shutdown.
+    """
+    jobs = []
+    if settings.stats_reconcile_interval > 0:
+        jobs.append(
+            asyncio.create_task(
+                run_periodically(
+                    reconcile_task_status_counters,
+                    settings.stats_reconcile_interval,
+                )
+            )
+        )
+    if settings.sync_tombstone_purge_interval > 0:
+        jobs.append(
+            asyncio.create_task(
+                run_periodically(
+                    purge_task_tombstones,
+                    settings.sync_tombstone_purge_interval,
+                )
+            )
+        )
+    if settings.archive_interval > 0:
+        jobs.append(
+            asyncio.create_task(
+                run_periodically(
+                    archive_completed_tasks, settings.archive_interval
+                )
+            )
+        )
+    if settings.metrics_multiproc_dir:
+        jobs.append(
+            asyncio.create_task(
+                run_periodically(
+                    flush_metrics, settings.metrics_flush_interval
+                )
+            )
+        )
+    await task_crud.feed.start(engine)
+    yield
+    await task_crud.feed.stop()
+    for job in jobs:
+        job.cancel()
+    await asyncio.gather(*jobs, return_exceptions=True)
+    if settings.metrics_multiproc_dir:
+        metrics.flush(settings.metrics_multiproc_dir, final=True)
+    await replica_router.dispose()
+
+
 app = FastAPI(
     title=settings.fastapi_title,
     description=settings.fastapi_description or APP_DESCRIPTION,
@@ -33,5 +99,17 @@ app = FastAPI(
         "url": "https://github.com/KonstantinPohodyaev",
         "email": "konstantinpohodyaev@email.com",
     },
+    lifespan=lifespan,
+    default_response_class=TimedJSONResponse,
 )
 app.router.include_router(main_router)
+app.add_middleware(
+    ReadYourWritesMiddleware,
+    window=settings.db_read_your_writes_window,
+)
+app.add_middleware(
+    MetricsMiddleware,
+    routes=app.routes,
+    query_accounting=settings.query_accounting,
+    repeat_threshold=settings.query_repeat_threshold,
+)
@@ -1,2 +1,5 @@
 from src.models.base import BaseModel  # noqa
-from src.models.task import Task  # noqa
\ No newline at end of file
+from src.models.task import Task  # noqa
+from src.models.task_status_counter import TaskStatusCounter  # noqa
+from src.models.task_tombstone import TaskTombstone  # noqa
+from src.models.task_archive import TaskArchive  # noqa
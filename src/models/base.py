@@ -1,3 +1,9 @@
+import os
+import time
+from datetime import datetime, timezone
+from typing import Callable
+from uuid import UUID, uuid4
+
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase, declared_attr
 
@@ -21,3 +27,67 @@ class BaseModel(AsyncAttrs, DeclarativeBase):
             str: Lowercase name of the class as table name.
         """
         return cls.__name__.lower()
+
+
+def utc_now() -> datetime:
+    """
+    Current time for timestamp columns.
+
+    Returns:
+        datetime: Timezone-aware current UTC time.
+    """
+    return datetime.now(timezone.utc)
+
+
+_last_uuid7_timestamp = 0
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID version 7 (RFC 9562).
+
+    48 bits of Unix time in milliseconds are followed by 12 bits of
+    sub-millisecond time and 62 random bits. Values generated by one
+    process are strictly increasing, so new primary keys are appended
+    at the right edge of the index instead of random pages.
+
+    Returns:
+        UUID: New UUID version 7.
+    """
+    global _last_uuid7_timestamp
+    nanoseconds = time.time_ns()
+    timestamp = (nanoseconds // 1_000_000) << 12 | (
+        nanoseconds % 1_000_000 * 4096 // 1_000_000
+    )
+    if timestamp <= _last_uuid7_timestamp:
+        timestamp = _last_uuid7_timestamp + 1
+    _last_uuid7_timestamp = timestamp
+    return UUID(
+        int=(timestamp >> 12) << 80
+        | 7 << 76
+        | (timestamp & 0xfff) << 64
+        | 0b10 << 62
+        | int.from_bytes(os.urandom(8)) >> 2
+    )
+
+
+UUID_FACTORIES: dict[int, Callable[[], UUID]] = {4: uuid4, 7: uuid7}
+
+
+def uuid_factory(version: int) -> Callable[[], UUID]:
+    """
+    Generator of primary keys of the given UUID version.
+
+    Args:
+        version (int): `4` for random or `7` for time-ordered UUIDs.
+
+    Raises:
+        ValueError: If the version is not supported.
+
+    Returns:
+        Callable[[], UUID]: Function returning a new UUID.
+    """
+    try:
+        return UUID_FACTORIES[version]
+    except KeyError:
+        raise ValueError(f'Unsupported UUID version `{version}`!')
@@ -1,8 +1,15 @@
-from uuid import UUID, uuid4
+from datetime import datetime
+from uuid import UUID
+from sqlalchemy import DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.core.config import settings
+from src.database.counters import register_counter_ddl
 from src.database.enums import StatusEnum
-from src.models.base import BaseModel
+from src.database.search import register_search_ddl
+from src.models.base import BaseModel, utc_now, uuid_factory
+
+CLAIMABLE_TASKS = "status = 'CREATED'"
 
 
 class Task(BaseModel):
@@ -11,14 +18,52 @@ class Task(BaseModel):
 
     Attributes:
         uuid (UUID): Unique identifier of the task, primary key.
+            - Random (v4) or time-ordered (v7) by `TASK_UUID_VERSION`.
         title (str): Title of the task, required.
         description (str | None): Optional description of the task.
         status (StatusEnum): Current status of the task.
+        version (int): Row version, incremented on every update.
+            - Used for ETags and optimistic concurrency.
+        created_at (datetime): Time the task was created.
+        updated_at (datetime): Time of the last change of the task.
+            - Used as the high-water mark of delta sync.
+
+    Composite `(sort_key, uuid)` indexes back the keyset pagination
+    of the task list and its status filter. A partial index covers
+    the hot set of not completed tasks, a pattern index on PostgreSQL
+    covers title prefix filters. `(updated_at, uuid)` backs delta sync.
+    A partial `(created_at, uuid)` index of created tasks keeps claims
+    of the work queue a short index scan however many tasks are done.
     """
 
+    __table_args__ = (
+        Index('ix_task_title_uuid', 'title', 'uuid'),
+        Index('ix_task_status_uuid', 'status', 'uuid'),
+        Index(
+            'ix_task_active_status_uuid',
+            'status',
+            'uuid',
+            postgresql_where=text("status <> 'COMPLETED'"),
+            sqlite_where=text("status <> 'COMPLETED'"),
+        ),
+        Index(
+            'ix_task_title_pattern',
+            'title',
+            postgresql_ops={'title': 'text_pattern_ops'},
+        ).ddl_if(dialect='postgresql'),
+        Index('ix_task_updated_at_uuid', 'updated_at', 'uuid'),
+        Index(
+            'ix_task_claimable_created_at_uuid',
+            'created_at',
+            'uuid',
+            postgresql_where=text(CLAIMABLE_TASKS),
+            sqlite_where=text(CLAIMABLE_TASKS),
+        ),
+    )
+
     uuid: Mapped[UUID] = mapped_column(
         primary_key=True,
-        default=uuid4,
+        default=uuid_factory(settings.task_uuid_version),
     )
     title: Mapped[str] = mapped_column(
         nullable=False,
@@ -29,3 +74,27 @@ class Task(BaseModel):
     status: Mapped[StatusEnum] = mapped_column(
         nullable=False,
     )
+    version: Mapped[int] = mapped_column(
+        nullable=False,
+        default=1,
+        server_default='1',
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+        onupdate=utc_now,
+    )
+
+    __mapper_args__ = {
+        'version_id_col': version,
+    }
+
+
+register_search_ddl(Task.__table__)
+register_counter_ddl(Task.__table__)
@@ -0,0 +1,70 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.counters import register_counter_ddl
+from src.database.enums import StatusEnum
+from src.models.base import BaseModel, utc_now
+
+
+class TaskArchive(BaseModel):
+    """
+    Completed task moved out of the live `task` table.
+
+    Has the columns of `Task`, so both tables can be read as one.
+    Archived tasks are never changed, only deleted. Triggers count them
+    in the task status counters.
+
+    Attributes:
+        uuid (UUID): Unique identifier of the task, primary key.
+        title (str): Title of the task.
+        description (str | None): Optional description of the task.
+        status (StatusEnum): Status of the task, always completed.
+        version (int): Last row version of the task.
+        created_at (datetime): Time the task was created.
+        updated_at (datetime): Time of the last change of the task.
+        archived_at (datetime): Time the task was archived.
+
+    `(sort_key, uuid)` indexes back the keyset pagination of task lists
+    that include archived tasks.
+    """
+
+    __tablename__ = 'task_archive'
+    __table_args__ = (
+        Index('ix_task_archive_title_uuid', 'title', 'uuid'),
+        Index('ix_task_archive_status_uuid', 'status', 'uuid'),
+    )
+
+    uuid: Mapped[UUID] = mapped_column(
+        primary_key=True,
+    )
+    title: Mapped[str] = mapped_column(
+        nullable=False,
+    )
+    description: Mapped[str] = mapped_column(
+        nullable=True,
+    )
+    status: Mapped[StatusEnum] = mapped_column(
+        nullable=False,
+    )
+    version: Mapped[int] = mapped_column(
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+    )
+
+
+register_counter_ddl(TaskArchive.__table__, archive=True)
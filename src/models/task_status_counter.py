@@ -0,0 +1,27 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.enums import StatusEnum
+from src.models.base import BaseModel
+
+
+class TaskStatusCounter(BaseModel):
+    """
+    Number of tasks with each status.
+
+    Rows are maintained by triggers on the task table, so they change
+    in the same transaction as every write to tasks.
+
+    Attributes:
+        status (StatusEnum): Task status, primary key.
+        count (int): Number of tasks with the status.
+    """
+
+    __tablename__ = 'task_status_counter'
+
+    status: Mapped[StatusEnum] = mapped_column(
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import BaseModel, utc_now
+
+
+class TaskTombstone(BaseModel):
+    """
+    Marker of a deleted task, kept for delta sync clients.
+
+    Tombstones are written in the same transaction as the delete and
+    purged after the sync retention period.
+
+    Attributes:
+        uuid (UUID): Unique identifier of the deleted task, primary key.
+        deleted_at (datetime): Time the task was deleted.
+    """
+
+    __tablename__ = 'task_tombstone'
+    __table_args__ = (
+        Index('ix_task_tombstone_deleted_at_uuid', 'deleted_at', 'uuid'),
+    )
+
+    uuid: Mapped[UUID] = mapped_column(
+        primary_key=True,
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+    )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -120,3 +120,105 @@ class TaskUpdate(BaseTask):
     model_config = ConfigDict(
         title='Task update schema'
     )
+
+
+class TaskBulkCreateError(BaseModel):
+    """
+    Schema of a rejected item of a bulk create request.
+
+    Fields:
+        index (int): Position of the item in the request body.
+        detail (list[dict]): Validation errors of the item.
+    """
+    index: int
+    detail: list[dict[str, Any]]
+
+    model_config = ConfigDict(
+        title='Task bulk create error schema'
+    )
+
+
+class TaskBulkCreateResult(BaseModel):
+    """
+    Schema of a bulk create response.
+
+    Fields:
+        created (list[TaskRead]): Created tasks in request order.
+        errors (list[TaskBulkCreateError]): Items that were not created.
+    """
+    created: list[TaskRead]
+    errors: list[TaskBulkCreateError]
+
+    model_config = ConfigDict(
+        title='Task bulk create result schema'
+    )
+
+
+class TaskBulkDeleteResult(BaseModel):
+    """
+    Schema of a bulk delete response.
+
+    Fields:
+        deleted (list[UUID]): UUIDs of deleted tasks.
+        missing (list[UUID]): Requested UUIDs that did not exist.
+    """
+    deleted: list[UUID]
+    missing: list[UUID]
+
+    model_config = ConfigDict(
+        title='Task bulk delete result schema'
+    )
+
+
+class TaskBatchGetResult(BaseModel):
+    """
+    Schema of a batch get response.
+
+    Fields:
+        found (list[TaskRead]): Found tasks in request order.
+        missing (list[UUID]): Requested UUIDs that do not exist.
+    """
+    found: list[TaskRead]
+    missing: list[UUID]
+
+    model_config = ConfigDict(
+        title='Task batch get result schema'
+    )
+
+
+class TaskStats(BaseModel):
+    """
+    Schema of task counters.
+
+    Fields:
+        total (int): Number of tasks.
+        by_status (dict[StatusEnum, int]): Number of tasks by status.
+        approximate (bool): True if `total` is an estimate.
+    """
+    total: int
+    by_status: dict[StatusEnum, int]
+    approximate: bool = False
+
+    model_config = ConfigDict(
+        title='Task stats schema'
+    )
+
+
+class TaskChanges(BaseModel):
+    """
+    Schema of a delta sync response.
+
+    Fields:
+        changed (list[TaskRead]): Tasks created or updated since the token.
+        deleted (list[UUID]): UUIDs of tasks deleted since the token.
+        next_token (str): Token to pass as `since` in the next request.
+        has_more (bool): True if more changes are waiting.
+    """
+    changed: list[TaskRead]
+    deleted: list[UUID]
+    next_token: str
+    has_more: bool
+
+    model_config = ConfigDict(
+        title='Task changes schema'
+    )
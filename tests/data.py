@@ -0,0 +1,10 @@
+"""
+Data shared by the test modules.
+"""
+
+# Request body of a new task
+CREATE_DATA = {
+    'title': 'Test Task',
+    'description': 'Desc',
+    'status': 'created'
+}
@@ -0,0 +1,136 @@
+"""
+Tests for archival of completed tasks.
+
+Includes tests for:
+- Moving completed tasks to the archive in batches
+- One write transaction per archived batch
+- Reading archived tasks by UUID and in task lists
+- Updating and deleting archived tasks
+"""
+
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, select
+
+from data import CREATE_DATA
+from src.api.pagination import NEXT_CURSOR_HEADER
+from src.core.config import settings
+from src.core.jobs import archive_completed_tasks
+from src.crud.task import task_crud
+from src.models.task import Task
+from src.models.task_archive import TaskArchive
+
+
+async def create_and_archive(async_client) -> tuple[list[str], list[str]]:
+    """Create live and completed tasks and archive the completed ones."""
+    response = await async_client.post(
+        '/tasks/bulk',
+        json=[CREATE_DATA] * 2 + [{**CREATE_DATA, 'status': 'completed'}] * 3,
+    )
+    created = response.json()['created']
+    live = [task['uuid'] for task in created[:2]]
+    archived = [task['uuid'] for task in created[2:]]
+    with patch.multiple(settings, archive_after=-60, archive_batch_size=2):
+        await archive_completed_tasks()
+    return live, archived
+
+
+@pytest.mark.asyncio
+async def test_archive_completed_tasks(async_client, session):
+    """
+    Test the archival job moves only completed tasks to the archive.
+    """
+    live, archived = await create_and_archive(async_client)
+    assert set(
+        (await session.execute(select(Task.uuid))).scalars().all()
+    ) == {UUID(uuid) for uuid in live}
+    assert (
+        await session.execute(select(func.count()).select_from(TaskArchive))
+    ).scalar() == len(archived)
+    response = await async_client.get(f'/tasks/{archived[0]}')
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['status'] == 'completed'
+    response = await async_client.get(
+        f'/tasks/{archived[0]}',
+        headers={'If-None-Match': response.headers['ETag']},
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.asyncio
+async def test_archive_batches_use_own_sessions(async_client):
+    """
+    Test every batch of the archival job runs in a session of its own.
+    """
+    archive_completed = task_crud.archive_completed
+    sessions = []
+
+    async def record_session(before, limit, session):
+        sessions.append(session)
+        return await archive_completed(before, limit, session)
+
+    with patch.object(task_crud, 'archive_completed', record_session):
+        await create_and_archive(async_client)
+    assert len(sessions) == 2
+    assert sessions[0] is not sessions[1]
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_include_archived(async_client):
+    """
+    Test GET /tasks lists archived tasks only with include_archived.
+    """
+    live, archived = await create_and_archive(async_client)
+    response = await async_client.get('/tasks')
+    assert sorted(task['uuid'] for task in response.json()) == sorted(live)
+    uuids = []
+    params = {'include_archived': True, 'limit': 2}
+    while True:
+        response = await async_client.get('/tasks', params=params)
+        uuids.extend(task['uuid'] for task in response.json())
+        if NEXT_CURSOR_HEADER not in response.headers:
+            break
+        params['cursor'] = response.headers[NEXT_CURSOR_HEADER]
+    assert uuids == sorted(live + archived)
+    response = await async_client.get(
+        '/tasks',
+        params={'include_archived': True, 'status': 'completed'},
+        headers={'Accept': 'application/x-ndjson'},
+    )
+    assert sorted(
+        json.loads(line)['uuid'] for line in response.text.splitlines()
+    ) == sorted(archived)
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_archived_tasks(async_client):
+    """
+    Test archived tasks cannot be updated as completed ones, and are
+    deleted with tombstones.
+    """
+    live, archived = await create_and_archive(async_client)
+    response = await async_client.patch(
+        f'/tasks/{archived[0]}', json={'title': 'New title'}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert 'already completed' in response.json()['detail']
+    response = await async_client.delete(f'/tasks/{archived[0]}')
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    response = await async_client.get(f'/tasks/{archived[0]}')
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    response = await async_client.delete(
+        '/tasks', params={'uuid': [live[0], archived[1], archived[0]]}
+    )
+    assert response.json() == {
+        'deleted': [live[0], archived[1]],
+        'missing': [archived[0]],
+    }
+    with patch.object(settings, 'sync_settle_window', 0):
+        response = await async_client.get('/tasks/changes')
+    assert sorted(response.json()['deleted']) == sorted(
+        [live[0], *archived[:2]]
+    )
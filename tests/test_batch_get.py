@@ -0,0 +1,65 @@
+"""
+Tests for batch reads of tasks by UUID.
+
+Includes tests for:
+- Batch get endpoint with missing and repeated UUIDs
+- Batching and de-duplication of loader reads
+"""
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from data import CREATE_DATA
+from src.crud.loader import Loader
+
+
+@pytest.mark.asyncio
+async def test_batch_get_tasks(async_client):
+    """
+    Test POST /tasks/batch-get returns found tasks and missing UUIDs.
+    """
+    response = await async_client.post('/tasks/bulk', json=[CREATE_DATA] * 3)
+    uuids = [task['uuid'] for task in response.json()['created']]
+    unknown = str(uuid4())
+    response = await async_client.post(
+        '/tasks/batch-get',
+        json=[uuids[2], unknown, uuids[0], uuids[2]],
+    )
+    assert response.status_code == HTTPStatus.OK
+    result = response.json()
+    assert [task['uuid'] for task in result['found']] == [
+        uuids[2], uuids[0]
+    ]
+    assert result['found'][0]['title'] == CREATE_DATA['title']
+    assert result['missing'] == [unknown]
+    response = await async_client.post('/tasks/batch-get', json=[])
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_loader_batches_loads_of_one_tick():
+    """
+    Test Loader reads UUIDs loaded in the same tick with one query.
+    """
+    uuids = [uuid4() for _ in range(3)]
+    crud = AsyncMock()
+    crud.get_many.side_effect = lambda batch, session: {
+        uuid: f'task {uuid}' for uuid in batch if uuid != uuids[2]
+    }
+    loader = Loader(crud, session=None)
+    results = await asyncio.gather(
+        loader.load(uuids[0]),
+        loader.load(uuids[1]),
+        loader.load(uuids[0]),
+        loader.load(uuids[2]),
+    )
+    assert results == [
+        f'task {uuids[0]}', f'task {uuids[1]}', f'task {uuids[0]}', None
+    ]
+    crud.get_many.assert_awaited_once_with(uuids, None)
+    assert await loader.load(uuids[1]) == f'task {uuids[1]}'
+    assert crud.get_many.await_count == 1
@@ -0,0 +1,160 @@
+"""
+Tests for the task read cache.
+
+Includes tests for:
+- LRU eviction and TTL expiration of the in-process cache
+- Redis-protocol cache against a local stand-in client
+- Invalidation of cached tasks by write endpoints
+- Fresh and replica reads around the cache
+- Invalidation after the commit of the caller
+"""
+
+from http import HTTPStatus
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from data import CREATE_DATA
+from src.core.cache import MemoryCache, RedisCache
+from src.crud.task import task_crud
+from src.database.db import AsyncSessionLocal, write_session
+from src.database.routing import REPLICA_SESSION
+from src.schemas.task import TaskUpdate
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for `redis.asyncio.Redis`.
+
+    Implements only the commands used by RedisCache and ignores TTLs.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value.encode()
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_lru_eviction():
+    """
+    Test MemoryCache drops the least recently used entry when full.
+    """
+    cache = MemoryCache(max_size=2, ttl=60)
+    await cache.set('a', {'value': 1})
+    await cache.set('b', {'value': 2})
+    await cache.get('a')
+    await cache.set('c', {'value': 3})
+    assert await cache.get('b') is None
+    assert await cache.get('a') == {'value': 1}
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_ttl_expiration():
+    """
+    Test MemoryCache treats expired entries as misses.
+    """
+    cache = MemoryCache(max_size=2, ttl=0)
+    await cache.set('a', {'value': 1})
+    assert await cache.get('a') is None
+    assert cache.stats.expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_round_trip():
+    """
+    Test RedisCache stores JSON values and counts invalidations.
+    """
+    client = FakeRedis()
+    cache = RedisCache(client, ttl=60)
+    await cache.set('a', {'value': 1})
+    assert await cache.get('a') == {'value': 1}
+    await cache.delete('a', 'b')
+    assert await cache.get('a') is None
+    assert cache.stats.as_dict()['invalidations'] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_task_is_cached_and_invalidated(async_client):
+    """
+    Test GET /tasks/{uuid} is served from cache and PATCH invalidates it.
+    """
+    with patch.object(task_crud, 'cache', MemoryCache(100, 60)):
+        resp = await async_client.post('/tasks', json=CREATE_DATA)
+        task_uuid = resp.json()['uuid']
+        async_client.cookies.clear()
+        for _ in range(2):
+            await async_client.get(f'/tasks/{task_uuid}')
+        stats = (await async_client.get('/monitoring/cache')).json()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        await async_client.patch(
+            f'/tasks/{task_uuid}', json={'title': 'Updated Task'}
+        )
+        async_client.cookies.clear()
+        response = await async_client.get(f'/tasks/{task_uuid}')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['title'] == 'Updated Task'
+
+
+@pytest.mark.asyncio
+async def test_fresh_and_replica_reads_bypass_cache(async_client):
+    """
+    Test reads after an own write skip the cache and values read from
+    a replica are not stored.
+    """
+    cache = MemoryCache(100, 60)
+    with patch.object(task_crud, 'cache', cache):
+        resp = await async_client.post('/tasks', json=CREATE_DATA)
+        task_uuid = resp.json()['uuid']
+        await async_client.get(f'/tasks/{task_uuid}')
+        await async_client.get(f'/tasks/{task_uuid}')
+        assert cache.stats.hits == cache.stats.misses == 0
+        await cache.delete(task_crud._cache_key(UUID(task_uuid)))
+        async with AsyncSessionLocal(
+            info={REPLICA_SESSION: True}
+        ) as session:
+            assert await task_crud.get_cached(UUID(task_uuid), session)
+        assert cache.info()['size'] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_after_caller_commit(async_client):
+    """
+    Test writes with commit_on=False drop cached values only once the
+    caller commits.
+    """
+    cache = MemoryCache(100, 60)
+    with patch.object(task_crud, 'cache', cache):
+        resp = await async_client.post('/tasks', json=CREATE_DATA)
+        task_uuid = UUID(resp.json()['uuid'])
+        key = task_crud._cache_key(task_uuid)
+        async_client.cookies.clear()
+        await async_client.get(f'/tasks/{task_uuid}')
+        update_schema = TaskUpdate(title='Updated Task')
+        async with write_session() as session:
+            await task_crud.update_by_uuid(
+                task_uuid, update_schema, session, commit_on=False
+            )
+            assert await cache.get(key) is not None
+            await session.rollback()
+        assert await cache.get(key) is not None
+        async with write_session() as session:
+            async with session.begin_nested():
+                await task_crud.delete_many(
+                    [task_uuid], session, commit_on=False
+                )
+            assert await cache.get(key) is not None
+            await session.commit()
+        assert await cache.get(key) is None
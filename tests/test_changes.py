@@ -0,0 +1,155 @@
+"""
+Tests for the live task change feed.
+
+Includes tests for:
+- Events of committed creates, updates and deletes
+- Dropping events of rolled back transactions
+- Events of a coalesced batch with a failing write
+- Bounded queues of slow subscribers
+- Server-Sent Events framing of the stream
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from data import CREATE_DATA
+from src.api.streaming import stream_events
+from src.core.changes import Broadcaster, ChangeFeed
+from src.core.metrics import MetricsRegistry
+from src.crud.task import task_crud
+from src.database.coalescer import WriteCoalescer
+from src.database.db import AsyncSessionLocal
+from src.schemas.task import TaskCreate
+
+
+def parse_frame(frame: bytes) -> tuple[str, dict]:
+    """Split an event frame into its name and JSON data."""
+    event_line, data_line = frame.decode().strip().split('\n')
+    return (
+        event_line.removeprefix('event: '),
+        json.loads(data_line.removeprefix('data: ')),
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_feed_publishes_committed_writes(async_client):
+    """
+    Test create, update and delete endpoints publish change events.
+    """
+    async with task_crud.feed.broadcaster.subscribe() as subscription:
+        resp = await async_client.post('/tasks', json=CREATE_DATA)
+        task_uuid = resp.json()['uuid']
+        await async_client.patch(
+            f'/tasks/{task_uuid}', json={'title': 'Updated Task'}
+        )
+        await async_client.delete(f'/tasks/{task_uuid}')
+        events = [
+            parse_frame(subscription.queue.get_nowait()) for _ in range(3)
+        ]
+        assert subscription.queue.empty()
+    assert [event_type for event_type, _ in events] == [
+        'created', 'updated', 'deleted'
+    ]
+    assert events[0][1]['items'] == [{'uuid': task_uuid, 'version': 1}]
+    assert events[1][1]['items'] == [{'uuid': task_uuid, 'version': 2}]
+    assert events[2][1]['items'] == [{'uuid': task_uuid}]
+
+
+@pytest.mark.asyncio
+async def test_change_feed_skips_rolled_back_writes(session):
+    """
+    Test changes of a rolled back transaction are not published.
+    """
+    async with task_crud.feed.broadcaster.subscribe() as subscription:
+        await task_crud.create(
+            TaskCreate(**CREATE_DATA), session, commit_on=False
+        )
+        await session.rollback()
+        await task_crud.create(TaskCreate(**CREATE_DATA), session)
+        assert parse_frame(subscription.queue.get_nowait())[0] == 'created'
+        assert subscription.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_change_feed_of_batch_with_failed_write():
+    """
+    Test a coalesced batch publishes only its committed writes, after
+    the batch commits.
+    """
+    coalescer = WriteCoalescer(
+        AsyncSessionLocal,
+        window=0.05,
+        max_batch_size=10,
+        registry=MetricsRegistry(),
+    )
+    published_before_commit = []
+
+    def create(batch_session):
+        return task_crud.create(
+            TaskCreate(**CREATE_DATA), batch_session, commit_on=False
+        )
+
+    async def fail(batch_session):
+        await create(batch_session)
+        raise HTTPException(status_code=400)
+
+    async def check_nothing_published(batch_session):
+        published_before_commit.append(subscription.queue.qsize())
+
+    async with task_crud.feed.broadcaster.subscribe() as subscription:
+        first, _, second, _ = await asyncio.gather(
+            coalescer.submit(create),
+            coalescer.submit(fail),
+            coalescer.submit(create),
+            coalescer.submit(check_nothing_published),
+            return_exceptions=True,
+        )
+        events = []
+        while not subscription.queue.empty():
+            events.append(parse_frame(subscription.queue.get_nowait()))
+    assert published_before_commit == [0]
+    assert events == [
+        (
+            'created',
+            {
+                'type': 'created',
+                'items': [{'uuid': str(task.uuid), 'version': 1}],
+            },
+        )
+        for task in (first, second)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_broadcaster_drops_slow_subscriber():
+    """
+    Test a subscriber with a full queue is closed instead of growing.
+    """
+    broadcaster = Broadcaster(queue_size=2)
+    async with broadcaster.subscribe() as slow:
+        for number in range(3):
+            broadcaster.publish(f'frame {number}'.encode())
+        assert slow.queue.get_nowait() is None
+        assert slow not in broadcaster.subscriptions
+
+
+@pytest.mark.asyncio
+async def test_stream_events_frames():
+    """
+    Test the SSE stream sends keep-alives, events and overflow.
+    """
+    feed = ChangeFeed('test_changes', queue_size=1)
+    stream = stream_events(feed, heartbeat=0.01)
+    assert await anext(stream) == b': connected\n\n'
+    assert await anext(stream) == b': keep-alive\n\n'
+    feed.dispatch(json.dumps({'type': 'created', 'items': []}))
+    assert parse_frame(await anext(stream))[0] == 'created'
+    feed.dispatch(json.dumps({'type': 'created', 'items': []}))
+    feed.dispatch(json.dumps({'type': 'deleted', 'items': []}))
+    assert parse_frame(await anext(stream))[0] == 'overflow'
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+    assert not feed.broadcaster.subscriptions
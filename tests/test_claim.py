@@ -0,0 +1,68 @@
+"""
+Tests for claiming tasks of the work queue.
+
+Includes tests for:
+- Claiming the oldest created tasks
+- Concurrent claims never returning the same task
+"""
+
+import asyncio
+from http import HTTPStatus
+from uuid import UUID
+
+import pytest
+
+from data import CREATE_DATA
+from src.api.etag import task_etag
+
+
+@pytest.mark.asyncio
+async def test_claim_tasks(async_client):
+    """
+    Test POST /tasks/claim moves the oldest created tasks to in progress.
+    """
+    uuids = []
+    for number in range(3):
+        response = await async_client.post(
+            '/tasks', json={**CREATE_DATA, 'title': f'Task {number}'}
+        )
+        uuids.append(response.json()['uuid'])
+    await async_client.post(
+        '/tasks', json={**CREATE_DATA, 'status': 'completed'}
+    )
+    response = await async_client.post('/tasks/claim', params={'n': 2})
+    assert response.status_code == HTTPStatus.OK
+    claimed = response.json()
+    assert [task['uuid'] for task in claimed] == uuids[:2]
+    assert all(task['status'] == 'in_progress' for task in claimed)
+    response = await async_client.get(f'/tasks/{uuids[0]}')
+    assert response.headers['ETag'] == task_etag(UUID(uuids[0]), 2)
+    response = await async_client.post('/tasks/claim', params={'n': 5})
+    assert [task['uuid'] for task in response.json()] == uuids[2:]
+    response = await async_client.post('/tasks/claim')
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == []
+    stats = (await async_client.get('/tasks/stats')).json()
+    assert stats['by_status']['in_progress'] == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_claims_do_not_overlap(async_client):
+    """
+    Test concurrent POST /tasks/claim calls claim every task once.
+    """
+    await async_client.post('/tasks/bulk', json=[CREATE_DATA] * 20)
+    responses = await asyncio.gather(
+        *(
+            async_client.post('/tasks/claim', params={'n': 3})
+            for _ in range(10)
+        )
+    )
+    assert all(
+        response.status_code == HTTPStatus.OK for response in responses
+    )
+    claimed = [
+        task['uuid'] for response in responses for task in response.json()
+    ]
+    assert len(claimed) == 20
+    assert len(set(claimed)) == 20
@@ -0,0 +1,181 @@
+"""
+Tests for group commit of task writes.
+
+Includes tests for:
+- Batching of concurrent creates and updates
+- Isolation of a failed write from the rest of its batch
+- Errors of a failed batch commit
+"""
+
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from data import CREATE_DATA
+from src.core.config import settings
+from src.core.metrics import MetricsRegistry
+from src.crud.task import task_crud
+from src.database.coalescer import WriteCoalescer
+from src.database.db import AsyncSessionLocal
+from src.schemas.task import TaskCreate
+
+
+def batch_sizes(registry: MetricsRegistry) -> tuple[int, float]:
+    """Return the number of batches and of writes in them."""
+    return (
+        registry.samples[('db_write_batch_size_count', ())],
+        registry.samples[('db_write_batch_size_sum', ())],
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_are_coalesced(async_client):
+    """
+    Test concurrent POST and PATCH requests are committed in batches.
+    """
+    registry = MetricsRegistry()
+    coalescer = WriteCoalescer(
+        AsyncSessionLocal, window=0.05, max_batch_size=4, registry=registry
+    )
+    with patch.object(task_crud, 'coalescer', coalescer):
+        responses = await asyncio.gather(
+            *(
+                async_client.post(
+                    '/tasks', json={**CREATE_DATA, 'title': f'Task {number}'}
+                )
+                for number in range(10)
+            )
+        )
+        assert {response.status_code for response in responses} == {
+            HTTPStatus.CREATED
+        }
+        uuids = {response.json()['uuid'] for response in responses}
+        assert len(uuids) == 10
+        assert batch_sizes(registry) == (3, 10)
+        responses = await asyncio.gather(
+            *(
+                async_client.patch(
+                    f'/tasks/{uuid}', json={'status': 'in_progress'}
+                )
+                for uuid in uuids
+            )
+        )
+        assert {response.json()['status'] for response in responses} == {
+            'in_progress'
+        }
+        assert batch_sizes(registry) == (6, 20)
+    response = await async_client.get('/tasks', params={'limit': 100})
+    assert {task['uuid'] for task in response.json()} == uuids
+
+
+@pytest.mark.asyncio
+async def test_failed_write_does_not_abort_batch(session):
+    """
+    Test a failing write gets its own error and the others commit.
+    """
+    coalescer = WriteCoalescer(
+        AsyncSessionLocal,
+        window=0.05,
+        max_batch_size=10,
+        registry=MetricsRegistry(),
+    )
+
+    async def fail(batch_session):
+        await task_crud.create(
+            TaskCreate(**CREATE_DATA), batch_session, commit_on=False
+        )
+        raise HTTPException(status_code=HTTPStatus.BAD_REQUEST)
+
+    created, failed = await asyncio.gather(
+        coalescer.submit(
+            lambda batch_session: task_crud.create(
+                TaskCreate(**CREATE_DATA), batch_session, commit_on=False
+            )
+        ),
+        coalescer.submit(fail),
+        return_exceptions=True,
+    )
+    assert isinstance(failed, HTTPException)
+    tasks = await task_crud.get_all(session)
+    assert [task.uuid for task in tasks] == [created.uuid]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_invisible_until_commit(session):
+    """
+    Test writes of a batch stay invisible to other connections until
+    the batch commits.
+    """
+    coalescer = WriteCoalescer(
+        AsyncSessionLocal,
+        window=0.05,
+        max_batch_size=10,
+        registry=MetricsRegistry(),
+    )
+    visible = []
+
+    async def count_committed(batch_session):
+        with sqlite3.connect(make_url(settings.get_db_url).database) as db:
+            visible.append(
+                db.execute('SELECT count(*) FROM task').fetchone()[0]
+            )
+
+    def create(batch_session):
+        return task_crud.create(
+            TaskCreate(**CREATE_DATA), batch_session, commit_on=False
+        )
+
+    await asyncio.gather(
+        coalescer.submit(create),
+        coalescer.submit(count_committed),
+        coalescer.submit(create),
+        coalescer.submit(count_committed),
+    )
+    assert visible == [0, 0]
+    assert len(await task_crud.get_all(session)) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_commit_is_http_error(async_client):
+    """
+    Test a failed batch commit reaches callers as the HTTP error of
+    a write committed on its own.
+    """
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    task_uuid = resp.json()['uuid']
+    commit_errors = [
+        IntegrityError('COMMIT', {}, Exception('constraint failed')),
+        OperationalError('COMMIT', {}, Exception('disk I/O error')),
+    ]
+
+    @asynccontextmanager
+    async def failing_session():
+        async with AsyncSessionLocal() as session:
+            with patch.object(
+                session, 'commit', side_effect=commit_errors.pop(0)
+            ):
+                yield session
+
+    coalescer = WriteCoalescer(
+        failing_session,
+        window=0.01,
+        max_batch_size=10,
+        registry=MetricsRegistry(),
+    )
+    with patch.object(task_crud, 'coalescer', coalescer):
+        response = await async_client.patch(
+            f'/tasks/{task_uuid}', json={'title': 'Updated Task'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'Update data error' in response.json()['detail']
+        response = await async_client.delete(f'/tasks/{task_uuid}')
+        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    response = await async_client.get(f'/tasks/{task_uuid}')
+    assert response.json()['title'] == CREATE_DATA['title']
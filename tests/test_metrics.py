@@ -0,0 +1,139 @@
+"""
+Tests for the Prometheus metrics endpoint.
+
+Includes tests for:
+- Request, latency and DB statement metrics by route template
+- Merging of metrics written by other worker processes
+- Server-Timing header and N+1 warnings of query accounting
+"""
+
+import json
+import logging
+import os
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from httpx._transports.asgi import ASGITransport
+
+from data import CREATE_DATA
+from src.core.metrics import MetricsMiddleware, MetricsRegistry, render
+from src.crud.task import task_crud
+from src.database.db import AsyncSessionLocal
+
+DEAD_PID = 2 ** 22 + 1
+
+
+def parse_samples(text: str) -> dict[str, float]:
+    """Parse exposition text into sample values by sample line key."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            key, value = line.rsplit(' ', 1)
+            samples[key] = float(value)
+    return samples
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_by_route_template(async_client):
+    """
+    Test GET /metrics reports requests labelled by route template.
+    """
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    task_uuid = resp.json()['uuid']
+    before = parse_samples((await async_client.get('/metrics')).text)
+    await async_client.get(f'/tasks/{task_uuid}')
+    await async_client.get('/tasks/not-a-uuid')
+    response = await async_client.get('/metrics')
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('text/plain')
+    samples = parse_samples(response.text)
+    labels = 'method="GET",route="/tasks/{task_uuid}"'
+    for code, delta in (('200', 1), ('422', 1)):
+        key = f'http_requests_total{{{labels},status="{code}"}}'
+        assert samples[key] - before.get(key, 0) == delta
+    key = f'http_request_duration_seconds_count{{{labels}}}'
+    assert samples[key] - before.get(key, 0) == 2
+    key = f'http_request_db_statements_sum{{{labels}}}'
+    assert samples[key] - before.get(key, 0) >= 1
+    assert samples[f'http_requests_in_flight{{{labels}}}'] == 0
+    assert samples[
+        'http_requests_in_flight{method="GET",route="/metrics"}'
+    ] == 1
+
+
+def test_metrics_merge_worker_snapshots(tmp_path):
+    """
+    Test counters of all workers are summed and gauges of dead ones
+    are dropped.
+    """
+    labels = (('method', 'GET'), ('route', '/tasks'))
+    registry = MetricsRegistry()
+    registry.inc('http_requests_total', (*labels, ('status', '200')))
+    registry.inc('http_requests_in_flight', labels)
+    registry.observe('http_request_duration_seconds', labels, 0.2, (0.1, 1))
+    with open(tmp_path / f'metrics_{DEAD_PID}.json', 'w') as file:
+        json.dump(
+            [
+                ['http_requests_total', [*labels, ('status', '200')], 2],
+                ['http_requests_in_flight', labels, 3],
+            ],
+            file,
+        )
+    registry.flush(str(tmp_path))
+    assert os.path.exists(registry.snapshot_path(str(tmp_path), os.getpid()))
+    samples = parse_samples(render(registry.collect(str(tmp_path))))
+    assert samples[
+        'http_requests_total{method="GET",route="/tasks",status="200"}'
+    ] == 3
+    assert samples[
+        'http_requests_in_flight{method="GET",route="/tasks"}'
+    ] == 1
+    assert samples[
+        'http_request_duration_seconds_bucket'
+        '{method="GET",route="/tasks",le="0.1"}'
+    ] == 0
+    assert samples[
+        'http_request_duration_seconds_bucket'
+        '{method="GET",route="/tasks",le="+Inf"}'
+    ] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_accounting_reports_repeated_statements(caplog):
+    """
+    Test query accounting adds Server-Timing and warns about a statement
+    repeated more times than the threshold.
+    """
+    app = FastAPI()
+
+    @app.get('/tasks/{task_uuid}')
+    async def get_task_three_times(task_uuid: str):
+        async with AsyncSessionLocal() as session:
+            for _ in range(3):
+                await task_crud.get(uuid4(), session)
+        return {}
+
+    instrumented = MetricsMiddleware(
+        app,
+        routes=app.routes,
+        registry=MetricsRegistry(),
+        query_accounting=True,
+        repeat_threshold=2,
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=instrumented),
+        base_url='http://testserver',
+    ) as client:
+        with caplog.at_level(logging.WARNING, logger='src.core.metrics'):
+            response = await client.get('/tasks/1')
+    assert response.status_code == HTTPStatus.OK
+    timing = response.headers['server-timing']
+    assert 'db;dur=' in timing
+    assert 'desc="3 statements"' in timing
+    assert 'serialize;dur=' in timing
+    assert 'GET /tasks/{task_uuid} ran the same statement 3 times' in (
+        caplog.text
+    )
@@ -0,0 +1,52 @@
+"""
+Tests for service telemetry endpoints.
+
+Includes tests for:
+- Connection pool statistics
+"""
+
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.config import settings
+from src.database.pool import InstrumentedAsyncQueuePool
+
+
+@pytest.mark.asyncio
+async def test_get_pool_stats(async_client):
+    """
+    Test GET /monitoring/pool reports checkouts of served requests.
+    """
+    await async_client.get('/tasks')
+    response = await async_client.get('/monitoring/pool')
+    assert response.status_code == HTTPStatus.OK
+    stats = response.json()
+    assert stats['checkouts'] >= 1
+    assert stats['wait_time_histogram']['+Inf'] == (
+        stats['checkouts'] + stats['timeouts']
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_checkout_timeout_is_counted():
+    """
+    Test InstrumentedAsyncQueuePool counts checkouts failed by timeout.
+    """
+    engine = create_async_engine(
+        settings.get_db_url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    async with engine.connect():
+        with pytest.raises(TimeoutError):
+            async with engine.connect():
+                pass
+        assert engine.pool.snapshot()['checked_out'] == 1
+    await engine.dispose()
+    assert engine.pool.telemetry.timeouts == 1
+    assert engine.pool.telemetry.checkouts == 1
@@ -0,0 +1,116 @@
+"""
+Tests for read/write session routing.
+
+Includes tests for:
+- Round-robin over healthy replicas
+- Fallback to the primary after writes and for broken replicas
+- Read-your-writes cookie of write requests
+- Timeout of replica health checks
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from data import CREATE_DATA
+from src.core.config import settings
+from src.database import db
+from src.database.routing import LAST_WRITE_COOKIE, ReplicaRouter
+
+
+@pytest.mark.asyncio
+async def test_replica_router_round_robin():
+    """
+    Test ReplicaRouter alternates between healthy replicas.
+    """
+    router = ReplicaRouter([settings.get_db_url] * 2)
+    chosen = [await router.choose() for _ in range(4)]
+    assert chosen[0] is chosen[2] is router.replicas[0]
+    assert chosen[1] is chosen[3] is router.replicas[1]
+    assert router.replicas[0].lag == 0
+    await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_replica_router_read_your_writes():
+    """
+    Test reads go to the primary right after a write of the client.
+    """
+    router = ReplicaRouter(
+        [settings.get_db_url], read_your_writes_window=60
+    )
+    assert await router.choose() is router.replicas[0]
+    assert await router.choose(time.time() - 120) is router.replicas[0]
+    assert await router.choose(time.time()) is None
+    await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_cookie(async_client):
+    """
+    Test writes set the last write cookie and only reads of the writing
+    client are routed with it.
+    """
+    response = await async_client.get('/tasks')
+    assert LAST_WRITE_COOKIE not in response.cookies
+    before = time.time()
+    response = await async_client.post('/tasks', json=CREATE_DATA)
+    last_write_at = float(response.cookies[LAST_WRITE_COOKIE])
+    assert before <= last_write_at <= time.time()
+    uuid = response.json()['uuid']
+    router = db.replica_router
+    with patch.object(
+        router, 'wrote_recently', wraps=router.wrote_recently
+    ) as wrote_recently, patch.object(
+        router, 'choose', wraps=router.choose
+    ) as choose:
+        await async_client.get(f'/tasks/{uuid}')
+        async_client.cookies.clear()
+        await async_client.get(f'/tasks/{uuid}')
+        await async_client.get(
+            f'/tasks/{uuid}', headers={'Cookie': f'{LAST_WRITE_COOKIE}=x'}
+        )
+    assert [call.args for call in wrote_recently.call_args_list] == [
+        (last_write_at,), (None,), (None,)
+    ]
+    assert choose.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_replica_router_skips_broken_replica():
+    """
+    Test a replica failing the health check is not used.
+    """
+    router = ReplicaRouter([
+        'sqlite+aiosqlite:////not/existing/dir/replica.db',
+        settings.get_db_url,
+    ])
+    assert await router.choose() is router.replicas[1]
+    assert not router.replicas[0].healthy
+    assert await router.choose() is router.replicas[1]
+    await router.dispose()
+
+
+@pytest.mark.asyncio
+async def test_replica_router_times_out_slow_replica():
+    """
+    Test a replica whose health check does not finish in time is not
+    used.
+    """
+    router = ReplicaRouter(
+        [settings.get_db_url] * 2, health_check_timeout=0.05
+    )
+
+    async def measure_lag(replica):
+        if replica is router.replicas[0]:
+            await asyncio.sleep(10)
+        return 0.0
+
+    with patch.object(router, '_measure_lag', side_effect=measure_lag):
+        chosen = await asyncio.wait_for(router.choose(), timeout=1)
+    assert chosen is router.replicas[1]
+    assert not router.replicas[0].healthy
+    assert router.replicas[0].lag is None
+    await router.dispose()
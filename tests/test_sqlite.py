@@ -0,0 +1,115 @@
+"""
+Tests for the SQLite performance profile.
+
+Includes tests for:
+- Pragmas applied to new connections
+- Serialization of write sessions
+- Turns of the single writer taken per write transaction
+- Statements outside of a transaction on AUTOCOMMIT connections
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select, text, update
+
+from data import CREATE_DATA
+from src.core.config import settings
+from src.database.db import AsyncSessionLocal, engine, write_session
+from src.database.sqlite import WRITER_TURN
+from src.models.task import Task
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_are_applied():
+    """
+    Test connections of the engine use the configured pragmas.
+    """
+    async with engine.connect() as connection:
+        values = {
+            name: (
+                await connection.execute(text(f'PRAGMA {name}'))
+            ).scalar()
+            for name in ('journal_mode', 'synchronous', 'busy_timeout')
+        }
+    assert values == {
+        'journal_mode': settings.sqlite_journal_mode.lower(),
+        'synchronous': 1,
+        'busy_timeout': settings.sqlite_busy_timeout,
+    }
+
+
+@pytest.mark.asyncio
+async def test_single_writer_runs_writers_in_turn(async_client):
+    """
+    Test concurrent write sessions of the primary run their transactions
+    one at a time and a rolled back transaction gives its turn back.
+    """
+    await async_client.post('/tasks', json=CREATE_DATA)
+    events = []
+
+    async def write(number: int) -> None:
+        async with write_session() as session:
+            await session.execute(
+                update(Task).values(title=f'Writer {number}')
+            )
+            events.append(('start', number))
+            await asyncio.sleep(0.01)
+            events.append(('end', number))
+            if number == 0:
+                lock = session.info[WRITER_TURN]
+                assert lock.locked()
+                await session.rollback()
+                assert not lock.locked()
+            else:
+                await session.commit()
+
+    await asyncio.wait_for(
+        asyncio.gather(*(write(number) for number in range(2))), timeout=5
+    )
+    first, second = events[0][1], events[2][1]
+    assert {first, second} == {0, 1}
+    assert events == [
+        ('start', first), ('end', first), ('start', second), ('end', second)
+    ]
+    async with AsyncSessionLocal() as session:
+        assert (await session.execute(select(Task.title))).scalar() == (
+            'Writer 1'
+        )
+
+
+@pytest.mark.asyncio
+async def test_write_session_takes_turn_per_transaction():
+    """
+    Test a write session holds the turn of the single writer during
+    each of its transactions only, and reads never wait for it.
+    """
+    async with write_session() as session:
+        assert WRITER_TURN not in session.info
+        await session.execute(text('SELECT 1'))
+        lock = session.info[WRITER_TURN]
+        assert lock.locked()
+        async with AsyncSessionLocal() as read_session:
+            await asyncio.wait_for(
+                read_session.execute(text('SELECT 1')), timeout=1
+            )
+            assert WRITER_TURN not in read_session.info
+        await session.commit()
+        assert not lock.locked()
+        await session.execute(text('SELECT 1'))
+        assert session.info[WRITER_TURN] is lock
+        assert lock.locked()
+    assert not lock.locked()
+
+
+@pytest.mark.asyncio
+async def test_autocommit_connection_runs_vacuum():
+    """
+    Test AUTOCOMMIT connections are not put in a transaction, so that
+    VACUUM can run on them.
+    """
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(
+            isolation_level='AUTOCOMMIT'
+        )
+        await connection.execute(text('VACUUM'))
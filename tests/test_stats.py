@@ -0,0 +1,97 @@
+"""
+Tests for per-status task counters.
+
+Includes tests for:
+- GET /tasks/stats after create, update and delete
+- Reconciliation of drifted counters
+- Counting archived tasks
+"""
+
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import delete, update
+
+from data import CREATE_DATA
+from src.core.config import settings
+from src.core.jobs import archive_completed_tasks
+from src.crud.task_status_counter import task_status_counter_crud
+from src.database.enums import StatusEnum
+from src.models.task_status_counter import TaskStatusCounter
+
+
+@pytest.mark.asyncio
+async def test_get_task_stats(async_client):
+    """
+    Test GET /tasks/stats follows every kind of task write.
+    """
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    task_uuid = resp.json()['uuid']
+    await async_client.post('/tasks/bulk', json=[
+        CREATE_DATA, {**CREATE_DATA, 'status': 'completed'},
+    ])
+    await async_client.patch(
+        f'/tasks/{task_uuid}', json={'status': 'in_progress'}
+    )
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    await async_client.delete(f'/tasks/{resp.json()["uuid"]}')
+    response = await async_client.get('/tasks/stats')
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'total': 3,
+        'by_status': {'created': 1, 'in_progress': 1, 'completed': 1},
+        'approximate': False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_reconcile_task_stats(async_client, session):
+    """
+    Test reconciliation corrects drifted and missing counters.
+    """
+    for _ in range(2):
+        await async_client.post('/tasks', json=CREATE_DATA)
+    await async_client.post(
+        '/tasks', json={**CREATE_DATA, 'status': 'completed'}
+    )
+    await session.execute(update(TaskStatusCounter).values(count=10))
+    await session.execute(
+        delete(TaskStatusCounter).where(
+            TaskStatusCounter.status == StatusEnum.COMPLETED
+        )
+    )
+    await session.commit()
+    await task_status_counter_crud.reconcile(session)
+    response = await async_client.get(
+        '/tasks/stats', params={'approximate': True}
+    )
+    assert response.json()['by_status'] == {
+        'created': 2, 'in_progress': 0, 'completed': 1,
+    }
+    assert response.json()['total'] == 3
+
+
+@pytest.mark.asyncio
+async def test_task_stats_count_archived_tasks(async_client, session):
+    """
+    Test archived tasks stay counted until they are deleted.
+    """
+    response = await async_client.post('/tasks/bulk', json=[
+        CREATE_DATA, *[{**CREATE_DATA, 'status': 'completed'}] * 2,
+    ])
+    archived = response.json()['created'][1]['uuid']
+    with patch.object(settings, 'archive_after', -60):
+        await archive_completed_tasks()
+    expected = {
+        'total': 3,
+        'by_status': {'created': 1, 'in_progress': 0, 'completed': 2},
+        'approximate': False,
+    }
+    assert (await async_client.get('/tasks/stats')).json() == expected
+    await task_status_counter_crud.reconcile(session)
+    assert (await async_client.get('/tasks/stats')).json() == expected
+    await async_client.delete(f'/tasks/{archived}')
+    response = await async_client.get('/tasks/stats')
+    assert response.json()['by_status']['completed'] == 1
+    assert response.json()['total'] == 2
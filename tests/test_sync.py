@@ -0,0 +1,153 @@
+"""
+Tests for delta sync of tasks.
+
+Includes tests for:
+- Changed and deleted tasks since a sync token
+- Paging through changes with `has_more`
+- Expired and malformed sync tokens
+- Purging of expired tombstones
+"""
+
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from data import CREATE_DATA
+from src.api.pagination import decode_sync_token, encode_sync_token
+from src.core.config import settings
+from src.crud.task import task_crud
+from src.models.base import utc_now
+from src.models.task_tombstone import TaskTombstone
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window():
+    """Return changes right after they are written."""
+    with patch.object(settings, 'sync_settle_window', 0):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_since_token(async_client):
+    """
+    Test GET /tasks/changes returns only changes after the token.
+    """
+    uuids = []
+    for _ in range(3):
+        resp = await async_client.post('/tasks', json=CREATE_DATA)
+        uuids.append(resp.json()['uuid'])
+    response = await async_client.get('/tasks/changes')
+    assert response.status_code == HTTPStatus.OK
+    changes = response.json()
+    assert {task['uuid'] for task in changes['changed']} == set(uuids)
+    assert changes['deleted'] == []
+    assert changes['has_more'] is False
+    await async_client.patch(
+        f'/tasks/{uuids[0]}', json={'title': 'Updated Task'}
+    )
+    await async_client.delete(f'/tasks/{uuids[1]}')
+    response = await async_client.get(
+        '/tasks/changes', params={'since': changes['next_token']}
+    )
+    changes = response.json()
+    assert [task['title'] for task in changes['changed']] == [
+        'Updated Task'
+    ]
+    assert changes['deleted'] == [uuids[1]]
+    response = await async_client.get(
+        '/tasks/changes', params={'since': changes['next_token']}
+    )
+    assert response.json()['changed'] == []
+    assert response.json()['deleted'] == []
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_pages(async_client):
+    """
+    Test changes are paged with `has_more` and `next_token`.
+    """
+    for _ in range(3):
+        await async_client.post('/tasks', json=CREATE_DATA)
+    first = (
+        await async_client.get('/tasks/changes', params={'limit': 2})
+    ).json()
+    assert len(first['changed']) == 2
+    assert first['has_more'] is True
+    second = (
+        await async_client.get(
+            '/tasks/changes',
+            params={'limit': 2, 'since': first['next_token']},
+        )
+    ).json()
+    assert len(second['changed']) == 1
+    assert second['has_more'] is False
+    assert not {task['uuid'] for task in first['changed']} & {
+        task['uuid'] for task in second['changed']
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_invalid_token(async_client):
+    """
+    Test expired tokens return 410 and malformed tokens 400.
+    """
+    expired = encode_sync_token(
+        (
+            utc_now() - timedelta(
+                seconds=settings.sync_tombstone_retention + 60
+            ),
+            uuid4(),
+        )
+    )
+    response = await async_client.get(
+        '/tasks/changes', params={'since': expired}
+    )
+    assert response.status_code == HTTPStatus.GONE
+    response = await async_client.get(
+        '/tasks/changes', params={'since': 'not-a-token'}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_task_changes_token_after_settle_window(async_client):
+    """
+    Test tokens from the future return 400 and tokens within the settle
+    window are moved back to its start.
+    """
+    future = encode_sync_token((utc_now() + timedelta(hours=1), uuid4()))
+    response = await async_client.get(
+        '/tasks/changes', params={'since': future}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    settling = utc_now() - timedelta(seconds=30)
+    with patch.object(settings, 'sync_settle_window', 60):
+        response = await async_client.get(
+            '/tasks/changes',
+            params={'since': encode_sync_token((settling, uuid4()))},
+        )
+    assert response.status_code == HTTPStatus.OK
+    timestamp, _ = decode_sync_token(response.json()['next_token'])
+    assert timestamp < settling
+
+
+@pytest.mark.asyncio
+async def test_purge_tombstones(async_client, session):
+    """
+    Test only tombstones older than the cutoff are purged.
+    """
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    await async_client.delete(f'/tasks/{resp.json()["uuid"]}')
+    assert await task_crud.purge_tombstones(
+        session, utc_now() - timedelta(hours=1)
+    ) == 0
+    assert await task_crud.purge_tombstones(
+        session, utc_now() + timedelta(hours=1)
+    ) == 1
+    assert await session.scalar(
+        select(func.count()).select_from(TaskTombstone)
+    ) == 0
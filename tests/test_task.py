@@ -7,27 +7,33 @@ Includes tests for:
 - Exception handling (IntegrityError, SQLAlchemyError)
 """
 
+import base64
+import json
 from uuid import UUID, uuid4
 from http import HTTPStatus
 
 import pytest
 from unittest.mock import patch
 from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from data import CREATE_DATA
 from src.api.validators import (
     check_task_exists_by_uuid,
     completed_task_can_not_be_update,
 )
 from src.models.task import StatusEnum, Task
-from src.crud.task import TaskCRUD
-from src.schemas.task import TaskCreate
+from src.crud.task import TaskCRUD, task_crud
+from src.database.db import engine
+from src.schemas.task import TaskCreate, TaskRead
 
-CREATE_DATA = {
-    'title': 'Test Task',
-    'description': 'Desc',
-    'status': 'created'
-}
+
+def encode_token(payload: list) -> str:
+    """Encode a payload like a cursor of the API."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
 
 
 @pytest.mark.asyncio
@@ -60,6 +66,244 @@ async def test_get_all_task(async_client):
     assert len(response.json()) == 3
 
 
+@pytest.mark.asyncio
+async def test_get_all_task_fast_serialization(async_client, session):
+    """
+    Test GET /tasks fast-path output is byte-compatible with
+    `list[TaskRead]` response model serialization.
+    """
+    await async_client.post('/tasks', json=CREATE_DATA)
+    await async_client.post(
+        '/tasks', json={'title': 'Задача "№2"', 'status': 'in_progress'}
+    )
+    response = await async_client.get('/tasks')
+    adapter = TypeAdapter(list[TaskRead])
+    expected = JSONResponse(
+        adapter.dump_python(
+            adapter.validate_python(await TaskCRUD(Task).get_all(session)),
+            mode='json',
+            exclude_none=True,
+        )
+    ).body
+    assert response.content == expected
+
+
+@pytest.mark.asyncio
+async def test_get_all_task_pagination(async_client):
+    """
+    Test GET /tasks keyset pagination.
+
+    Walks through 5 tasks with pages of 2 and checks that every task
+    is returned exactly once in the requested order.
+    """
+    for number in range(5):
+        await async_client.post(
+            '/tasks', json={**CREATE_DATA, 'title': f'Task {number}'}
+        )
+    titles = []
+    params = {'limit': 2, 'order_by': '-title'}
+    while True:
+        response = await async_client.get('/tasks', params=params)
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()) <= 2
+        titles.extend(task['title'] for task in response.json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+        params['cursor'] = cursor
+    assert titles == [f'Task {number}' for number in range(4, -1, -1)]
+
+
+@pytest.mark.asyncio
+async def test_get_all_task_invalid_cursor(async_client):
+    """
+    Test GET /tasks with a malformed cursor, cursors with a sort key
+    of the wrong type and a cursor issued for another ordering.
+
+    Expects 400 BAD_REQUEST error for all.
+    """
+    for _ in range(2):
+        await async_client.post('/tasks', json=CREATE_DATA)
+    response = await async_client.get('/tasks', params={'cursor': 'broken'})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    uuid = str(uuid4())
+    for order_by, sort_key in (
+        ('title', ['x']),
+        ('title', 1),
+        ('-title', None),
+        ('status', 'unknown'),
+        ('status', {'status': 'created'}),
+    ):
+        response = await async_client.get(
+            '/tasks',
+            params={
+                'cursor': encode_token([order_by, sort_key, uuid]),
+                'order_by': order_by,
+            },
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+    response = await async_client.get('/tasks', params={'limit': 1})
+    response = await async_client.get(
+        '/tasks',
+        params={
+            'cursor': response.headers['X-Next-Cursor'],
+            'order_by': 'title',
+        },
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_all_task_filters(async_client):
+    """
+    Test GET /tasks filters by status and title prefix.
+    """
+    for title, task_status in (
+        ('Alpha', 'created'),
+        ('Alpine', 'completed'),
+        ('Beta', 'in_progress'),
+        ('Al_pha', 'created'),
+    ):
+        await async_client.post(
+            '/tasks',
+            json={**CREATE_DATA, 'title': title, 'status': task_status},
+        )
+    response = await async_client.get(
+        '/tasks',
+        params={'status': ['created', 'in_progress'], 'order_by': 'title'},
+    )
+    assert [task['title'] for task in response.json()] == [
+        'Al_pha', 'Alpha', 'Beta'
+    ]
+    response = await async_client.get(
+        '/tasks', params={'title_prefix': 'Al_', 'order_by': 'title'}
+    )
+    assert [task['title'] for task in response.json()] == ['Al_pha']
+
+
+@pytest.mark.asyncio
+async def test_get_task_sparse_fields(async_client):
+    """
+    Test `fields` query parameter of GET /tasks and GET /tasks/{uuid}.
+
+    Checks:
+    - Only requested fields are returned
+    - Pagination works when the sort key is not requested
+    - Unknown fields are rejected with 400 BAD_REQUEST
+    """
+    for number in range(3):
+        resp = await async_client.post(
+            '/tasks', json={**CREATE_DATA, 'title': f'Task {number}'}
+        )
+    task_uuid = resp.json()['uuid']
+    response = await async_client.get(
+        '/tasks',
+        params={'fields': 'uuid,title', 'order_by': 'status', 'limit': 2},
+    )
+    assert all(task.keys() == {'uuid', 'title'} for task in response.json())
+    response = await async_client.get(
+        '/tasks',
+        params={
+            'fields': 'title',
+            'order_by': 'status',
+            'cursor': response.headers['X-Next-Cursor'],
+        },
+    )
+    assert len(response.json()) == 1
+    response = await async_client.get(
+        f'/tasks/{task_uuid}', params={'fields': 'status'}
+    )
+    assert response.json() == {'status': 'created'}
+    response = await async_client.get('/tasks', params={'fields': 'secret'})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_get_all_task_ndjson_stream(async_client):
+    """
+    Test GET /tasks streaming mode with `Accept: application/x-ndjson`.
+
+    Streams all tasks ignoring `limit`, one JSON object per line.
+    """
+    for number in range(3):
+        await async_client.post(
+            '/tasks', json={**CREATE_DATA, 'title': f'Task {number}'}
+        )
+    response = await async_client.get(
+        '/tasks',
+        params={'limit': 1, 'order_by': 'title'},
+        headers={'Accept': 'application/x-ndjson'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    tasks = [json.loads(line) for line in response.text.splitlines()]
+    assert [task['title'] for task in tasks] == [
+        'Task 0', 'Task 1', 'Task 2'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_tasks(async_client):
+    """
+    Test GET /tasks/search full-text search.
+
+    Checks:
+    - Only tasks with all query words are returned
+    - Updated and deleted tasks are reflected in the index
+    """
+    resp = await async_client.post(
+        '/tasks',
+        json={**CREATE_DATA, 'title': 'Fix login', 'description': 'bug'},
+    )
+    task_uuid = resp.json()['uuid']
+    await async_client.post(
+        '/tasks',
+        json={**CREATE_DATA, 'title': 'Login page', 'description': 'new'},
+    )
+    response = await async_client.get(
+        '/tasks/search', params={'q': 'login bug'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert [task['uuid'] for task in response.json()] == [task_uuid]
+    await async_client.patch(
+        f'/tasks/{task_uuid}', json={'description': 'crash'}
+    )
+    response = await async_client.get(
+        '/tasks/search', params={'q': 'login bug'}
+    )
+    assert response.json() == []
+    await async_client.delete(f'/tasks/{task_uuid}')
+    response = await async_client.get('/tasks/search', params={'q': 'login'})
+    assert [task['title'] for task in response.json()] == ['Login page']
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_after_rowid_change(async_client):
+    """
+    Test GET /tasks/search finds the same tasks after the implicit
+    SQLite rowids of the task table change, as VACUUM or a rebuild
+    of the table may do.
+    """
+    response = await async_client.post(
+        '/tasks/bulk',
+        json=[
+            {**CREATE_DATA, 'title': f'Task {number}'}
+            for number in range(5)
+        ],
+    )
+    uuids = [task['uuid'] for task in response.json()['created']]
+    await async_client.delete(
+        '/tasks', params={'uuid': uuids[:3]}
+    )
+    async with engine.begin() as connection:
+        await connection.execute(text('UPDATE task SET rowid = -rowid'))
+    for number, uuid in enumerate(uuids[3:], start=3):
+        response = await async_client.get(
+            '/tasks/search', params={'q': f'Task {number}'}
+        )
+        assert [task['uuid'] for task in response.json()] == [uuid]
+
+
 @pytest.mark.asyncio
 async def test_get_task(async_client):
     """
@@ -99,6 +343,31 @@ async def test_get_not_existen_task(async_client):
     assert response.status_code == HTTPStatus.BAD_REQUEST
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_tasks(async_client):
+    """
+    Test POST /tasks/bulk endpoint.
+
+    Checks:
+    - Valid items are created in request order
+    - Invalid items are reported by index without failing the request
+    """
+    items = [
+        {**CREATE_DATA, 'title': 'First'},
+        {**CREATE_DATA, 'status': 'HAPPY STATUS'},
+        {**CREATE_DATA, 'title': 'Second'},
+    ]
+    response = await async_client.post('/tasks/bulk', json=items)
+    assert response.status_code == HTTPStatus.CREATED
+    result = response.json()
+    assert [task['title'] for task in result['created']] == [
+        'First', 'Second'
+    ]
+    assert [error['index'] for error in result['errors']] == [1]
+    response = await async_client.get('/tasks')
+    assert len(response.json()) == 2
+
+
 @pytest.mark.asyncio
 async def test_patch_task(async_client):
     """
@@ -117,6 +386,114 @@ async def test_patch_task(async_client):
     assert response.json()['title'] == 'Updated Task'
 
 
+@pytest.mark.asyncio
+async def test_patch_completed_and_not_existen_task(async_client):
+    """
+    Test PATCH /tasks/{uuid} for completed and non-existing tasks.
+
+    Both are rejected with 400 BAD_REQUEST and a distinct message.
+    """
+    resp = await async_client.post(
+        '/tasks', json={**CREATE_DATA, 'status': 'completed'}
+    )
+    response = await async_client.patch(
+        f'/tasks/{resp.json()["uuid"]}',
+        json={'title': 'Updated Task'},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert 'already completed' in response.json()['detail']
+    response = await async_client.patch(
+        f'/tasks/{uuid4()}',
+        json={'title': 'Updated Task'},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert 'does not exist' in response.json()['detail']
+
+
+@pytest.mark.asyncio
+async def test_get_task_if_none_match(async_client):
+    """
+    Test GET /tasks/{uuid} and GET /tasks conditional requests.
+
+    Checks:
+    - Unchanged task and list return 304 NOT_MODIFIED
+    - ETag changes after the task is updated
+    """
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    task_uuid = resp.json()['uuid']
+    for url in (f'/tasks/{task_uuid}', '/tasks'):
+        response = await async_client.get(url)
+        etag = response.headers['ETag']
+        response = await async_client.get(
+            url, headers={'If-None-Match': etag}
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.headers['ETag'] == etag
+    await async_client.patch(
+        f'/tasks/{task_uuid}', json={'title': 'Updated Task'}
+    )
+    response = await async_client.get(
+        f'/tasks/{task_uuid}', headers={'If-None-Match': etag}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_all_tasks_if_none_match_reads_versions(async_client):
+    """
+    Test GET /tasks with a matching `If-None-Match` reads only task
+    versions, and full rows once the page has changed.
+    """
+    await async_client.post('/tasks', json=CREATE_DATA)
+    etag = (await async_client.get('/tasks')).headers['ETag']
+    with patch.object(
+        task_crud, 'get_all', wraps=task_crud.get_all
+    ) as get_all:
+        response = await async_client.get(
+            '/tasks', headers={'If-None-Match': etag}
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert [call.kwargs['columns'] for call in get_all.call_args_list] == [
+            ('uuid', 'version')
+        ]
+        get_all.reset_mock()
+        await async_client.post('/tasks', json=CREATE_DATA)
+        response = await async_client.get(
+            '/tasks', headers={'If-None-Match': etag}
+        )
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()) == 2
+    assert response.headers['ETag'] != etag
+    assert len(get_all.call_args_list) == 2
+    assert 'title' in get_all.call_args_list[1].kwargs['columns']
+
+
+@pytest.mark.asyncio
+async def test_patch_task_if_match(async_client):
+    """
+    Test PATCH /tasks/{uuid} with `If-Match` header.
+
+    A stale ETag is rejected with 412 PRECONDITION_FAILED.
+    """
+    resp = await async_client.post('/tasks', json=CREATE_DATA)
+    task_uuid = resp.json()['uuid']
+    etag = (await async_client.get(f'/tasks/{task_uuid}')).headers['ETag']
+    response = await async_client.patch(
+        f'/tasks/{task_uuid}',
+        json={'title': 'First'},
+        headers={'If-Match': etag},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] != etag
+    response = await async_client.patch(
+        f'/tasks/{task_uuid}',
+        json={'title': 'Second'},
+        headers={'If-Match': etag},
+    )
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+
+
 @pytest.mark.asyncio
 async def test_delete_task(async_client):
     """
@@ -132,6 +509,41 @@ async def test_delete_task(async_client):
     assert get_resp.status_code == HTTPStatus.BAD_REQUEST
 
 
+@pytest.mark.asyncio
+async def test_delete_not_existen_task(async_client):
+    """
+    Test DELETE /tasks/{uuid} for non-existing task.
+
+    Expects 400 BAD_REQUEST error.
+    """
+    response = await async_client.delete(f'/tasks/{uuid4()}')
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_tasks(async_client):
+    """
+    Test DELETE /tasks endpoint with many UUIDs.
+
+    Existing tasks are deleted, unknown UUIDs are reported as missing.
+    """
+    task_uuids = []
+    for _ in range(2):
+        resp = await async_client.post('/tasks', json=CREATE_DATA)
+        task_uuids.append(resp.json()['uuid'])
+    missing_uuid = str(uuid4())
+    response = await async_client.delete(
+        '/tasks', params={'uuid': [*task_uuids, missing_uuid]}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'deleted': task_uuids,
+        'missing': [missing_uuid],
+    }
+    response = await async_client.get('/tasks')
+    assert response.json() == []
+
+
 @pytest.mark.asyncio
 async def test_check_task_exists_by_uuid_raises(session):
     """
@@ -0,0 +1,36 @@
+"""
+Tests for generation of task UUIDs.
+
+Includes tests for:
+- Time-ordered UUID version 7
+- Selection of the UUID version
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.models.base import uuid7, uuid_factory
+from src.schemas.task import TaskRead
+
+
+def test_uuid7_is_time_ordered():
+    """
+    Test uuid7 values are valid version 7 UUIDs in generation order.
+    """
+    uuids = [uuid7() for _ in range(1000)]
+    assert uuids == sorted(uuids)
+    assert len(set(uuids)) == len(uuids)
+    assert all(uuid.version == 7 for uuid in uuids)
+    task = TaskRead(uuid=str(uuids[0]), title='Test Task')
+    assert task.uuid == uuids[0]
+
+
+def test_uuid_factory():
+    """
+    Test uuid_factory selects the generator by UUID version.
+    """
+    assert uuid_factory(4) is uuid4
+    assert uuid_factory(7) is uuid7
+    with pytest.raises(ValueError):
+        uuid_factory(1)